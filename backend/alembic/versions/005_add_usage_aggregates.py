@@ -0,0 +1,51 @@
+"""Add per-user work type / project usage aggregate tables
+
+Revision ID: 005
+Revises: 004_add_project_roles
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "005_add_usage_aggregates"
+down_revision = "004_add_project_roles"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Last-90-days usage per user, refreshed nightly by
+    # scripts/refresh_usage_aggregates.py (read by AI worklog personalization)
+    op.create_table(
+        "user_work_type_usage",
+        sa.Column(
+            "user_id", sa.String(36), sa.ForeignKey("users.id"), primary_key=True
+        ),
+        sa.Column(
+            "work_type_category_id",
+            sa.Integer,
+            sa.ForeignKey("work_type_categories.id"),
+            primary_key=True,
+        ),
+        sa.Column("total_hours_90d", sa.Float, nullable=False),
+        sa.Column("updated_at", sa.DateTime, server_default=sa.func.now()),
+    )
+    op.create_table(
+        "user_project_usage",
+        sa.Column(
+            "user_id", sa.String(36), sa.ForeignKey("users.id"), primary_key=True
+        ),
+        sa.Column(
+            "project_id", sa.String(36), sa.ForeignKey("projects.id"), primary_key=True
+        ),
+        sa.Column("usage_count_90d", sa.Integer, nullable=False),
+        sa.Column("updated_at", sa.DateTime, server_default=sa.func.now()),
+    )
+
+
+def downgrade():
+    op.drop_table("user_project_usage")
+    op.drop_table("user_work_type_usage")
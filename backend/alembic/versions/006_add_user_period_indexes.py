@@ -0,0 +1,30 @@
+"""Add (user, period) composite indexes on worklogs and resource_plans
+
+Revision ID: 006
+Revises: 005_add_usage_aggregates
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "006_add_user_period_indexes"
+down_revision = "005_add_usage_aggregates"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Dashboards filter on a set of users plus a date range / month
+    op.create_index("ix_worklogs_user_id_date", "worklogs", ["user_id", "date"])
+    op.create_index(
+        "ix_resource_plans_user_year_month",
+        "resource_plans",
+        ["user_id", "year", "month"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_resource_plans_user_year_month", "resource_plans")
+    op.drop_index("ix_worklogs_user_id_date", "worklogs")
@@ -0,0 +1,87 @@
+"""Store users.role and user_history.change_type as SMALLINT codes
+
+Revision ID: 007
+Revises: 006_add_user_period_indexes
+Create Date: 2026-10-17
+"""
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "007_user_code_columns"
+down_revision = "006_add_user_period_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Codes of app.models.user.Role / ChangeType at the time of this revision
+ROLE_CODES = {"ADMIN": 1, "PM": 2, "FM": 3, "USER": 4}
+CHANGE_TYPE_CODES = {
+    "HIRE": 1,
+    "TRANSFER": 2,
+    "TRANSFER_IN": 3,
+    "TRANSFER_OUT": 4,
+    "PROMOTION": 5,
+    "RESIGN": 6,
+}
+
+# (table, column, codes, default name)
+CODE_COLUMNS = [
+    ("users", "role", ROLE_CODES, "USER"),
+    ("user_history", "change_type", CHANGE_TYPE_CODES, None),
+]
+
+
+def _is_integer_column(table: str, column: str) -> bool:
+    """True if the column is already integer typed (converted by hand earlier)"""
+    if context.is_offline_mode():
+        return False
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    column_type = next(c["type"] for c in columns if c["name"] == column)
+    return isinstance(column_type, sa.Integer)
+
+
+def _case(column: str, mapping: dict) -> str:
+    whens = " ".join(f"WHEN {k!r} THEN {v!r}" for k, v in mapping.items())
+    return f"CASE {column} {whens} END"
+
+
+def upgrade():
+    for table, column, codes, default in CODE_COLUMNS:
+        if _is_integer_column(table, column):
+            continue
+
+        # Unknown names would silently become NULL in the CASE below
+        op.execute(
+            f"DO $$ BEGIN IF EXISTS (SELECT 1 FROM {table} "
+            f"WHERE {column} IS NOT NULL AND {_case(column, codes)} IS NULL) "
+            f"THEN RAISE EXCEPTION 'unmapped {table}.{column} values'; "
+            f"END IF; END $$"
+        )
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=sa.SmallInteger(),
+            existing_type=sa.String(20),
+            postgresql_using=_case(column, codes),
+        )
+        if default is not None:
+            op.alter_column(
+                table, column, server_default=sa.text(str(codes[default]))
+            )
+
+
+def downgrade():
+    for table, column, codes, default in CODE_COLUMNS:
+        names = {code: name for name, code in codes.items()}
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(20),
+            existing_type=sa.SmallInteger(),
+            postgresql_using=_case(column, names),
+        )
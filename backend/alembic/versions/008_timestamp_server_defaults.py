@@ -0,0 +1,53 @@
+"""Server-side now() defaults for user and work type category timestamps
+
+Revision ID: 008
+Revises: 007_user_code_columns
+Create Date: 2026-10-17
+"""
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "008_timestamp_server_defaults"
+down_revision = "007_user_code_columns"
+branch_labels = None
+depends_on = None
+
+
+# The models fill these with server_default=func.now(). Tables created by
+# Base.metadata.create_all before that change have no column default.
+TIMESTAMP_COLUMNS = {
+    "users": ["created_at", "updated_at"],
+    "user_history": ["created_at"],
+    "work_type_categories": ["created_at", "updated_at"],
+}
+
+# Columns 001_initial_schema already created with DEFAULT now()
+INITIAL_SCHEMA_TABLES = {"users", "user_history"}
+
+
+def _existing_tables() -> set:
+    if context.is_offline_mode():
+        return set(TIMESTAMP_COLUMNS)
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade():
+    # work_type_categories is created by the app (create_all), not by 001
+    tables = _existing_tables()
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if table not in tables:
+            continue
+        for column in columns:
+            op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade():
+    tables = _existing_tables()
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if table in INITIAL_SCHEMA_TABLES or table not in tables:
+            continue
+        for column in columns:
+            op.alter_column(table, column, server_default=None)
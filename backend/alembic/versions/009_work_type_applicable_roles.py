@@ -0,0 +1,92 @@
+"""Normalize work_type_categories.applicable_roles into a join table
+
+Revision ID: 009
+Revises: 008_timestamp_server_defaults
+Create Date: 2026-10-17
+"""
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "009_work_type_applicable_roles"
+down_revision = "008_timestamp_server_defaults"
+branch_labels = None
+depends_on = None
+
+
+def _inspect_state():
+    """(tables, work_type_categories columns) of the live database"""
+    if context.is_offline_mode():
+        return {"work_type_categories"}, {"applicable_roles"}
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    columns = set()
+    if "work_type_categories" in tables:
+        columns = {c["name"] for c in inspector.get_columns("work_type_categories")}
+    return tables, columns
+
+
+def upgrade():
+    tables, columns = _inspect_state()
+    # work_type_categories is created by the app (create_all) with the join
+    # table already in place; nothing to migrate before that
+    if "work_type_categories" not in tables:
+        return
+
+    if "work_type_applicable_roles" not in tables:
+        op.create_table(
+            "work_type_applicable_roles",
+            sa.Column(
+                "category_id",
+                sa.Integer,
+                sa.ForeignKey("work_type_categories.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column("role", sa.String(50), primary_key=True),
+        )
+        # PK covers category -> roles; this covers role -> categories
+        op.create_index(
+            "ix_work_type_applicable_roles_role",
+            "work_type_applicable_roles",
+            ["role", "category_id"],
+        )
+
+    if "applicable_roles" in columns:
+        # One row per distinct, non-blank role in the comma-separated list
+        op.execute(
+            """
+            INSERT INTO work_type_applicable_roles (category_id, role)
+            SELECT DISTINCT c.id, btrim(r.role)
+            FROM work_type_categories c
+            CROSS JOIN LATERAL unnest(string_to_array(c.applicable_roles, ','))
+                AS r(role)
+            WHERE btrim(r.role) <> ''
+            ON CONFLICT DO NOTHING
+            """
+        )
+        op.drop_column("work_type_categories", "applicable_roles")
+
+
+def downgrade():
+    tables, _ = _inspect_state()
+    if "work_type_categories" not in tables:
+        return
+
+    op.add_column(
+        "work_type_categories",
+        sa.Column("applicable_roles", sa.String(500), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE work_type_categories c
+        SET applicable_roles = (
+            SELECT string_agg(r.role, ',' ORDER BY r.role)
+            FROM work_type_applicable_roles r
+            WHERE r.category_id = c.id
+        )
+        """
+    )
+    op.drop_index("ix_work_type_applicable_roles_role", "work_type_applicable_roles")
+    op.drop_table("work_type_applicable_roles")
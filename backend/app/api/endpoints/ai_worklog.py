@@ -11,6 +11,8 @@ from app.core.security import get_current_user
 from app.schemas.ai_worklog import (
     AIWorklogParseRequest,
     AIWorklogParseResponse,
+    AIWorklogBatchParseRequest,
+    AIWorklogBatchParseResponse,
     AIHealthResponse,
 )
 from app.services.ai_worklog_service import AIWorklogService
@@ -42,6 +44,30 @@ async def parse_worklog_with_ai(
         )
 
 
+@router.post("/ai-parse/batch", response_model=AIWorklogBatchParseResponse)
+async def parse_worklog_batch_with_ai(
+    request: AIWorklogBatchParseRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Parse several natural language inputs in one call (e.g. bulk imports).
+
+    The AI calls for the inputs run concurrently; results are returned in
+    request order.
+    """
+    service = AIWorklogService(db)
+
+    try:
+        results = await service.parse_worklog_batch(request.requests)
+        return AIWorklogBatchParseResponse(results=results)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"AI 파싱 중 오류 발생: {str(e)}",
+        )
+
+
 @router.get("/ai-health", response_model=AIHealthResponse)
 async def check_ai_health(
     db: Session = Depends(get_db),
@@ -11,6 +11,7 @@ from pydantic import BaseModel
 from app.core.database import get_db
 from app.models.organization import BusinessUnit, Department, SubTeam
 from app.models.user import User
+from app.services.lookup_cache import invalidate_org_structure
 
 router = APIRouter()
 
@@ -251,6 +252,7 @@ async def create_department(
     db.add(dept)
     db.commit()
     db.refresh(dept)
+    invalidate_org_structure()
     return dept
 
 
@@ -292,6 +294,7 @@ async def update_department(
 
     db.commit()
     db.refresh(dept)
+    invalidate_org_structure()
     return dept
 
 
@@ -415,6 +418,7 @@ async def create_sub_team(
     db.add(st)
     db.commit()
     db.refresh(st)
+    invalidate_org_structure()
     return st
 
 
@@ -440,6 +444,7 @@ async def update_sub_team(
 
     db.commit()
     db.refresh(st)
+    invalidate_org_structure()
     return st
 
 
@@ -10,6 +10,7 @@ from app.core.database import get_db
 from app.schemas.project import (
     Project,
     ProjectCreate,
+    ProjectListItem,
     ProjectUpdate,
     Milestone,
     MilestoneCreate,
@@ -138,7 +139,7 @@ async def delete_product_line(product_line_id: str, db: Session = Depends(get_db
 # ============ Project CRUD Endpoints ============
 
 
-@router.get("", response_model=List[Project])
+@router.get("", response_model=List[Project], response_model_exclude_none=True)
 async def list_projects(
     program_id: Optional[str] = Query(None),
     project_type_id: Optional[str] = Query(None),
@@ -150,6 +151,8 @@ async def list_projects(
 ):
     """
     List projects with optional filters
+
+    Null fields are omitted from each item to keep large lists small.
     """
     service = ProjectService(db)
     projects = service.get_multi(
@@ -163,6 +166,35 @@ async def list_projects(
     return projects
 
 
+@router.get(
+    "/flat", response_model=List[ProjectListItem], response_model_exclude_none=True
+)
+async def list_projects_flat(
+    program_id: Optional[str] = Query(None),
+    project_type_id: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    sort_by: Optional[str] = Query(None, description="Sort options: 'activity'"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    List projects with program/type/PM names as flat fields
+
+    Lighter than the default list: one JOIN query and no nested objects.
+    Use GET /projects/{project_id} for the nested detail view.
+    """
+    service = ProjectService(db)
+    return service.get_multi_flat(
+        skip=skip,
+        limit=limit,
+        program_id=program_id,
+        project_type_id=project_type_id,
+        status=status,
+        sort_by=sort_by,
+    )
+
+
 @router.post("", response_model=Project, status_code=status.HTTP_201_CREATED)
 async def create_project(project_create: ProjectCreate, db: Session = Depends(get_db)):
     """
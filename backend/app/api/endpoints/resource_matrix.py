@@ -4,11 +4,12 @@ API Endpoints for Resource Allocation Matrix
 
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.schemas.resource_matrix import ResourceAllocationMatrix
-from app.services.resource_matrix_service import get_resource_allocation_matrix
+from app.services.resource_matrix_service import stream_resource_allocation_matrix
 
 router = APIRouter(prefix="/resource-matrix", tags=["Resource Matrix"])
 
@@ -34,19 +35,21 @@ def get_allocation_matrix(
         program_id: Optional filter by program ID
 
     Returns:
-        ResourceAllocationMatrix with aggregated data
+        ResourceAllocationMatrix with aggregated data, streamed one program
+        group at a time
 
     Example:
         GET /api/resource-matrix/allocation?start_month=2026-01&end_month=2026-12
     """
     try:
-        return get_resource_allocation_matrix(
+        chunks = stream_resource_allocation_matrix(
             db=db,
             start_month=start_month,
             end_month=end_month,
             department_id=department_id,
             program_id=program_id,
         )
+        return StreamingResponse(chunks, media_type="application/json")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
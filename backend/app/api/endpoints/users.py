@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.schemas.user import User, UserCreate, UserUpdate
-from app.schemas.user_history import UserHistory
+from app.schemas.user_history import UserHistory, ChangeTypeCode
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -152,7 +152,7 @@ class UserHistoryCreate(BaseModel):
     position_id: str
     start_date: datetime
     end_date: Optional[datetime] = None
-    change_type: str  # HIRE, TRANSFER_IN, TRANSFER_OUT, PROMOTION, RESIGN
+    change_type: ChangeTypeCode
     remarks: Optional[str] = None
 
 
@@ -162,7 +162,7 @@ class UserHistoryUpdate(BaseModel):
     position_id: Optional[str] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
-    change_type: Optional[str] = None
+    change_type: Optional[ChangeTypeCode] = None
     remarks: Optional[str] = None
 
 
@@ -61,7 +61,7 @@ async def get_categories_by_role(
 ):
     """
     Get categories applicable to a specific job role
-    Returns categories where applicable_roles is null (universal) or contains the role
+    Returns categories with no role restriction (universal) or that list the role
     """
     service = WorkTypeCategoryService(db)
     return service.get_by_role(role, level)
@@ -7,6 +7,7 @@ from datetime import date
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.api.responses import json_response
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.schemas.worklog import (
@@ -16,6 +17,9 @@ from app.schemas.worklog import (
     DailySummary,
     CopyWeekRequest,
     WorkLogWithUser,
+    WORKLOG_LIST_ADAPTER,
+    WORKLOG_WITH_USER_LIST_ADAPTER,
+    DAILY_SUMMARY_ADAPTER,
 )
 from app.services.worklog_service import WorkLogService
 
@@ -47,39 +51,11 @@ async def list_worklogs(
         limit=limit,
     )
 
-    # Convert to response model with project info
-    result = []
-    for wl in worklogs:
-        worklog_dict = {
-            "id": wl.id,
-            "date": wl.date.date() if hasattr(wl.date, "date") else wl.date,
-            "user_id": wl.user_id,
-            "project_id": wl.project_id,
-            "product_line_id": wl.product_line_id,
-            "work_type_category_id": wl.work_type_category_id,
-            "hours": wl.hours,
-            "description": wl.description,
-            "is_sudden_work": wl.is_sudden_work,
-            "is_business_trip": wl.is_business_trip,
-            "created_at": wl.created_at,
-            "updated_at": wl.updated_at,
-            "project_code": wl.project.code if wl.project else None,
-            "project_name": wl.project.name if wl.project else None,
-            "project": wl.project,
-            "work_type_category": (
-                {
-                    "id": wl.work_type_category.id,
-                    "name": wl.work_type_category.name,
-                    "code": wl.work_type_category.code,
-                    "level": wl.work_type_category.level,
-                }
-                if wl.work_type_category
-                else None
-            ),
-        }
-        result.append(worklog_dict)
-
-    return result
+    # Validate ORM rows directly (project_code/name are read from wl.project)
+    return json_response(
+        WORKLOG_LIST_ADAPTER,
+        WORKLOG_LIST_ADAPTER.validate_python(worklogs, from_attributes=True),
+    )
 
 
 @router.get("/table", response_model=List[WorkLogWithUser])
@@ -117,37 +93,13 @@ async def list_worklogs_table(
         limit=limit,
     )
 
-    result = []
-    for wl in worklogs:
-        # Get department name via sub_team relationship
-        department_name = None
-        if wl.user and wl.user.sub_team and wl.user.sub_team.department:
-            department_name = wl.user.sub_team.department.name
-
-        worklog_dict = {
-            "id": wl.id,
-            "date": wl.date.date() if hasattr(wl.date, "date") else wl.date,
-            "user_id": wl.user_id,
-            "project_id": wl.project_id,
-            "product_line_id": wl.product_line_id,
-            "work_type_category_id": wl.work_type_category_id,
-            "hours": wl.hours,
-            "description": wl.description,
-            "is_sudden_work": wl.is_sudden_work,
-            "is_business_trip": wl.is_business_trip,
-            "created_at": wl.created_at,
-            "updated_at": wl.updated_at,
-            "project_code": wl.project.code if wl.project else None,
-            "project_name": wl.project.name if wl.project else None,
-            "user_name": wl.user.name if wl.user else None,
-            "user_korean_name": wl.user.korean_name if wl.user else None,
-            "department_name": department_name,
-            "project": wl.project,
-            "work_type_category": wl.work_type_category,
-        }
-        result.append(worklog_dict)
-
-    return result
+    # user/department names are read from wl.user.sub_team.department
+    return json_response(
+        WORKLOG_WITH_USER_LIST_ADAPTER,
+        WORKLOG_WITH_USER_LIST_ADAPTER.validate_python(
+            worklogs, from_attributes=True
+        ),
+    )
 
 
 @router.post("", response_model=WorkLog, status_code=status.HTTP_201_CREATED)
@@ -195,7 +147,9 @@ async def get_daily_summary(
     Returns total hours and breakdown by project
     """
     service = WorkLogService(db)
-    return service.get_daily_summary(user_id, target_date)
+    return json_response(
+        DAILY_SUMMARY_ADAPTER, service.get_daily_summary(user_id, target_date)
+    )
 
 
 @router.get("/{worklog_id}", response_model=WorkLog)
@@ -295,26 +249,7 @@ async def copy_last_week_worklogs(
     service = WorkLogService(db)
     new_worklogs = service.copy_week(request.user_id, request.target_week_start)
 
-    result = []
-    for wl in new_worklogs:
-        result.append(
-            {
-                "id": wl.id,
-                "date": wl.date.date() if hasattr(wl.date, "date") else wl.date,
-                "user_id": wl.user_id,
-                "project_id": wl.project_id,
-                "product_line_id": wl.product_line_id,
-                "work_type_category_id": wl.work_type_category_id,
-                "hours": wl.hours,
-                "description": wl.description,
-                "is_sudden_work": wl.is_sudden_work,
-                "is_business_trip": wl.is_business_trip,
-                "created_at": wl.created_at,
-                "updated_at": wl.updated_at,
-                "project_code": wl.project.code if wl.project else None,
-                "project_name": wl.project.name if wl.project else None,
-                "project": wl.project,
-            }
-        )
-
-    return result
+    return json_response(
+        WORKLOG_LIST_ADAPTER,
+        WORKLOG_LIST_ADAPTER.validate_python(new_worklogs, from_attributes=True),
+    )
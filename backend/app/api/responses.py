@@ -0,0 +1,19 @@
+"""
+Shared response helpers for API endpoints
+"""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response(adapter: TypeAdapter, value: Any) -> Response:
+    """
+    Serialize already-validated models with pydantic-core's JSON encoder.
+
+    Returning a Response skips FastAPI's second validation against
+    response_model and its Python-level jsonable_encoder walk; response_model
+    stays on the route for the OpenAPI schema.
+    """
+    return Response(content=adapter.dump_json(value), media_type="application/json")
@@ -27,6 +27,8 @@ class Settings(BaseSettings):
 
     # AI Provider: "groq" or "gemini"
     AI_PROVIDER: str = "groq"
+    # Max AI calls in flight for one batch parse (provider rate limits)
+    AI_MAX_CONCURRENT_REQUESTS: int = 4
 
     # Groq (AI) - Primary (very fast inference)
     GROQ_API_KEY: str = ""
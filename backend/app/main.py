@@ -106,6 +106,16 @@ async def startup_event():
     print("Database startup event complete.")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    from app.services.gemini_client import gemini_client
+    from app.services.groq_client import groq_client
+
+    # Release the pooled connections held by the LLM clients
+    await gemini_client.aclose()
+    await groq_client.aclose()
+
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/api/users", tags=["Users"])
@@ -18,11 +18,20 @@ from app.models.project import (
     ProjectMilestone,
     project_product_lines,  # Junction table for M:N
 )
-from app.models.resource import ResourcePlan, WorkLog
+from app.models.resource import (
+    ResourcePlan,
+    WorkLog,
+    UserWorkTypeUsage,
+    UserProjectUsage,
+)
 from app.models.common import CommonCode, Holiday
 from app.models.scenario import ProjectScenario, ScenarioMilestone, ScenarioResourcePlan
 from app.models.hiring_plan import HiringPlan
-from app.models.work_type import WorkTypeCategory, WorkTypeLegacyMapping
+from app.models.work_type import (
+    WorkTypeCategory,
+    WorkTypeApplicableRole,
+    WorkTypeLegacyMapping,
+)
 
 
 __all__ = [
@@ -49,6 +58,8 @@ __all__ = [
     # Resource
     "ResourcePlan",
     "WorkLog",
+    "UserWorkTypeUsage",
+    "UserProjectUsage",
     # Common
     "CommonCode",
     "Holiday",
@@ -56,5 +67,6 @@ __all__ = [
     "HiringPlan",
     # Work Type
     "WorkTypeCategory",
+    "WorkTypeApplicableRole",
     "WorkTypeLegacyMapping",
 ]
@@ -13,8 +13,10 @@ from sqlalchemy import (
     Date,
     Text,
     Float,
+    Index,
 )
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from app.core.database import Base
 
 
@@ -46,6 +48,11 @@ class ResourcePlan(Base):
         "User", back_populates="created_resource_plans", foreign_keys=[created_by]
     )
 
+    __table_args__ = (
+        # Per-user monthly allocation (dashboards, resource matrix)
+        Index("ix_resource_plans_user_year_month", "user_id", "year", "month"),
+    )
+
 
 class WorkLog(Base):
     """실적 기록"""
@@ -78,3 +85,32 @@ class WorkLog(Base):
     project = relationship("Project", back_populates="worklogs")
     product_line = relationship("ProductLine", back_populates="worklogs")  # NEW
     work_type_category = relationship("WorkTypeCategory")
+
+    __table_args__ = (
+        # Users' hours over a date range (dashboards, reports)
+        Index("ix_worklogs_user_id_date", "user_id", "date"),
+    )
+
+
+class UserWorkTypeUsage(Base):
+    """사용자별 업무유형 사용량 집계 (최근 90일, 야간 갱신)"""
+
+    __tablename__ = "user_work_type_usage"
+
+    user_id = Column(String(36), ForeignKey("users.id"), primary_key=True)
+    work_type_category_id = Column(
+        Integer, ForeignKey("work_type_categories.id"), primary_key=True
+    )
+    total_hours_90d = Column(Float, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now())
+
+
+class UserProjectUsage(Base):
+    """사용자별 프로젝트 사용량 집계 (최근 90일, 야간 갱신)"""
+
+    __tablename__ = "user_project_usage"
+
+    user_id = Column(String(36), ForeignKey("users.id"), primary_key=True)
+    project_id = Column(String(36), ForeignKey("projects.id"), primary_key=True)
+    usage_count_90d = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now())
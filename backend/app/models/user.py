@@ -2,15 +2,87 @@
 SQLAlchemy Models for User and User History
 """
 
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, DateTime, Text
+import os
+import time
+from enum import IntEnum
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    SmallInteger,
+    Boolean,
+    ForeignKey,
+    DateTime,
+    Text,
+)
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 from app.core.database import Base
 
 
-def generate_uuid():
-    return str(uuid.uuid4())
+class Role(IntEnum):
+    """시스템 권한 (users.role 저장 코드)"""
+
+    ADMIN = 1
+    PM = 2
+    FM = 3
+    USER = 4
+
+
+class ChangeType(IntEnum):
+    """사용자 이력 변경 유형 (user_history.change_type 저장 코드)"""
+
+    HIRE = 1
+    TRANSFER = 2
+    TRANSFER_IN = 3
+    TRANSFER_OUT = 4
+    PROMOTION = 5
+    RESIGN = 6
+
+
+class CodedEnum(TypeDecorator):
+    """
+    Stores an IntEnum as SMALLINT while exposing the member name as a string.
+
+    Callers keep reading/writing "ADMIN", "HIRE", ... and comparing against
+    string literals in queries; only the stored representation changes.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[IntEnum]):
+        super().__init__()
+        self.enum_cls = enum_cls
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, self.enum_cls):
+            return value.value
+        try:
+            return self.enum_cls[value].value
+        except KeyError:
+            raise ValueError(f"Unknown {self.enum_cls.__name__}: {value!r}")
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self.enum_cls(value).name
+
+
+def generate_uuid() -> str:
+    """
+    Time-ordered UUIDv7 (RFC 9562) rendered in canonical 36-char form.
+
+    48-bit millisecond timestamp followed by 74 random bits, so new ids land
+    at the right edge of the users.id index instead of random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # version 7 (bits 76-79) and RFC 4122 variant (bits 62-63)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 class User(Base):
@@ -26,20 +98,24 @@ class User(Base):
     department_id = Column(String(50), ForeignKey("departments.id"), nullable=False)
     sub_team_id = Column(String(50), ForeignKey("sub_teams.id"), nullable=True)
     position_id = Column(String(50), ForeignKey("job_positions.id"), nullable=False)
-    role = Column(String(20), default="USER")  # ADMIN, PM, FM, USER
+    role = Column(CodedEnum(Role), default=Role.USER.name)  # ADMIN, PM, FM, USER
     is_active = Column(Boolean, default=True)
     hire_date = Column(DateTime, nullable=True)
     termination_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     department = relationship("Department", foreign_keys=[department_id])
     sub_team = relationship("SubTeam", back_populates="users")
     position = relationship("JobPosition", back_populates="users")
-    history = relationship("UserHistory", back_populates="user")
-    worklogs = relationship("WorkLog", back_populates="user")
-    managed_projects = relationship("Project", back_populates="pm")
+    # Large collections: must be eager-loaded explicitly (selectinload) at the
+    # query site; implicit lazy loads raise instead of issuing N+1 queries.
+    history = relationship("UserHistory", back_populates="user", lazy="raise_on_sql")
+    worklogs = relationship("WorkLog", back_populates="user", lazy="raise_on_sql")
+    managed_projects = relationship(
+        "Project", back_populates="pm", lazy="raise_on_sql"
+    )
     resource_plans = relationship(
         "ResourcePlan", back_populates="user", foreign_keys="ResourcePlan.user_id"
     )
@@ -61,10 +137,10 @@ class UserHistory(Base):
     start_date = Column(DateTime, nullable=False)
     end_date = Column(DateTime, nullable=True)  # NULL = 현재
     change_type = Column(
-        String(20), nullable=False
-    )  # HIRE, TRANSFER_IN, TRANSFER_OUT, PROMOTION, RESIGN
+        CodedEnum(ChangeType), nullable=False
+    )  # HIRE, TRANSFER, TRANSFER_IN, TRANSFER_OUT, PROMOTION, RESIGN
     remarks = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     user = relationship("User", back_populates="history")
@@ -3,9 +3,19 @@ SQLAlchemy Model for Work Type Categories
 Hierarchical structure: L1 (대분류) -> L2 (소분류) -> L3 (상세분류)
 """
 
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, DateTime, Text
+from typing import List, Optional
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    Boolean,
+    ForeignKey,
+    DateTime,
+    Text,
+    Index,
+)
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from app.core.database import Base
 
 
@@ -26,21 +36,61 @@ class WorkTypeCategory(Base):
     sort_order = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
 
-    # Job roles that can use this category (comma-separated or null for all)
-    # e.g., "SW_ENGINEER,SYSTEM_ENGINEER" or null for universal
-    applicable_roles = Column(String(500), nullable=True)
+    # Job roles that can use this category (no rows = universal)
+    role_links = relationship(
+        "WorkTypeApplicableRole",
+        back_populates="category",
+        cascade="all, delete-orphan",
+        order_by="WorkTypeApplicableRole.role",
+    )
 
     # NEW: 프로젝트/제품군 선택 필수 여부
     # True = 프로젝트 또는 제품군 선택 필수
     # False = 프로젝트 선택 없이도 WorkLog 입력 가능 (일반 행정 등)
     project_required = Column(Boolean, default=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Self-referential relationship
     parent = relationship("WorkTypeCategory", remote_side=[id], backref="children")
 
+    @property
+    def applicable_roles(self) -> Optional[str]:
+        """Comma-separated role list (API compatibility), None if universal"""
+        if not self.role_links:
+            return None
+        return ",".join(link.role for link in self.role_links)
+
+    @applicable_roles.setter
+    def applicable_roles(self, value: Optional[str]) -> None:
+        roles: List[str] = []
+        for role in (value or "").split(","):
+            role = role.strip()
+            if role and role not in roles:
+                roles.append(role)
+        self.role_links = [WorkTypeApplicableRole(role=role) for role in roles]
+
+
+class WorkTypeApplicableRole(Base):
+    """업무 유형 카테고리별 적용 직책 (M:N)"""
+
+    __tablename__ = "work_type_applicable_roles"
+
+    category_id = Column(
+        Integer,
+        ForeignKey("work_type_categories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    role = Column(String(50), primary_key=True)  # e.g., "SW_ENGINEER"
+
+    category = relationship("WorkTypeCategory", back_populates="role_links")
+
+    __table_args__ = (
+        # PK covers category -> roles; this covers role -> categories
+        Index("ix_work_type_applicable_roles_role", "role", "category_id"),
+    )
+
 
 # Legacy work_type mapping table for migration
 class WorkTypeLegacyMapping(Base):
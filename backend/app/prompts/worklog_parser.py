@@ -9,10 +9,18 @@ from typing import List, Dict, Any, Optional
 
 
 class WorklogParserPrompt:
-    """Generates prompts for worklog parsing AI"""
+    """Generates prompts for worklog parsing AI (classmethods only, not instantiable)"""
 
-    # English system prompt for token efficiency (~40% savings vs Korean)
-    SYSTEM_TEMPLATE = """You are a worklog parsing expert. Analyze user's natural language work description and convert it to structured JSON worklog entries.
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        raise TypeError("WorklogParserPrompt is not instantiable; use its classmethods")
+
+    # English system prompt for token efficiency (~40% savings vs Korean).
+    # The instructions are identical for every request and come first, so
+    # providers with automatic prefix caching (Groq, Gemini) can reuse them;
+    # the per-user lists and per-message hints follow in DYNAMIC_TEMPLATE.
+    STATIC_INSTRUCTIONS = """You are a worklog parsing expert. Analyze user's natural language work description and convert it to structured JSON worklog entries.
 
 ## Time Estimation Rules
 - Korean "오전"/"오전에"/"아침에" (morning) = 4 hours
@@ -45,16 +53,10 @@ class WorklogParserPrompt:
 - TUMALO, 투말로 → Tumalo project
 - ACM → ACM NPI/ETO project
 
-## Available Work Types (id:code:name)
-{work_types}
-
-## Available Projects (id:code:name)
-{projects}
-
 ## Rules
 1. Separate multiple tasks into individual entries
-2. Match project by name/code from the list above
-3. Select the most appropriate work_type from the list
+2. Match project by name/code from the Available Projects list below
+3. Select the most appropriate work_type from the Available Work Types list below
 4. Polish the description - convert casual speech to professional summary
    - Example: "OQC 인프라 DB 설계했고" → "OQC 인프라 데이터베이스 설계"
    - Example: "Justin이랑 HRS 관련 미팅" → "HRS 프로젝트 미팅"
@@ -62,7 +64,15 @@ class WorklogParserPrompt:
 6. IMPORTANT: Return work_type_id as the actual ID from the list, not code
 
 ## Output Format (JSON only, no explanation)
-{{"entries":[{{"project_id":"project_id_or_null","project_name":"project_name","work_type_id":"work_type_id_or_null","work_type_name":"work_type_name","description":"polished_description","hours":hours_number,"confidence":0_to_1}}]}}
+{"entries":[{"project_id":"project_id_or_null","project_name":"project_name","work_type_id":"work_type_id_or_null","work_type_name":"work_type_name","description":"polished_description","hours":hours_number,"confidence":0_to_1}]}
+
+"""
+
+    DYNAMIC_TEMPLATE = """## Available Work Types (id:code:name)
+{work_types}
+
+## Available Projects (id:code:name)
+{projects}
 
 {hints_section}"""
 
@@ -123,20 +133,19 @@ Respond with JSON only."""
             if hint_parts:
                 hints_section = "## Detected Hints\n" + "\n".join(hint_parts)
 
-        return cls.SYSTEM_TEMPLATE.format(
+        return cls.STATIC_INSTRUCTIONS + cls.DYNAMIC_TEMPLATE.format(
             projects=projects_str,
             work_types=work_types_str,
             hints_section=hints_section,
         )
 
     @classmethod
-    def build_user_prompt(cls, text: str, target_date: str) -> str:
+    def build_user_prompt(cls, text: str) -> str:
         """
         Build the user prompt with the input text.
 
         Args:
             text: User's natural language input
-            target_date: Target date in YYYY-MM-DD format
 
         Returns:
             Formatted user prompt string
@@ -1,61 +1,85 @@
 """
 Pydantic Schemas - Export all schemas
+
+Submodules are imported on first attribute access (PEP 562), so importing any
+single schema module (e.g. app.schemas.auth) no longer builds every model.
 """
 
-from app.schemas.auth import (
-    Token,
-    TokenData,
-    UserLogin,
-    UserResponse,
-    TokenRefreshRequest,
-)
-from app.schemas.user import User, UserCreate, UserUpdate
-from app.schemas.user_history import UserHistory, UserHistoryCreate
-from app.schemas.project import Project, ProjectCreate, ProjectUpdate
-from app.schemas.worklog import (
-    WorkLog,
-    WorkLogCreate,
-    WorkLogUpdate,
-    DailySummary,
-    CopyWeekRequest,
-)
-from app.schemas.scenario import (
-    ProjectScenario,
-    ProjectScenarioCreate,
-    ProjectScenarioUpdate,
-    ScenarioMilestone,
-    ScenarioMilestoneCreate,
-    ScenarioMilestoneUpdate,
-    ScenarioComparisonResult,
-    CopyScenarioRequest,
-)
-
-
-__all__ = [
-    "Token",
-    "TokenData",
-    "UserLogin",
-    "UserResponse",
-    "TokenRefreshRequest",
-    "User",
-    "UserCreate",
-    "UserUpdate",
-    "UserHistory",
-    "UserHistoryCreate",
-    "Project",
-    "ProjectCreate",
-    "ProjectUpdate",
-    "WorkLog",
-    "WorkLogCreate",
-    "WorkLogUpdate",
-    "DailySummary",
-    "CopyWeekRequest",
-    "ProjectScenario",
-    "ProjectScenarioCreate",
-    "ProjectScenarioUpdate",
-    "ScenarioMilestone",
-    "ScenarioMilestoneCreate",
-    "ScenarioMilestoneUpdate",
-    "ScenarioComparisonResult",
-    "CopyScenarioRequest",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.schemas.auth import (
+        Token,
+        TokenData,
+        UserLogin,
+        UserResponse,
+        TokenRefreshRequest,
+    )
+    from app.schemas.user import User, UserCreate, UserUpdate
+    from app.schemas.user_history import UserHistory, UserHistoryCreate
+    from app.schemas.project import Project, ProjectCreate, ProjectUpdate
+    from app.schemas.worklog import (
+        WorkLog,
+        WorkLogCreate,
+        WorkLogUpdate,
+        DailySummary,
+        CopyWeekRequest,
+    )
+    from app.schemas.scenario import (
+        ProjectScenario,
+        ProjectScenarioCreate,
+        ProjectScenarioUpdate,
+        ScenarioMilestone,
+        ScenarioMilestoneCreate,
+        ScenarioMilestoneUpdate,
+        ScenarioComparisonResult,
+        CopyScenarioRequest,
+    )
+
+
+# Exported name -> defining submodule
+_EXPORTS = {
+    "Token": "auth",
+    "TokenData": "auth",
+    "UserLogin": "auth",
+    "UserResponse": "auth",
+    "TokenRefreshRequest": "auth",
+    "User": "user",
+    "UserCreate": "user",
+    "UserUpdate": "user",
+    "UserHistory": "user_history",
+    "UserHistoryCreate": "user_history",
+    "Project": "project",
+    "ProjectCreate": "project",
+    "ProjectUpdate": "project",
+    "WorkLog": "worklog",
+    "WorkLogCreate": "worklog",
+    "WorkLogUpdate": "worklog",
+    "DailySummary": "worklog",
+    "CopyWeekRequest": "worklog",
+    "ProjectScenario": "scenario",
+    "ProjectScenarioCreate": "scenario",
+    "ProjectScenarioUpdate": "scenario",
+    "ScenarioMilestone": "scenario",
+    "ScenarioMilestoneCreate": "scenario",
+    "ScenarioMilestoneUpdate": "scenario",
+    "ScenarioComparisonResult": "scenario",
+    "CopyScenarioRequest": "scenario",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
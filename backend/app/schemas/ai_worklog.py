@@ -3,8 +3,9 @@ AI WorkLog Parsing Schemas
 Schemas for AI-assisted worklog entry parsing
 """
 
+from datetime import date
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AIWorklogParseRequest(BaseModel):
@@ -12,12 +13,14 @@ class AIWorklogParseRequest(BaseModel):
 
     text: str = Field(..., description="Natural language work description")
     user_id: str = Field(..., description="User ID for the worklogs")
-    target_date: str = Field(..., description="Target date in YYYY-MM-DD format")
+    target_date: date = Field(..., description="Target date in YYYY-MM-DD format")
 
 
 class AIWorklogEntry(BaseModel):
     """Single parsed worklog entry from AI"""
 
+    model_config = ConfigDict(frozen=True)
+
     project_id: Optional[str] = Field(None, description="Matched project ID")
     project_name: Optional[str] = Field(None, description="Matched project name")
     work_type_category_id: Optional[int] = Field(None, description="Matched work type category ID")
@@ -40,9 +43,27 @@ class AIWorklogParseResponse(BaseModel):
     warnings: list[str] = Field(default_factory=list, description="Warnings or notes about the parsing")
 
 
+class AIWorklogBatchParseRequest(BaseModel):
+    """Request schema for parsing several inputs in one call"""
+
+    requests: list[AIWorklogParseRequest] = Field(
+        ..., min_length=1, max_length=50, description="Inputs to parse"
+    )
+
+
+class AIWorklogBatchParseResponse(BaseModel):
+    """Response schema for batch AI worklog parsing"""
+
+    results: list[AIWorklogParseResponse] = Field(
+        default_factory=list, description="Parse results, in request order"
+    )
+
+
 class AIHealthResponse(BaseModel):
     """Response schema for AI health check"""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="AI service status: 'healthy' or 'unhealthy'")
     model: str = Field(..., description="Currently configured AI model")
     message: Optional[str] = Field(None, description="Additional status message")
@@ -2,8 +2,8 @@
 Pydantic Schemas for Project CRUD operations
 """
 
-from typing import Optional, List
-from pydantic import BaseModel
+from typing import ClassVar, Optional, List, Tuple
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
 from app.schemas.user import User
@@ -15,8 +15,7 @@ class BusinessUnit(BaseModel):
     name: str
     code: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Schema for Program
@@ -26,8 +25,7 @@ class Program(BaseModel):
     business_unit_id: Optional[str] = None
     business_unit: Optional[BusinessUnit] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Schema for ProjectType
@@ -35,8 +33,7 @@ class ProjectType(BaseModel):
     id: str
     name: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Schema for ProductLine
@@ -49,8 +46,7 @@ class ProductLine(BaseModel):
     line_category: Optional[str] = "PRODUCT"  # PRODUCT, PLATFORM, LEGACY
     description: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProductLineCreate(BaseModel):
@@ -127,8 +123,27 @@ class Project(ProjectBase):
     pm: Optional[User] = None
     recent_activity_score: Optional[float] = 0.0
 
-    class Config:
-        from_attributes = True
+    # ORM relationships this schema reads; list queries must eager-load them
+    REQUIRED_LOADS: ClassVar[Tuple[str, ...]] = (
+        "program",
+        "project_type",
+        "product_line",
+        "pm",
+    )
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# Flat list row: related names as scalars instead of nested models
+class ProjectListItem(ProjectBase):
+    id: str
+    program_name: Optional[str] = None
+    project_type_name: Optional[str] = None
+    pm_name: Optional[str] = None
+    pm_email: Optional[str] = None
+    recent_activity_score: Optional[float] = 0.0
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============ Milestone Schemas ============
@@ -172,8 +187,7 @@ class Milestone(MilestoneBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WorklogStats(BaseModel):
@@ -1,53 +1,65 @@
 """
 Pydantic Schemas for Resource Allocation Matrix
+
+Row/cell types are plain slotted dataclasses: they are built N×M times in the
+matrix service and only serialized once, through ResourceAllocationMatrix.
+Pydantic passes dataclass instances through without re-validating them.
+
+Per-month values are positional lists aligned with ResourceAllocationMatrix.months
+(index i is months[i]) rather than dicts keyed by the month string.
 """
 
-from typing import Optional, Dict, List
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
-class ResourceAllocationDetail(BaseModel):
+@dataclass(slots=True)
+class ResourceAllocationDetail:
     """Individual resource allocation detail"""
 
-    user_id: Optional[str] = None  # None for TBD
+    user_id: Optional[str]  # None for TBD
     name: str  # "Gerald" or "TBD"
     role: str  # Project Role name
     position: str  # Job Position name
     fte: float  # FTE (Full-Time Equivalent)
 
 
-class MonthlyAllocation(BaseModel):
-    """Monthly allocation for a project"""
-
-    month: str  # "2026-01"
-    total_fte: float
-    details: List[ResourceAllocationDetail]
-
-
-class ProjectAllocationRow(BaseModel):
+@dataclass(slots=True)
+class ProjectAllocationRow:
     """Project row in the matrix"""
 
     project_id: str
     project_code: str  # IO Ref
     project_name: str
     category: str  # PRODUCT | FUNCTIONAL
-    allocations: Dict[str, MonthlyAllocation]  # {"2026-01": {...}, ...}
+    total_fte: List[float]  # Monthly total FTE, aligned with matrix.months
+    details: List[List[ResourceAllocationDetail]]  # Monthly details, same order
 
 
-class ProgramGroup(BaseModel):
+@dataclass(slots=True)
+class ProgramGroup:
     """Program group containing projects"""
 
     program_id: str
     program_name: str
     projects: List[ProjectAllocationRow]
-    total_by_month: Dict[str, float]  # Program level monthly total FTE
+    total_by_month: List[float]  # Program level monthly total FTE
 
 
 class ResourceAllocationMatrix(BaseModel):
     """Complete resource allocation matrix"""
 
+    model_config = ConfigDict(frozen=True)
+
     start_month: str
     end_month: str
     months: List[str]  # ["2026-01", "2026-02", ...]
     programs: List[ProgramGroup]
-    grand_total_by_month: Dict[str, float]  # Overall total by month
+    grand_total_by_month: List[float]  # Overall total by month
+
+
+# Compiled once; serialize the matrix (or one program of a streamed matrix)
+# to JSON bytes in pydantic-core
+MATRIX_ADAPTER = TypeAdapter(ResourceAllocationMatrix)
+PROGRAM_GROUP_ADAPTER = TypeAdapter(ProgramGroup)
@@ -2,6 +2,7 @@
 Pydantic Schemas for Project Scenarios and Scenario Milestones
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
@@ -98,8 +99,14 @@ class ProjectScenario(ProjectScenarioBase):
 # ============ Comparison Schemas ============
 
 
-class MilestoneComparison(BaseModel):
-    """Schema for comparing milestones between scenarios"""
+@dataclass(frozen=True, slots=True)
+class MilestoneComparison:
+    """Milestone difference between two scenarios.
+
+    A plain dataclass: it is built in the comparison loop and only ever
+    serialized, so instances skip pydantic validation and are passed
+    through as-is by ScenarioComparisonResult.
+    """
 
     milestone_name: str
     scenario_1_date: Optional[datetime] = None
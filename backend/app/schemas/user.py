@@ -2,21 +2,30 @@
 Pydantic Schemas for User CRUD operations
 """
 
-from typing import Optional
-from pydantic import BaseModel, EmailStr
+from typing import Annotated, Literal, Optional
+from pydantic import BaseModel, EmailStr, StringConstraints
 from datetime import datetime
 
+# Mirrors app.models.user.Role (stored as SMALLINT codes)
+RoleCode = Literal["ADMIN", "PM", "FM", "USER"]
+
+# Shape-only email check (pydantic-core regex). Used where addresses come
+# back from the database; EmailStr's email-validator run is kept for input.
+Email = Annotated[
+    str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)
+]
+
 
 class UserBase(BaseModel):
     """Base schema for user attributes"""
 
-    email: EmailStr
+    email: Email
     name: str
     korean_name: Optional[str] = None
     department_id: str
     sub_team_id: Optional[str] = None
     position_id: str
-    role: str = "USER"
+    role: RoleCode = "USER"
     is_active: bool = True
     hire_date: Optional[datetime] = None
 
@@ -24,6 +33,7 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     """Schema for creating a new user"""
 
+    email: EmailStr
     password: str
 
 
@@ -36,7 +46,7 @@ class UserUpdate(BaseModel):
     department_id: Optional[str] = None
     sub_team_id: Optional[str] = None
     position_id: Optional[str] = None
-    role: Optional[str] = None
+    role: Optional[RoleCode] = None
     is_active: Optional[bool] = None
     hire_date: Optional[datetime] = None
     termination_date: Optional[datetime] = None
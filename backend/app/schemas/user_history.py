@@ -2,10 +2,15 @@
 Pydantic Schemas for User History
 """
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
+# Mirrors app.models.user.ChangeType (stored as SMALLINT codes)
+ChangeTypeCode = Literal[
+    "HIRE", "TRANSFER", "TRANSFER_IN", "TRANSFER_OUT", "PROMOTION", "RESIGN"
+]
+
 
 class UserHistoryBase(BaseModel):
     user_id: str
@@ -14,7 +19,7 @@ class UserHistoryBase(BaseModel):
     position_id: str
     start_date: datetime
     end_date: Optional[datetime] = None
-    change_type: str
+    change_type: ChangeTypeCode
     remarks: Optional[str] = None
 
 
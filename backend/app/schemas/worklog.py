@@ -2,13 +2,25 @@
 WorkLog Pydantic Schemas
 """
 
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Annotated, ClassVar, Optional, List, Tuple
+from pydantic import (
+    AliasChoices,
+    AliasPath,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+)
 
 from app.schemas.work_type import WorkTypeCategoryFlat
 from app.schemas.project import Project
 
+# Hours logged in one entry; shared so create and update apply one constraint
+Hours = Annotated[float, Field(gt=0, le=24)]
+
 
 class WorkLogBase(BaseModel):
     """Base schema for WorkLog"""
@@ -17,7 +29,7 @@ class WorkLogBase(BaseModel):
     project_id: Optional[str] = None  # Made optional for non-project work
     product_line_id: Optional[str] = None  # Direct product line support work
     work_type_category_id: Optional[int] = None  # Optional - can be NULL for imported data
-    hours: float = Field(..., gt=0, le=24)
+    hours: Hours
     description: Optional[str] = None
     is_sudden_work: bool = False
     is_business_trip: bool = False
@@ -36,16 +48,17 @@ class WorkLogUpdate(BaseModel):
     project_id: Optional[str] = None
     product_line_id: Optional[str] = None
     work_type_category_id: Optional[int] = None
-    hours: Optional[float] = Field(None, gt=0, le=24)
+    hours: Optional[Hours] = None
     description: Optional[str] = None
     is_sudden_work: Optional[bool] = None
     is_business_trip: Optional[bool] = None
 
 
-class ProjectSummary(BaseModel):
-    """Project summary within daily summary"""
+@dataclass(slots=True)
+class ProjectSummary:
+    """Project summary within daily summary (built by the service, output only)"""
 
-    project_id: str
+    project_id: Optional[str]  # None for non-project work
     project_code: str
     project_name: str
     hours: float
@@ -59,9 +72,13 @@ class WorkLog(WorkLogBase):
     created_at: datetime
     updated_at: datetime
 
-    # Nested project info (optional)
-    project_code: Optional[str] = None
-    project_name: Optional[str] = None
+    # Nested project info (optional) - read from ORM worklog.project when validating rows
+    project_code: Optional[str] = Field(
+        None, validation_alias=AliasChoices("project_code", AliasPath("project", "code"))
+    )
+    project_name: Optional[str] = Field(
+        None, validation_alias=AliasChoices("project_name", AliasPath("project", "name"))
+    )
     project: Optional["Project"] = None
 
     # Product line info (NEW)
@@ -71,12 +88,24 @@ class WorkLog(WorkLogBase):
     # Work Type Category
     work_type_category: Optional["WorkTypeCategoryFlat"] = None
 
-    class Config:
-        from_attributes = True
+    # ORM relationships this schema reads; list queries must eager-load them
+    REQUIRED_LOADS: ClassVar[Tuple[str, ...]] = ("project", "work_type_category")
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    @field_validator("date", mode="before")
+    @classmethod
+    def _date_from_datetime(cls, value):
+        # worklogs.date is DATETIME on databases created from the alembic
+        # baseline; drop the time part instead of rejecting non-midnight values
+        if isinstance(value, datetime):
+            return value.date()
+        return value
 
 
-class DailySummary(BaseModel):
-    """Response schema for daily summary"""
+@dataclass(slots=True)
+class DailySummary:
+    """Response schema for daily summary (built by the service, output only)"""
 
     date: date
     user_id: str
@@ -95,6 +124,26 @@ class CopyWeekRequest(BaseModel):
 class WorkLogWithUser(WorkLog):
     """WorkLog with user information for table display"""
 
-    user_name: Optional[str] = None
-    user_korean_name: Optional[str] = None
-    department_name: Optional[str] = None
+    REQUIRED_LOADS: ClassVar[Tuple[str, ...]] = WorkLog.REQUIRED_LOADS + ("user",)
+
+    user_name: Optional[str] = Field(
+        None, validation_alias=AliasChoices("user_name", AliasPath("user", "name"))
+    )
+    user_korean_name: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices(
+            "user_korean_name", AliasPath("user", "korean_name")
+        ),
+    )
+    department_name: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices(
+            "department_name", AliasPath("user", "sub_team", "department", "name")
+        ),
+    )
+
+
+# Compiled once; validate whole ORM result lists in a single call
+WORKLOG_LIST_ADAPTER = TypeAdapter(List[WorkLog])
+WORKLOG_WITH_USER_LIST_ADAPTER = TypeAdapter(List[WorkLogWithUser])
+DAILY_SUMMARY_ADAPTER = TypeAdapter(DailySummary)
@@ -3,23 +3,44 @@ AI Worklog Service
 Business logic for AI-assisted worklog parsing
 """
 
+import asyncio
 import logging
-from datetime import date, timedelta
-from typing import List, Dict, Any, Optional, Union
+import re
+from typing import List, Dict, Any, Callable, Optional, Sequence, Tuple, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, desc
+from sqlalchemy import Engine, case, desc, select
 
 logger = logging.getLogger(__name__)
 
 from app.models.project import Project
-from app.models.work_type import WorkTypeCategory
-from app.models.resource import WorkLog
+from app.models.work_type import WorkTypeCategory, WorkTypeApplicableRole
 from app.models.user import User
 from app.services.gemini_client import GeminiClient, gemini_client
 from app.services.groq_client import GroqClient, groq_client
-from app.services.matching_service import FuzzyMatcher
+from app.services.matching_service import (
+    FuzzyMatcher,
+    ProjectMatchIndex,
+    WorkTypeMatchIndex,
+)
+from app.services.lookup_cache import (
+    PROJECTS,
+    WORK_TYPES,
+    Lookup,
+    get_ai_result,
+    get_lookup,
+    get_prompt,
+    store_ai_result,
+    store_lookup,
+    store_prompt,
+)
 from app.services.text_preprocessor import KoreanTextPreprocessor
+from app.services.usage_aggregate_service import (
+    user_project_usage,
+    user_work_type_usage,
+)
 from app.services.keyword_mappings import (
+    PROJECT_KEYWORD_MAPPINGS,
+    WORKTYPE_KEYWORD_MAPPINGS,
     get_project_code_by_keyword,
     get_worktype_code_by_keyword,
 )
@@ -32,6 +53,36 @@ from app.schemas.ai_worklog import (
 from app.core.config import settings
 
 
+# Rule-based fast path: "<project keyword> <work type keyword> N시간"
+_HOURS_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)\s*(?:시간|hrs?|h)(?![A-Za-z])", re.IGNORECASE
+)
+# Anything that suggests more than one task goes to the AI
+_MULTI_TASK_PATTERN = re.compile(r"[,/;\n]|그리고|및|하고|이랑|랑|후에")
+RULE_BASED_CONFIDENCE = 0.9
+_PROJECT_KEYWORDS_LONGEST_FIRST = sorted(
+    {kw for kw, _, _ in PROJECT_KEYWORD_MAPPINGS}, key=len, reverse=True
+)
+
+
+def _unambiguous_keyword_code(
+    mappings: Sequence[Tuple[str, str, int]], text_upper: str
+) -> Optional[str]:
+    """
+    Code of the keywords found in text_upper, if they all agree.
+
+    A keyword contained in another matched keyword ("DESIGN" in
+    "DESIGN REVIEW") is ignored; any other disagreement returns None.
+    """
+    matched = [(kw, code) for kw, code, _ in mappings if kw in text_upper]
+    codes = {
+        code
+        for kw, code in matched
+        if not any(kw != other and kw in other for other, _ in matched)
+    }
+    return codes.pop() if len(codes) == 1 else None
+
+
 class AIWorklogService:
     """Service for AI-assisted worklog parsing"""
 
@@ -58,6 +109,30 @@ class AIWorklogService:
         self._work_types_cache: Optional[List[Dict[str, Any]]] = None
         self._project_code_map: Optional[Dict[str, Dict[str, Any]]] = None
         self._worktype_code_map: Optional[Dict[str, Dict[str, Any]]] = None
+        self._project_id_map: Optional[Dict[str, Dict[str, Any]]] = None
+        self._worktype_id_map: Optional[Dict[int, Dict[str, Any]]] = None
+        self._project_index: Optional[ProjectMatchIndex] = None
+        self._work_type_index: Optional[WorkTypeMatchIndex] = None
+        self._projects_version: Optional[str] = None
+        self._work_types_version: Optional[str] = None
+        # user_id -> recent projects loaded for the prompt in this request
+        self._user_recent_cache: Dict[str, List[Dict[str, Any]]] = {}
+
+    def _use_projects(self, lookup: Lookup) -> List[Dict[str, Any]]:
+        self._projects_cache = lookup.items
+        self._project_code_map = lookup.by_code
+        self._project_id_map = lookup.by_id
+        self._project_index = lookup.match_index
+        self._projects_version = lookup.version
+        return lookup.items
+
+    def _use_work_types(self, lookup: Lookup) -> List[Dict[str, Any]]:
+        self._work_types_cache = lookup.items
+        self._worktype_code_map = lookup.by_code
+        self._worktype_id_map = lookup.by_id
+        self._work_type_index = lookup.match_index
+        self._work_types_version = lookup.version
+        return lookup.items
 
     def _load_projects(self) -> List[Dict[str, Any]]:
         """
@@ -71,62 +146,53 @@ class AIWorklogService:
         if self._projects_cache is not None:
             return self._projects_cache
 
-        projects = (
-            self.db.query(Project)
-            .filter(Project.status.in_(["Planned", "InProgress"]))
+        cached = get_lookup(PROJECTS)
+        if cached is not None:
+            return self._use_projects(cached)
+
+        # Column-only select: plain rows, no ORM identity map / relationships
+        rows = self.db.execute(
+            select(Project.id, Project.code, Project.name)
+            .where(Project.status.in_(["Planned", "InProgress"]))
             .order_by(
                 # InProgress projects come first (0), then Planned (1)
                 case((Project.status == "InProgress", 0), else_=1),
                 # Within same status, newest projects first
                 desc(Project.created_at),
+                # Tiebreaker so equal timestamps keep a stable prompt order
+                Project.id,
             )
-            .all()
-        )
+        ).all()
 
-        self._projects_cache = [
-            {
-                "id": p.id,
-                "code": p.code,
-                "name": p.name,
-            }
-            for p in projects
-        ]
-
-        # Build code map for quick lookups
-        self._project_code_map = {
-            p["code"]: p for p in self._projects_cache if p.get("code")
-        }
+        projects = [{"id": id_, "code": code, "name": name} for id_, code, name in rows]
 
-        return self._projects_cache
+        # Code map and fuzzy-match index are built once and cached with the list
+        return self._use_projects(
+            store_lookup(PROJECTS, projects, match_index=ProjectMatchIndex)
+        )
 
     def _load_work_types(self) -> List[Dict[str, Any]]:
         """Load work type categories from database"""
         if self._work_types_cache is not None:
             return self._work_types_cache
 
-        # Load leaf-level work types (those without children, or level 2+)
-        work_types = (
-            self.db.query(WorkTypeCategory)
-            .filter(WorkTypeCategory.level >= 1)
-            .order_by(WorkTypeCategory.name)
-            .all()
-        )
+        cached = get_lookup(WORK_TYPES)
+        if cached is not None:
+            return self._use_work_types(cached)
 
-        self._work_types_cache = [
-            {
-                "id": w.id,
-                "code": w.code,
-                "name": w.name,
-            }
-            for w in work_types
-        ]
+        # Load leaf-level work types (those without children, or level 2+)
+        rows = self.db.execute(
+            select(WorkTypeCategory.id, WorkTypeCategory.code, WorkTypeCategory.name)
+            .where(WorkTypeCategory.level >= 1)
+            .order_by(WorkTypeCategory.name, WorkTypeCategory.id)
+        ).all()
 
-        # Build code map for quick lookups
-        self._worktype_code_map = {
-            w["code"]: w for w in self._work_types_cache if w.get("code")
-        }
+        work_types = [{"id": id_, "code": code, "name": name} for id_, code, name in rows]
 
-        return self._work_types_cache
+        # Code map and fuzzy-match index are built once and cached with the list
+        return self._use_work_types(
+            store_lookup(WORK_TYPES, work_types, match_index=WorkTypeMatchIndex)
+        )
 
     def _get_project_by_code(self, code: str) -> Optional[Dict[str, Any]]:
         """Get project by code from cache."""
@@ -140,114 +206,130 @@ class AIWorklogService:
             self._load_work_types()
         return self._worktype_code_map.get(code) if self._worktype_code_map else None
 
-    def _load_user_recent_projects(self, user_id: str) -> List[Dict[str, Any]]:
+    def _load_user_recent_projects(
+        self, user_id: str, db: Optional[Session] = None
+    ) -> List[Dict[str, Any]]:
         """
         사용자가 최근 3개월간 입력한 프로젝트 (빈도순)
 
         Args:
             user_id: 사용자 ID
+            db: 조회에 사용할 세션 (기본값: self.db)
 
         Returns:
             최근 사용 프로젝트 목록 (빈도순 정렬, 최대 10개)
         """
-        three_months_ago = date.today() - timedelta(days=90)
-
-        # 최근 3개월 워크로그에서 프로젝트별 사용 빈도 집계
-        project_stats = (
-            self.db.query(
-                WorkLog.project_id,
-                func.count(WorkLog.id).label('usage_count')
-            )
-            .filter(
-                WorkLog.user_id == user_id,
-                WorkLog.date >= three_months_ago,
-                WorkLog.project_id.isnot(None)
-            )
-            .group_by(WorkLog.project_id)
-            .order_by(func.count(WorkLog.id).desc())
+        db = db or self.db
+
+        # 최근 3개월 프로젝트별 사용 빈도 (야간 집계 테이블, 단일 JOIN, 빈도순)
+        usage = user_project_usage(user_id).subquery()
+        rows = db.execute(
+            select(Project.id, Project.code, Project.name)
+            .join(usage, usage.c.project_id == Project.id)
+            .order_by(desc(usage.c.usage_count), Project.id)
             .limit(10)
-            .all()
-        )
+        ).all()
 
-        if not project_stats:
+        if not rows:
             # 최근 기록이 없으면 전체 활성 프로젝트 반환
             return self._load_projects()
 
-        # 프로젝트 정보 조회 (빈도순 유지)
-        project_ids = [ps.project_id for ps in project_stats]
-        projects = self.db.query(Project).filter(Project.id.in_(project_ids)).all()
+        return [{"id": id_, "code": code, "name": name} for id_, code, name in rows]
 
-        # 빈도순으로 정렬하기 위해 맵 사용
-        projects_map = {p.id: p for p in projects}
-
-        return [
-            {"id": p_id, "code": projects_map[p_id].code, "name": projects_map[p_id].name}
-            for p_id in project_ids
-            if p_id in projects_map
-        ]
-
-    def _load_user_work_types(self, user_id: str) -> List[Dict[str, Any]]:
+    def _load_user_work_types(
+        self, user_id: str, db: Optional[Session] = None
+    ) -> List[Dict[str, Any]]:
         """
         직책에 맞는 업무유형 + 자주 사용한 업무유형 (상위 10개)
 
         Args:
             user_id: 사용자 ID
+            db: 조회에 사용할 세션 (기본값: self.db)
 
         Returns:
             사용자 맞춤 업무유형 목록 (빈도순 + 직책별 필터, 최대 10개)
         """
-        # 1. 사용자의 직책 조회
-        user = self.db.query(User).filter(User.id == user_id).first()
-        position_id = user.position_id if user else None
-
-        # 2. 최근 3개월 자주 사용한 업무유형 (시간 합계순)
-        three_months_ago = date.today() - timedelta(days=90)
+        db = db or self.db
 
-        work_type_stats = (
-            self.db.query(
-                WorkLog.work_type_category_id,
-                func.sum(WorkLog.hours).label('total_hours')
+        # 최근 3개월 자주 사용한 업무유형 상위 10개 (야간 집계 테이블, 시간 합계순)
+        usage = user_work_type_usage(user_id).subquery()
+        frequent = (
+            select(usage.c.work_type_category_id, usage.c.total_hours)
+            .order_by(desc(usage.c.total_hours))
+            .limit(10)
+            .subquery()
+        )
+        # 사용자의 직책 (사용자가 없으면 NULL → 직책 조건은 항상 거짓)
+        position_id = (
+            select(User.position_id).where(User.id == user_id).scalar_subquery()
+        )
+        is_frequent = frequent.c.work_type_category_id.is_not(None)
+
+        # 자주 사용했거나 직책에 맞는 활성 업무유형을 한 번에 조회
+        # 자주 사용한 것 우선 (priority 1, 시간순), 직책에 맞는 것 (priority 2)
+        rows = db.execute(
+            select(WorkTypeCategory.id, WorkTypeCategory.code, WorkTypeCategory.name)
+            .outerjoin(frequent, frequent.c.work_type_category_id == WorkTypeCategory.id)
+            .where(
+                WorkTypeCategory.level >= 1,
+                WorkTypeCategory.is_active == True,
+                is_frequent
+                | WorkTypeCategory.role_links.any(
+                    WorkTypeApplicableRole.role == position_id
+                ),
             )
-            .filter(
-                WorkLog.user_id == user_id,
-                WorkLog.date >= three_months_ago
+            .order_by(
+                case((is_frequent, 1), else_=2),
+                desc(frequent.c.total_hours),
+                WorkTypeCategory.name,
+                WorkTypeCategory.id,
             )
-            .group_by(WorkLog.work_type_category_id)
-            .order_by(func.sum(WorkLog.hours).desc())
             .limit(10)
-            .all()
-        )
+        ).all()
+
+        # 결과가 없으면 기본 업무유형 반환
+        if not rows:
+            return self._load_work_types()
 
-        frequent_ids = {wt.work_type_category_id for wt in work_type_stats}
+        return [{"id": id_, "code": code, "name": name} for id_, code, name in rows]
 
-        # 3. 모든 활성 업무유형 조회
-        all_work_types = (
-            self.db.query(WorkTypeCategory)
-            .filter(WorkTypeCategory.level >= 1, WorkTypeCategory.is_active == True)
-            .all()
-        )
+    async def _load_user_lists(
+        self, user_id: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        사용자 맞춤 프로젝트/업무유형 목록을 동시에 조회
 
-        result = []
-        for wt in all_work_types:
-            # 자주 사용한 것 우선 (priority 1)
-            if wt.id in frequent_ids:
-                result.append({"id": wt.id, "code": wt.code, "name": wt.name, "priority": 1})
-            # 직책에 맞는 것 (priority 2)
-            elif position_id and wt.applicable_roles:
-                # applicable_roles는 콤마로 구분된 문자열
-                applicable_list = [r.strip() for r in wt.applicable_roles.split(',')]
-                if position_id in applicable_list:
-                    result.append({"id": wt.id, "code": wt.code, "name": wt.name, "priority": 2})
+        두 쿼리는 서로 독립적이므로 워커 스레드에서 병렬 실행한다.
+        Session은 스레드 간 공유할 수 없어 쿼리마다 같은 엔진의 별도 세션을
+        사용하고, 엔진에 바인딩되지 않은 세션이면 순차 조회한다.
+        (전체 목록 폴백은 호출 전에 인스턴스에 로드되어 있어야 함)
 
-        # 결과가 없으면 기본 업무유형 반환
-        if not result:
-            return self._load_work_types()
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            (최근 사용 프로젝트 목록, 사용자 맞춤 업무유형 목록)
+        """
+        bind = self.db.get_bind()
+        if not isinstance(bind, Engine):
+            projects = self._load_user_recent_projects(user_id)
+            work_types = self._load_user_work_types(user_id)
+        else:
 
-        # 우선순위로 정렬, 상위 10개
-        result.sort(key=lambda x: x["priority"])
-        return [{"id": r["id"], "code": r["code"], "name": r["name"]} for r in result[:10]]
+            def run(loader):
+                with Session(bind) as db:
+                    return loader(user_id, db)
 
-    def _build_system_prompt(
+            projects, work_types = await asyncio.gather(
+                asyncio.to_thread(run, self._load_user_recent_projects),
+                asyncio.to_thread(run, self._load_user_work_types),
+            )
+
+        # 엔트리 매핑 단계에서 같은 목록을 다시 조회하지 않도록 보관
+        self._user_recent_cache[user_id] = projects
+        return projects, work_types
+
+    async def _build_system_prompt(
         self,
         user_id: Optional[str] = None,
         hints: Optional[List[str]] = None,
@@ -262,16 +344,51 @@ class AIWorklogService:
         Returns:
             시스템 프롬프트 문자열
         """
+        # 전체 목록은 공유 캐시에서 로드 (내용 버전 확인용)
+        all_projects = self._load_projects()
+        all_work_types = self._load_work_types()
+
+        # 같은 사용자/힌트/목록 버전 조합은 캐시된 프롬프트 재사용 (DB 조회 생략)
+        # 목록 내용이 바뀌지 않았다면 캐시 무효화 후에도 같은 프롬프트 유지
+        # 힌트는 정렬해서 사용 (감지 순서와 무관하게 같은 키/같은 프롬프트)
+        sorted_hints = tuple(sorted(hints)) if hints else ()
+        cache_key = (
+            user_id,
+            sorted_hints,
+            self._projects_version,
+            self._work_types_version,
+        )
+        cached = get_prompt(cache_key)
+        if cached is not None:
+            return cached
+
         if user_id:
-            # 개인화된 데이터 로드
-            projects = self._load_user_recent_projects(user_id)
-            work_types = self._load_user_work_types(user_id)
+            # 개인화된 데이터 로드 (두 쿼리 병렬 실행)
+            projects, work_types = await self._load_user_lists(user_id)
         else:
             # 기존 전체 데이터 로드
-            projects = self._load_projects()
-            work_types = self._load_work_types()
+            projects = all_projects
+            work_types = all_work_types
+
+        return store_prompt(
+            cache_key,
+            WorklogParserPrompt.build_system_prompt(
+                projects, work_types, list(sorted_hints)
+            ),
+        )
 
-        return WorklogParserPrompt.build_system_prompt(projects, work_types, hints)
+    @staticmethod
+    def _memoized_match(
+        memo: Optional[Dict[Tuple[str, Any], Any]],
+        key: Tuple[str, Any],
+        match: Callable[[], Any],
+    ) -> Any:
+        """match() result, computed once per key when a memo dict is given."""
+        if memo is None:
+            return match()
+        if key not in memo:
+            memo[key] = match()
+        return memo[key]
 
     def _validate_and_map_entry(
         self,
@@ -279,12 +396,19 @@ class AIWorklogService:
         projects_map: Dict[str, Dict[str, Any]],
         work_types_map: Dict[str, Dict[str, Any]],
         original_text: str = "",
+        project_index: Optional[ProjectMatchIndex] = None,
+        work_type_index: Optional[WorkTypeMatchIndex] = None,
+        match_memo: Optional[Dict[Tuple[str, Any], Any]] = None,
     ) -> AIWorklogEntry:
         """
         Validate and map a single parsed entry with fuzzy matching.
 
         Ensures project_id and work_type_category_id exist in the database.
-        Uses multi-stage matching for better accuracy.
+        Uses multi-stage matching for better accuracy. Pass project_index
+        (built from projects_map) and work_type_index (built from
+        work_types_map) to reuse them across entries, and one match_memo
+        dict for all entries of a response so each distinct search term is
+        fuzzy-matched only once.
         """
         project_id = entry.get("project_id")
         project_name = entry.get("project_name")
@@ -292,6 +416,9 @@ class AIWorklogService:
         work_type_id = entry.get("work_type_category_id") or entry.get("work_type_id")
         work_type_name = entry.get("work_type_name")
         description = entry.get("description") or ""
+        # Ensure description is a string before keyword matching reads it
+        if not isinstance(description, str):
+            description = str(description)
 
         matched_project = None
         matched_work_type = None
@@ -308,8 +435,14 @@ class AIWorklogService:
 
             if search_term:
                 # Try fuzzy matcher
-                result = self.matcher.match_project(
-                    search_term, list(projects_map.values()), threshold=0.6
+                result = self._memoized_match(
+                    match_memo,
+                    ("project", search_term),
+                    lambda: self.matcher.match_project(
+                        search_term,
+                        project_index or list(projects_map.values()),
+                        threshold=0.6,
+                    ),
                 )
                 if result:
                     matched_project, conf = result
@@ -346,8 +479,14 @@ class AIWorklogService:
             search_term = work_type_id or work_type_name or ""
 
             if search_term:
-                result = self.matcher.match_work_type(
-                    search_term, list(work_types_map.values()), threshold=0.5
+                result = self._memoized_match(
+                    match_memo,
+                    ("work_type", search_term),
+                    lambda: self.matcher.match_work_type(
+                        search_term,
+                        work_type_index or list(work_types_map.values()),
+                        threshold=0.5,
+                    ),
                 )
                 if result:
                     matched_work_type, conf = result
@@ -388,11 +527,14 @@ class AIWorklogService:
         final_confidence += confidence_boost
         final_confidence = max(0.0, min(1.0, float(final_confidence)))
 
-        # Ensure description is a string
-        if not isinstance(description, str):
-            description = str(description)
+        # Unmatched names are still raw AI output; keep them strings
+        if project_name is not None and not isinstance(project_name, str):
+            project_name = str(project_name)
+        if work_type_name is not None and not isinstance(work_type_name, str):
+            work_type_name = str(work_type_name)
 
-        return AIWorklogEntry(
+        # Every field is checked or clamped above, so skip re-validation
+        return AIWorklogEntry.model_construct(
             project_id=project_id,
             project_name=project_name,
             work_type_category_id=work_type_id,
@@ -402,6 +544,51 @@ class AIWorklogService:
             confidence=final_confidence,
         )
 
+    def _try_rule_based_parse(
+        self, normalized_text: str
+    ) -> Optional[AIWorklogEntry]:
+        """
+        Parse a single, fully keyworded task without the AI.
+
+        Returns an entry only when the text names exactly one project keyword
+        code, one work type keyword code and one duration, both codes exist
+        in the current lookups and nothing hints at a second task; otherwise
+        None and the caller falls back to the AI.
+        """
+        if _MULTI_TASK_PATTERN.search(normalized_text):
+            return None
+        hours_matches = _HOURS_PATTERN.findall(normalized_text)
+        if len(hours_matches) != 1:
+            return None
+        hours = float(hours_matches[0])
+        if not 0 < hours <= 24:
+            return None
+
+        text_upper = normalized_text.upper()
+        project_code = _unambiguous_keyword_code(PROJECT_KEYWORD_MAPPINGS, text_upper)
+        # Project keywords must not count as work types ("QC" inside "OQC")
+        for kw in _PROJECT_KEYWORDS_LONGEST_FIRST:
+            text_upper = text_upper.replace(kw, " ")
+        worktype_code = _unambiguous_keyword_code(WORKTYPE_KEYWORD_MAPPINGS, text_upper)
+        if not project_code or not worktype_code:
+            return None
+
+        project = self._get_project_by_code(project_code)
+        work_type = self._get_worktype_by_code(worktype_code)
+        if not project or not work_type:
+            return None
+
+        # Every field comes from the lookups or was checked above
+        return AIWorklogEntry.model_construct(
+            project_id=project["id"],
+            project_name=project["name"],
+            work_type_category_id=work_type["id"],
+            work_type_name=work_type["name"],
+            description=normalized_text,
+            hours=hours,
+            confidence=RULE_BASED_CONFIDENCE,
+        )
+
     async def parse_worklog(
         self,
         request: AIWorklogParseRequest,
@@ -424,52 +611,70 @@ class AIWorklogService:
         logger.debug(f"Normalized text: {normalized_text}")
         logger.debug(f"Detected hints: {hints}")
 
-        # Step 2: Build prompts (개인화된 프롬프트 + 힌트)
-        system_prompt = self._build_system_prompt(request.user_id, hints)
-        user_prompt = WorklogParserPrompt.build_user_prompt(
-            normalized_text,  # Use normalized text
-            request.target_date,
-        )
-
-        # Step 3: Call AI (Groq or Gemini)
-        try:
-            result = await self.client.generate_json(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-            )
-        except Exception as e:
-            logger.error(f"AI parsing failed: {str(e)}")
+        # 키워드만으로 완전히 해석되는 단일 작업은 AI 호출 없이 바로 반환
+        direct_entry = self._try_rule_based_parse(normalized_text)
+        if direct_entry is not None:
             return AIWorklogParseResponse(
-                entries=[],
-                total_hours=0.0,
-                warnings=[f"AI 파싱 실패: {str(e)}"],
+                entries=[direct_entry], total_hours=direct_entry.hours, warnings=[]
             )
 
+        # 같은 사용자가 같은 문장을 다시 보내면 AI 호출 없이 이전 결과 재사용
+        # (Step 4에서 현재 프로젝트/업무유형 목록으로 다시 매핑됨)
+        result_key = (request.user_id, normalized_text)
+        result = get_ai_result(result_key)
+
+        if result is None:
+            # Step 2: Build prompts (개인화된 프롬프트 + 힌트)
+            system_prompt = await self._build_system_prompt(request.user_id, hints)
+            user_prompt = WorklogParserPrompt.build_user_prompt(normalized_text)
+
+            # Step 3: Call AI (Groq or Gemini)
+            try:
+                result = await self.client.generate_json(
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                )
+            except Exception as e:
+                logger.error(f"AI parsing failed: {str(e)}")
+                return AIWorklogParseResponse(
+                    entries=[],
+                    total_hours=0.0,
+                    warnings=[f"AI 파싱 실패: {str(e)}"],
+                )
+
+            if result.get("entries"):
+                store_ai_result(result_key, result)
+
         # Step 4: Parse and validate entries
         raw_entries = result.get("entries", [])
         if isinstance(result.get("warnings"), list):
             warnings.extend(result["warnings"])
 
-        # Build lookup maps with user activity prioritization
-        # User's recent projects come first (higher matching priority)
-        all_projects = self._load_projects()
-        work_types = self._load_work_types()
+        # Lookup maps are cached with the lists (shared; never mutate them)
+        self._load_projects()
+        self._load_work_types()
+        projects_map = self._project_id_map
+        work_types_map = self._worktype_id_map
+        # Reuse the cached case-folded index
+        project_index = self._project_index
 
         if request.user_id:
-            # Get user's recent projects (sorted by usage frequency)
-            user_recent = self._load_user_recent_projects(request.user_id)
-            user_recent_ids = {p["id"] for p in user_recent}
-
-            # Merge: user recent first, then remaining projects
-            projects = user_recent + [p for p in all_projects if p["id"] not in user_recent_ids]
-        else:
-            projects = all_projects
-
-        projects_map = {p["id"]: p for p in projects}
-        work_types_map = {w["id"]: w for w in work_types}
+            # User's recent projects come first (higher matching priority);
+            # reuse the list the prompt was built from if it was loaded
+            user_recent = self._user_recent_cache.get(request.user_id)
+            if user_recent is None:
+                user_recent = self._load_user_recent_projects(request.user_id)
+            project_index = project_index.prioritized(user_recent)
+
+            # Recent projects may be outside the active list (e.g. Completed)
+            extra = {p["id"]: p for p in user_recent if p["id"] not in projects_map}
+            if extra:
+                projects_map = {**projects_map, **extra}
 
         # Step 5: Validate and map entries with fuzzy matching
+        # (entries often repeat a project/work type: match each term once)
         entries: List[AIWorklogEntry] = []
+        match_memo: Dict[Tuple[str, Any], Any] = {}
         for raw_entry in raw_entries:
             try:
                 entry = self._validate_and_map_entry(
@@ -477,6 +682,9 @@ class AIWorklogService:
                     projects_map,
                     work_types_map,
                     original_text=normalized_text,
+                    project_index=project_index,
+                    work_type_index=self._work_type_index,
+                    match_memo=match_memo,
                 )
                 entries.append(entry)
             except Exception as e:
@@ -505,6 +713,31 @@ class AIWorklogService:
             warnings=warnings,
         )
 
+    async def parse_worklog_batch(
+        self,
+        requests: Sequence[AIWorklogParseRequest],
+    ) -> List[AIWorklogParseResponse]:
+        """
+        Parse several inputs with their AI calls running concurrently.
+
+        All inputs share this service's lookup lists and match indexes, so
+        they are loaded once for the batch. At most
+        settings.AI_MAX_CONCURRENT_REQUESTS parses run at a time.
+
+        Args:
+            requests: Parse requests
+
+        Returns:
+            One AIWorklogParseResponse per request, in request order
+        """
+        semaphore = asyncio.Semaphore(settings.AI_MAX_CONCURRENT_REQUESTS)
+
+        async def parse_one(request: AIWorklogParseRequest) -> AIWorklogParseResponse:
+            async with semaphore:
+                return await self.parse_worklog(request)
+
+        return list(await asyncio.gather(*(parse_one(r) for r in requests)))
+
     async def check_health(self) -> Dict[str, Any]:
         """
         Check AI service health.
@@ -3,10 +3,15 @@ Authentication Service - Business logic for auth operations
 """
 
 from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.user import User
-from app.core.security import verify_password
+from app.core.security import get_password_hash, verify_password
+
+# Checked against when the email is unknown, so a failed login costs one
+# bcrypt verify whether or not the account exists (hashed once at import)
+_DUMMY_HASH = get_password_hash("dummy-password-for-timing")
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
@@ -24,11 +29,17 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     Authenticate user with email and password.
     Returns User object if credentials are valid, None otherwise.
     """
-    user = get_user_by_email(db, email)
-    if not user:
-        return None
-    if not user.is_active:
-        return None
-    if not verify_password(password, user.hashed_password):
+    # Only the columns needed to check the credentials (unique index on email);
+    # the full User row is loaded once they are valid
+    row = db.execute(
+        select(User.id, User.is_active, User.hashed_password).where(
+            User.email == email
+        )
+    ).first()
+    # Always verify, so unknown and inactive accounts take as long as valid ones
+    password_ok = verify_password(
+        password, row.hashed_password if row else _DUMMY_HASH
+    )
+    if not row or not row.is_active or not password_ok:
         return None
-    return user
+    return db.get(User, row.id)
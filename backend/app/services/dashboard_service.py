@@ -2,59 +2,134 @@
 Dashboard Service for personal dashboard data
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_
+import calendar
+from collections import defaultdict
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from sqlalchemy.orm import Session, contains_eager, raiseload
+from sqlalchemy import case, func, and_, literal, null, select, union_all
 
 from app.models.user import User
 from app.models.organization import Department, SubTeam
 from app.models.project import Project, ProjectMilestone
 from app.models.resource import ResourcePlan, WorkLog
+from app.services.lookup_cache import get_org_structure, store_org_structure
+
+# Projects listed individually in the team summary; the rest are "others"
+TOP_PROJECTS = 5
+
+
+def _sub_team_ids(sub_orgs: List[dict]) -> List[str]:
+    """All sub-team ids covered by a list of sub-organizations."""
+    return [st_id for org in sub_orgs for st_id in org["sub_team_ids"]]
+
+
+@lru_cache(maxsize=32)
+def _date_range_for(view_mode: str, today: date) -> Tuple[date, date]:
+    """
+    Inclusive (start, end) of the period containing today.
+
+    view_mode is "weekly" (Monday-Sunday), "monthly", "quarterly" or
+    anything else for the calendar year.
+    """
+    if view_mode == "weekly":
+        start_date = today - timedelta(days=today.weekday())
+        return start_date, start_date + timedelta(days=6)
+    if view_mode == "monthly":
+        first_month = last_month = today.month
+    elif view_mode == "quarterly":
+        first_month = (today.month - 1) // 3 * 3 + 1
+        last_month = first_month + 2
+    else:  # yearly
+        first_month, last_month = 1, 12
+    last_day = calendar.monthrange(today.year, last_month)[1]
+    return (
+        date(today.year, first_month, 1),
+        date(today.year, last_month, last_day),
+    )
 
 
 class DashboardService:
     def __init__(self, db: Session):
         self.db = db
+        # Dashboards built by this instance (one request), keyed by method,
+        # arguments and day; a repeated call in the same request is free
+        self._results: Dict[Hashable, dict] = {}
+
+    def _memoized(self, key: Hashable, build: Callable[[], dict]) -> dict:
+        """Result cached under key for this instance, built on first use."""
+        if key not in self._results:
+            self._results[key] = build()
+        return self._results[key]
 
     def get_my_dashboard(self, user_id: str) -> dict:
         """Get personal dashboard data for the current user"""
-        user = self.db.query(User).filter(User.id == user_id).first()
+        return self._memoized(
+            ("my", user_id, date.today()), lambda: self._build_my_dashboard(user_id)
+        )
+
+    def _build_my_dashboard(self, user_id: str) -> dict:
+        """Query and assemble the personal dashboard."""
+        # Read-only paths select plain columns, not ORM entities
+        user = self.db.execute(
+            select(User.id, User.name, User.email).where(User.id == user_id)
+        ).first()
         if not user:
             return {}
 
         # Get date ranges
-        today = datetime.now().date()
+        today = date.today()
         week_start = today - timedelta(days=today.weekday())  # Monday
         week_end = week_start + timedelta(days=6)  # Sunday
         current_month = today.month
         current_year = today.year
 
-        # 1. Weekly WorkLog Summary
-        weekly_worklogs = (
-            self.db.query(
+        # 1. Weekly WorkLog Summary (project code/name joined; outer join
+        # keeps hours logged without a project) and 2. current-month
+        # Resource Allocation, rolled up per project in one round-trip
+        weekly_rollup = (
+            select(
+                literal("worklog").label("source"),
                 WorkLog.project_id,
+                Project.code,
+                Project.name,
                 func.sum(WorkLog.hours).label("total_hours"),
             )
-            .filter(
+            .outerjoin(Project, Project.id == WorkLog.project_id)
+            .where(
                 and_(
                     WorkLog.user_id == user_id,
                     WorkLog.date >= week_start,
                     WorkLog.date <= week_end,
                 )
             )
-            .group_by(WorkLog.project_id)
-            .all()
+            .group_by(WorkLog.project_id, Project.code, Project.name)
         )
-
-        # Get project names for worklogs
-        worklog_project_ids = [w.project_id for w in weekly_worklogs]
-        projects_map = {}
-        if worklog_project_ids:
-            projects = (
-                self.db.query(Project).filter(Project.id.in_(worklog_project_ids)).all()
+        plan_rollup = (
+            select(
+                literal("plan").label("source"),
+                ResourcePlan.project_id,
+                null().label("code"),
+                null().label("name"),
+                func.sum(ResourcePlan.planned_hours).label("total_hours"),
+            )
+            .where(
+                and_(
+                    ResourcePlan.user_id == user_id,
+                    ResourcePlan.year == current_year,
+                    ResourcePlan.month == current_month,
+                )
             )
-            projects_map = {p.id: {"code": p.code, "name": p.name} for p in projects}
+            .group_by(ResourcePlan.project_id)
+        )
+        weekly_worklogs = []
+        planned_hours_by_project = {}
+        for row in self.db.execute(union_all(weekly_rollup, plan_rollup)):
+            if row.source == "worklog":
+                weekly_worklogs.append(row)
+            else:
+                planned_hours_by_project[row.project_id] = row.total_hours or 0
 
         weekly_summary = {
             "week_start": str(week_start),
@@ -63,67 +138,62 @@ class DashboardService:
             "by_project": [
                 {
                     "project_id": w.project_id,
-                    "project_code": projects_map.get(w.project_id, {}).get("code"),
-                    "project_name": projects_map.get(w.project_id, {}).get("name"),
+                    "project_code": w.code,
+                    "project_name": w.name,
                     "hours": float(w.total_hours) if w.total_hours else 0,
                 }
                 for w in weekly_worklogs
             ],
         }
 
-        # 2. Resource Allocation (current month)
-        resource_plans = (
-            self.db.query(ResourcePlan)
-            .options(joinedload(ResourcePlan.project))
-            .filter(
-                and_(
-                    ResourcePlan.user_id == user_id,
-                    ResourcePlan.year == current_year,
-                    ResourcePlan.month == current_month,
-                )
-            )
-            .all()
-        )
-
-        current_month_fte = sum(p.planned_hours for p in resource_plans)
-        active_projects_count = len(set(p.project_id for p in resource_plans))
+        current_month_fte = sum(planned_hours_by_project.values())
+        active_projects_count = len(planned_hours_by_project)
 
         # 3. My Projects with Milestones
-        my_project_ids = list(set(p.project_id for p in resource_plans))
-
-        # Also add projects from worklogs
-        for w in weekly_worklogs:
-            if w.project_id not in my_project_ids:
-                my_project_ids.append(w.project_id)
+        # Planned projects plus projects logged this week
+        my_project_ids = planned_hours_by_project.keys() | {
+            w.project_id for w in weekly_worklogs
+        }
+        my_project_ids.discard(None)
 
         my_projects = []
         if my_project_ids:
-            projects_with_milestones = (
-                self.db.query(Project)
-                .options(joinedload(Project.milestones))
-                .filter(Project.id.in_(my_project_ids))
-                .all()
-            )
-
-            for project in projects_with_milestones:
-                # Get key milestones (G5, G6)
-                key_milestones = [
+            projects = self.db.execute(
+                select(Project.id, Project.code, Project.name, Project.status).where(
+                    Project.id.in_(my_project_ids)
+                )
+            ).all()
+            # Key milestones (G5, G6) in one compact IN query, filtered in SQL
+            milestones_by_project = defaultdict(list)
+            for m in self.db.execute(
+                select(
+                    ProjectMilestone.project_id,
+                    ProjectMilestone.name,
+                    ProjectMilestone.target_date,
+                    ProjectMilestone.status,
+                )
+                .where(
+                    ProjectMilestone.project_id.in_(my_project_ids),
+                    ProjectMilestone.is_key_gate == True,
+                )
+                .order_by(ProjectMilestone.id)
+            ):
+                milestones_by_project[m.project_id].append(
                     {
                         "name": m.name,
                         "target_date": str(m.target_date) if m.target_date else None,
                         "status": m.status,
                     }
-                    for m in project.milestones
-                    if m.is_key_gate
-                ]
+                )
 
+            for project in projects:
                 my_projects.append(
                     {
                         "id": project.id,
                         "code": project.code,
                         "name": project.name,
                         "status": project.status,
-                        "milestones": key_milestones,
+                        "milestones": milestones_by_project.get(project.id, []),
                     }
                 )
 
@@ -142,6 +212,47 @@ class DashboardService:
             "my_projects": my_projects,
         }
 
+    def _department_sub_teams(self, department_id: str) -> List[dict]:
+        """Sub-teams of a department, each covering its own id (cached)."""
+        cache_key = ("department_sub_teams", department_id)
+        cached = get_org_structure(cache_key)
+        if cached is not None:
+            return cached
+        rows = self.db.execute(
+            select(SubTeam.id, SubTeam.name, SubTeam.code).where(
+                SubTeam.department_id == department_id
+            )
+        ).all()
+        return store_org_structure(
+            cache_key,
+            [
+                {"id": id_, "name": name, "code": code, "sub_team_ids": [id_]}
+                for id_, name, code in rows
+            ],
+        )
+
+    def _division_departments(self, division_id: str) -> List[dict]:
+        """Departments of a division with their sub-team ids (cached)."""
+        cache_key = ("division_departments", division_id)
+        cached = get_org_structure(cache_key)
+        if cached is not None:
+            return cached
+        rows = self.db.execute(
+            select(Department.id, Department.name, Department.code, SubTeam.id)
+            .outerjoin(SubTeam, SubTeam.department_id == Department.id)
+            .where(Department.division_id == division_id)
+        ).all()
+        departments: dict = {}
+        for dept_id, name, code, sub_team_id in rows:
+            dept = departments.setdefault(
+                dept_id,
+                {"id": dept_id, "name": name, "code": code, "sub_team_ids": []},
+            )
+            # Departments without sub_teams come back once with a NULL sub_team
+            if sub_team_id is not None:
+                dept["sub_team_ids"].append(sub_team_id)
+        return store_org_structure(cache_key, list(departments.values()))
+
     def get_team_dashboard(
         self, user_id: str, scope: str = "department", view_mode: str = "weekly"
     ) -> dict:
@@ -160,12 +271,26 @@ class DashboardService:
             - member_contributions: Per-member breakdown
             - org_context: Comparison with upper organization
         """
+        return self._memoized(
+            ("team", user_id, scope, view_mode, date.today()),
+            lambda: self._build_team_dashboard(user_id, scope, view_mode),
+        )
+
+    def _build_team_dashboard(self, user_id: str, scope: str, view_mode: str) -> dict:
+        """Query and assemble the team dashboard."""
+        # The org chain is read from the joined columns of this single row;
+        # outer joins keep users without a sub-team. Any other relationship
+        # access raises instead of lazy loading.
         user = (
             self.db.query(User)
+            .outerjoin(User.sub_team)
+            .outerjoin(SubTeam.department)
+            .outerjoin(Department.division)
             .options(
-                joinedload(User.sub_team)
-                .joinedload(SubTeam.department)
-                .joinedload(Department.division),
+                contains_eager(User.sub_team)
+                .contains_eager(SubTeam.department)
+                .contains_eager(Department.division),
+                raiseload("*"),
             )
             .filter(User.id == user_id)
             .first()
@@ -177,61 +302,35 @@ class DashboardService:
         user_department = user.sub_team.department if user.sub_team else None
         user_department_id = user_department.id if user_department else None
 
-        # Date range calculation
-        today = datetime.now().date()
-        if view_mode == "weekly":
-            start_date = today - timedelta(days=today.weekday())
-            end_date = start_date + timedelta(days=6)
-        elif view_mode == "monthly":
-            start_date = today.replace(day=1)
-            next_month = today.replace(day=28) + timedelta(days=4)
-            end_date = next_month.replace(day=1) - timedelta(days=1)
-        elif view_mode == "quarterly":
-            quarter = (today.month - 1) // 3
-            start_date = today.replace(month=quarter * 3 + 1, day=1)
-            if quarter == 3:
-                end_date = today.replace(month=12, day=31)
-            else:
-                end_date = today.replace(
-                    month=(quarter + 1) * 3 + 1, day=1
-                ) - timedelta(days=1)
-        else:  # yearly
-            start_date = today.replace(month=1, day=1)
-            end_date = today.replace(month=12, day=31)
+        today = date.today()
+        start_date, end_date = _date_range_for(view_mode, today)
 
-        # Determine team members based on scope
-        team_query = self.db.query(User).filter(User.is_active == True)
+        # Determine team members based on scope (plain columns, no ORM
+        # entities: the member loops read nothing else)
+        team_query = select(
+            User.id, User.name, User.korean_name, User.sub_team_id
+        ).filter(User.is_active == True)
+        # Sub-organizations for the breakdown, each with the sub_teams it covers
+        sub_orgs: List[dict] = []
 
         if scope == "sub_team" and user.sub_team_id:
             team_query = team_query.filter(User.sub_team_id == user.sub_team_id)
             team_name = user.sub_team.name if user.sub_team else "Unknown"
             team_code = user.sub_team.code if user.sub_team else ""
         elif scope == "department" and user_department_id:
-            # Get all sub_teams in the same department
-            sub_team_ids = [
-                st.id
-                for st in self.db.query(SubTeam)
-                .filter(SubTeam.department_id == user_department_id)
-                .all()
-            ]
-            team_query = team_query.filter(User.sub_team_id.in_(sub_team_ids))
+            # All sub_teams in the same department
+            sub_orgs = self._department_sub_teams(user_department_id)
+            team_query = team_query.filter(
+                User.sub_team_id.in_(_sub_team_ids(sub_orgs))
+            )
             team_name = user_department.name if user_department else "Unknown"
             team_code = user_department.code if user_department else ""
         elif scope == "business_unit" and user_department:
-            # Get all departments in the same division, then all sub_teams
-            dept_ids = [
-                d.id
-                for d in self.db.query(Department)
-                .filter(Department.division_id == user_department.division_id)
-                .all()
-            ]
-            sub_team_ids = [
-                st.id
-                for st in self.db.query(SubTeam)
-                .filter(SubTeam.department_id.in_(dept_ids))
-                .all()
-            ]
-            team_query = team_query.filter(User.sub_team_id.in_(sub_team_ids))
+            # All departments in the same division, with their sub_teams
+            sub_orgs = self._division_departments(user_department.division_id)
+            team_query = team_query.filter(
+                User.sub_team_id.in_(_sub_team_ids(sub_orgs))
+            )
             division = user_department.division if user_department else None
             team_name = division.name if division else "Unknown"
             team_code = division.code if division else ""
@@ -239,82 +338,95 @@ class DashboardService:
             team_name = "PCAS Engineering"
             team_code = "ENG"
 
-        team_members = team_query.all()
-        team_member_ids = [m.id for m in team_members]
-
-        # Get team worklogs
-        team_worklogs = (
-            self.db.query(
-                WorkLog.user_id,
+        team_members = self.db.execute(team_query).all()
+        # Aggregates filter on the member query as a subquery rather than an
+        # IN list of every member id
+        team_member_ids = team_query.with_only_columns(User.id)
+
+        # Team worklogs are rolled up in SQL. Projects are ranked by hours
+        # (details joined; outer join keeps hours logged without a project)
+        # and folded into at most six rows: ranks 1-5 and an "others" bucket.
+        team_worklog_filter = and_(
+            WorkLog.user_id.in_(team_member_ids),
+            WorkLog.date >= start_date,
+            WorkLog.date <= end_date,
+        )
+        project_total = func.sum(WorkLog.hours)
+        ranked_projects = (
+            select(
                 WorkLog.project_id,
-                func.sum(WorkLog.hours).label("total_hours"),
+                Project.code,
+                Project.name,
+                Project.category,
+                project_total.label("hours"),
+                func.row_number()
+                .over(order_by=(project_total.desc(), WorkLog.project_id))
+                .label("project_rank"),
             )
-            .filter(
-                and_(
-                    WorkLog.user_id.in_(team_member_ids),
-                    WorkLog.date >= start_date,
-                    WorkLog.date <= end_date,
-                )
+            .outerjoin(Project, Project.id == WorkLog.project_id)
+            .where(team_worklog_filter)
+            .group_by(
+                WorkLog.project_id, Project.code, Project.name, Project.category
             )
-            .group_by(WorkLog.user_id, WorkLog.project_id)
-            .all()
+            .subquery()
         )
-
-        # Aggregate by project
-        project_hours: dict = {}
-        member_hours: dict = {}
-        for wl in team_worklogs:
-            project_hours[wl.project_id] = (
-                project_hours.get(wl.project_id, 0) + wl.total_hours
+        project_rank = ranked_projects.c.project_rank
+        bucket = case(
+            (project_rank <= TOP_PROJECTS, project_rank), else_=TOP_PROJECTS + 1
+        ).label("bucket")
+        is_functional = ranked_projects.c.category == "FUNCTIONAL"
+        project_buckets = self.db.execute(
+            select(
+                bucket,
+                # Single-project buckets: min() is just that project's value
+                func.min(ranked_projects.c.project_id).label("project_id"),
+                func.min(ranked_projects.c.code).label("code"),
+                func.min(ranked_projects.c.name).label("name"),
+                func.sum(ranked_projects.c.hours).label("hours"),
+                func.count().label("project_count"),
+                func.sum(case((is_functional, ranked_projects.c.hours), else_=0))
+                .label("functional_hours"),
+                func.sum(case((is_functional, 0), else_=ranked_projects.c.hours))
+                .label("project_hours"),
             )
-            member_hours[wl.user_id] = member_hours.get(wl.user_id, 0) + wl.total_hours
-
-        total_team_hours = sum(project_hours.values())
+            .group_by(bucket)
+            .order_by(bucket)
+        ).all()
+        member_hours = dict(
+            self.db.query(WorkLog.user_id, func.sum(WorkLog.hours))
+            .filter(team_worklog_filter)
+            .group_by(WorkLog.user_id)
+            .all()
+        )
 
-        # Get project details
-        project_ids = list(project_hours.keys())
-        projects_map = {}
-        if project_ids:
-            projects = self.db.query(Project).filter(Project.id.in_(project_ids)).all()
-            projects_map = {
-                p.id: {"code": p.code, "name": p.name, "category": p.category}
-                for p in projects
-            }
+        total_team_hours = sum(member_hours.values())
 
         # Build project summary (top 5 + others)
-        sorted_projects = sorted(
-            project_hours.items(), key=lambda x: x[1], reverse=True
-        )
         project_summary = []
-        for pid, hours in sorted_projects[:5]:
-            proj = projects_map.get(pid, {})
-            project_summary.append(
-                {
-                    "project_id": pid,
-                    "project_code": proj.get("code", ""),
-                    "project_name": proj.get("name", ""),
-                    "hours": float(hours),
-                }
-            )
-        if len(sorted_projects) > 5:
-            other_hours = sum(h for _, h in sorted_projects[5:])
-            project_summary.append(
-                {
-                    "project_id": "others",
-                    "project_code": "기타",
-                    "project_name": f"{len(sorted_projects) - 5}개 프로젝트",
-                    "hours": float(other_hours),
-                }
-            )
-
-        # Project vs Functional ratio
+        # Project vs Functional ratio (hours without a project count as Project)
         project_func_ratio = {"Project": 0.0, "Functional": 0.0}
-        for pid, hours in project_hours.items():
-            cat = projects_map.get(pid, {}).get("category", "PROJECT")
-            if cat == "FUNCTIONAL":
-                project_func_ratio["Functional"] += hours
+        for b in project_buckets:
+            if b.bucket <= TOP_PROJECTS:
+                has_project = b.project_id is not None
+                project_summary.append(
+                    {
+                        "project_id": b.project_id,
+                        "project_code": b.code if has_project else "",
+                        "project_name": b.name if has_project else "",
+                        "hours": float(b.hours),
+                    }
+                )
             else:
-                project_func_ratio["Project"] += hours
+                project_summary.append(
+                    {
+                        "project_id": "others",
+                        "project_code": "기타",
+                        "project_name": f"{b.project_count}개 프로젝트",
+                        "hours": float(b.hours),
+                    }
+                )
+            project_func_ratio["Functional"] += b.functional_hours
+            project_func_ratio["Project"] += b.project_hours
 
         # Member contributions
         member_contributions = []
@@ -335,73 +447,44 @@ class DashboardService:
             )
         member_contributions.sort(key=lambda x: x["hours"], reverse=True)
 
-        # Sub-organization contributions (for department/business_unit scopes)
+        # Sub-organization contributions (sub_teams for department scope,
+        # departments for business_unit scope)
+        members_by_sub_team: dict = defaultdict(list)
+        for member in team_members:
+            members_by_sub_team[member.sub_team_id].append(member.id)
+
         sub_org_contributions = []
-        if scope == "department" and user_department_id:
-            # Show sub_team breakdown for department scope
-            sub_teams = (
-                self.db.query(SubTeam)
-                .filter(SubTeam.department_id == user_department_id)
-                .all()
-            )
-            for st in sub_teams:
-                st_member_ids = [m.id for m in team_members if m.sub_team_id == st.id]
-                st_hours = sum(member_hours.get(mid, 0) for mid in st_member_ids)
-                sub_org_contributions.append(
-                    {
-                        "org_id": st.id,
-                        "org_name": st.name,
-                        "org_code": st.code,
-                        "member_count": len(st_member_ids),
-                        "hours": float(st_hours),
-                        "percentage": (
-                            round((st_hours / total_team_hours) * 100, 1)
-                            if total_team_hours > 0
-                            else 0
-                        ),
-                    }
-                )
-            sub_org_contributions.sort(key=lambda x: x["hours"], reverse=True)
-        elif scope == "business_unit" and user_department:
-            # Show department breakdown for business_unit scope
-            departments = (
-                self.db.query(Department)
-                .filter(Department.division_id == user_department.division_id)
-                .all()
+        for org in sub_orgs:
+            org_member_ids = [
+                mid
+                for st_id in org["sub_team_ids"]
+                for mid in members_by_sub_team.get(st_id, ())
+            ]
+            org_hours = sum(member_hours.get(mid, 0) for mid in org_member_ids)
+            sub_org_contributions.append(
+                {
+                    "org_id": org["id"],
+                    "org_name": org["name"],
+                    "org_code": org["code"],
+                    "member_count": len(org_member_ids),
+                    "hours": float(org_hours),
+                    "percentage": (
+                        round((org_hours / total_team_hours) * 100, 1)
+                        if total_team_hours > 0
+                        else 0
+                    ),
+                }
             )
-            for dept in departments:
-                # Get sub_teams for this department
-                dept_sub_team_ids = [
-                    st.id
-                    for st in self.db.query(SubTeam)
-                    .filter(SubTeam.department_id == dept.id)
-                    .all()
-                ]
-                dept_member_ids = [
-                    m.id for m in team_members if m.sub_team_id in dept_sub_team_ids
-                ]
-                dept_hours = sum(member_hours.get(mid, 0) for mid in dept_member_ids)
-                sub_org_contributions.append(
-                    {
-                        "org_id": dept.id,
-                        "org_name": dept.name,
-                        "org_code": dept.code,
-                        "member_count": len(dept_member_ids),
-                        "hours": float(dept_hours),
-                        "percentage": (
-                            round((dept_hours / total_team_hours) * 100, 1)
-                            if total_team_hours > 0
-                            else 0
-                        ),
-                    }
-                )
-            sub_org_contributions.sort(key=lambda x: x["hours"], reverse=True)
+        sub_org_contributions.sort(key=lambda x: x["hours"], reverse=True)
 
-        # Team resource allocation (current month)
+        # Team resource allocation (current month), aggregated in SQL
         current_month = today.month
         current_year = today.year
-        team_resource_plans = (
-            self.db.query(ResourcePlan)
+        total_planned_fte, active_projects = (
+            self.db.query(
+                func.coalesce(func.sum(ResourcePlan.planned_hours), 0.0),
+                func.count(func.distinct(ResourcePlan.project_id)),
+            )
             .filter(
                 and_(
                     ResourcePlan.user_id.in_(team_member_ids),
@@ -409,10 +492,8 @@ class DashboardService:
                     ResourcePlan.month == current_month,
                 )
             )
-            .all()
+            .one()
         )
-        total_planned_fte = sum(p.planned_hours for p in team_resource_plans)
-        active_projects = len(set(p.project_id for p in team_resource_plans))
 
         # Organization hierarchy path
         org_path = []
@@ -423,14 +504,14 @@ class DashboardService:
         if user.sub_team:
             org_path.append(user.sub_team.name)
 
-        # Upper organization comparison (entire Engineering)
-        all_users = self.db.query(User).filter(User.is_active == True).all()
-        all_user_ids = [u.id for u in all_users]
+        # Upper organization comparison (entire Engineering): active users
+        # are joined in SQL rather than fetched to build an IN list
         org_total_hours = (
             self.db.query(func.sum(WorkLog.hours))
+            .join(User, User.id == WorkLog.user_id)
             .filter(
                 and_(
-                    WorkLog.user_id.in_(all_user_ids),
+                    User.is_active == True,
                     WorkLog.date >= start_date,
                     WorkLog.date <= end_date,
                 )
@@ -11,15 +11,56 @@ Power BI Tables → PostgreSQL Tables:
 - tb_worklog → worklogs
 """
 
-import uuid
 from datetime import datetime, date
-from typing import Dict, Any, Optional, List, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Any,
+    Iterable,
+    Optional,
+    List,
+    Sequence,
+    TextIO,
+    Tuple,
+)
 from dataclasses import dataclass, field
 
+from app.models.user import generate_uuid  # time-ordered UUIDv7, as the models
 
-def generate_uuid() -> str:
-    """Generate a new UUID string."""
-    return str(uuid.uuid4())
+if TYPE_CHECKING:
+    from pandas import DataFrame, Series
+
+
+# PostgreSQL COPY text format: backslash escapes, \N for NULL
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value: Any) -> str:
+    """Format one value as a COPY text-format field."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def write_copy_rows(
+    rows: Iterable[Dict[str, Any]], columns: Sequence[str], out: TextIO
+) -> int:
+    """
+    Write transformed rows to out in PostgreSQL COPY text format.
+
+    One tab-separated line per row with the given columns in order, ready
+    for "COPY table (columns) FROM STDIN". Returns the number of rows written.
+    """
+    count = 0
+    for row in rows:
+        out.write("\t".join(_copy_value(row.get(column)) for column in columns))
+        out.write("\n")
+        count += 1
+    return count
 
 
 @dataclass
@@ -92,82 +133,100 @@ class FieldMapper:
         return mappings.get(entity_type, {})
 
 
-class ValueTransformer:
-    """Transforms individual field values."""
+# Field value parsers. Plain module functions: the row transforms call them
+# several times per row, and a global lookup is cheaper than a class attribute.
 
-    @staticmethod
-    def clean_string(value: Any) -> Optional[str]:
-        """Clean and normalize string value."""
-        if value is None:
-            return None
-        value = str(value).strip()
-        return value if value else None
-
-    @staticmethod
-    def parse_bool(value: Any) -> bool:
-        """Parse boolean from various formats."""
-        if value is None:
-            return False
-        if isinstance(value, bool):
-            return value
-        return str(value).strip().upper() in ("TRUE", "1", "YES", "Y")
-
-    @staticmethod
-    def parse_float(value: Any, default: float = 0.0) -> float:
-        """Parse float value."""
-        if value is None:
-            return default
+BOOL_TRUE_VALUES = frozenset({"TRUE", "1", "YES", "Y"})
+
+# CSV/Power BI project status → database status (anything else: Prospective)
+PROJECT_STATUS_MAP = {
+    "WIP": "InProgress",
+    "Completed": "Completed",
+    "Hold": "OnHold",
+    "Forecast": "Prospective",
+    "Cancelled": "Cancelled",
+    "": "Prospective",
+}
+
+
+def clean_string(value: Any) -> Optional[str]:
+    """Clean and normalize string value."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value if value else None
+
+
+def clean_fields(
+    row: Dict[str, Any], keys: Sequence[str]
+) -> Tuple[Optional[str], ...]:
+    """clean_string of each key's value in row, in one pass over keys."""
+    get = row.get
+    return tuple(clean_string(get(key)) for key in keys)
+
+
+def parse_bool(value: Any) -> bool:
+    """Parse boolean from various formats."""
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().upper() in BOOL_TRUE_VALUES
+
+
+def parse_float(value: Any, default: float = 0.0) -> float:
+    """Parse float value."""
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """Parse date from various formats."""
+    if value is None:
+        return None
+    # datetime is a date subclass, so it is checked first
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    # Date part of "YYYY-MM-DD", "YYYY-MM-DD HH:MM:SS" or "YYYY-MM-DDTHH:MM:SS"
+    date_str = str(value).strip().split(" ", 1)[0].split("T", 1)[0]
+    if not date_str:
+        return None
+
+    # Zero-padded ISO dates (the common case) parse in C without strptime
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
         try:
-            return float(value)
-        except (ValueError, TypeError):
-            return default
-
-    @staticmethod
-    def parse_date(value: Any) -> Optional[date]:
-        """Parse date from various formats."""
-        if value is None:
+            return date.fromisoformat(date_str)
+        except ValueError:
             return None
-        if isinstance(value, date):
-            return value
-        if isinstance(value, datetime):
-            return value.date()
+    # Unpadded forms such as "2025-1-2"
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        return None
 
-        date_str = str(value).strip()
-        if not date_str:
-            return None
 
-        # Try various formats
-        formats = [
-            "%Y-%m-%d",
-            "%Y-%m-%d %H:%M:%S",
-            "%d/%m/%Y",
-            "%m/%d/%Y",
-            "%Y-%m-%dT%H:%M:%S",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str.split(" ")[0].split("T")[0], "%Y-%m-%d").date()
-            except ValueError:
-                continue
+def map_project_status(csv_status: Optional[str]) -> str:
+    """Map CSV status to database status."""
+    if csv_status is None:
+        return "Prospective"
+    return PROJECT_STATUS_MAP.get(csv_status.strip(), "Prospective")
 
-        return None
 
-    @staticmethod
-    def map_project_status(csv_status: Optional[str]) -> str:
-        """Map CSV status to database status."""
-        if csv_status is None:
-            return "Prospective"
-
-        status_map = {
-            "WIP": "InProgress",
-            "Completed": "Completed",
-            "Hold": "OnHold",
-            "Forecast": "Prospective",
-            "Cancelled": "Cancelled",
-            "": "Prospective",
-        }
-        return status_map.get(csv_status.strip(), "Prospective")
+class ValueTransformer:
+    """Transforms individual field values (namespace for the parsers above)."""
+
+    clean_string = staticmethod(clean_string)
+    parse_bool = staticmethod(parse_bool)
+    parse_float = staticmethod(parse_float)
+    parse_date = staticmethod(parse_date)
+    map_project_status = staticmethod(map_project_status)
 
 
 class LookupManager:
@@ -181,7 +240,8 @@ class LookupManager:
 
         # Name → ID mappings
         self.department_map: Dict[str, str] = {}
-        self.sub_team_map: Dict[str, str] = {}
+        # department → business area (None = any) → sub-team ID
+        self.sub_team_map: Dict[str, Dict[Optional[str], str]] = {}
         self.program_map: Dict[str, str] = {}
         self.project_type_map: Dict[str, str] = {}
         self.work_type_category_map: Dict[str, int] = {}  # legacy name → category_id
@@ -205,18 +265,22 @@ class LookupManager:
     def initialize_sub_team_map(self):
         """Initialize standard sub-team mappings."""
         self.sub_team_map = {
-            ("Software", "IntegratedSystem"): "ST_CTRL_SW_IS",
-            ("Software", "Abatement"): "ST_CTRL_SW_ABT",
-            ("Electrical", "IntegratedSystem"): "ST_CTRL_ELEC_IS",
-            ("Electrical", "Abatement"): "ST_CTRL_ELEC_ABT",
-            ("ETO Elec", None): "ST_ETO_ELEC",
-            ("Systems", "IntegratedSystem"): "ST_SYS_ENG",
-            ("Mechanical", "IntegratedSystem"): "ST_MECH_ENG",
-            ("NPI 1 Team", "Abatement"): "ST_NPI1",
-            ("DES", None): "ST_DES",
-            ("Lab Management", None): "ST_LAB",
-            ("Analysis Tech.", None): "ST_ANALYSIS",
-            ("RA", None): "ST_RA",
+            "Software": {
+                "IntegratedSystem": "ST_CTRL_SW_IS",
+                "Abatement": "ST_CTRL_SW_ABT",
+            },
+            "Electrical": {
+                "IntegratedSystem": "ST_CTRL_ELEC_IS",
+                "Abatement": "ST_CTRL_ELEC_ABT",
+            },
+            "ETO Elec": {None: "ST_ETO_ELEC"},
+            "Systems": {"IntegratedSystem": "ST_SYS_ENG"},
+            "Mechanical": {"IntegratedSystem": "ST_MECH_ENG"},
+            "NPI 1 Team": {"Abatement": "ST_NPI1"},
+            "DES": {None: "ST_DES"},
+            "Lab Management": {None: "ST_LAB"},
+            "Analysis Tech.": {None: "ST_ANALYSIS"},
+            "RA": {None: "ST_RA"},
         }
 
     def initialize_project_type_map(self):
@@ -238,14 +302,12 @@ class LookupManager:
         if not department:
             return None
 
-        # Try exact match with business area
-        result = self.sub_team_map.get((department, business_area))
-        if result:
-            return result
+        by_business_area = self.sub_team_map.get(department)
+        if not by_business_area:
+            return None
 
-        # Try match without business area
-        result = self.sub_team_map.get((department, None))
-        return result
+        # Exact match with business area, else the department-wide entry
+        return by_business_area.get(business_area) or by_business_area.get(None)
 
 
 class DataTransformer:
@@ -275,8 +337,25 @@ class DataTransformer:
         warnings = []
 
         # Extract and clean values
-        source_id = ValueTransformer.clean_string(row.get("Person.id"))
-        email = ValueTransformer.clean_string(row.get("email") or row.get("Person.email"))
+        (
+            source_id,
+            english_name,
+            person_english_name,
+            korean_name,
+            team,
+            dept_col,
+        ) = clean_fields(
+            row,
+            (
+                "Person.id",
+                "English Name",
+                "Person.EnglishName",
+                "KoreanName",
+                "Team",
+                "Department",
+            ),
+        )
+        email = clean_string(row.get("email") or row.get("Person.email"))
 
         if not email:
             return TransformResult(
@@ -296,27 +375,21 @@ class DataTransformer:
         self.lookup.seen_emails.add(email)
 
         # Get names
-        name = (
-            ValueTransformer.clean_string(row.get("English Name"))
-            or ValueTransformer.clean_string(row.get("Person.EnglishName"))
-            or ""
-        )
-        korean_name = ValueTransformer.clean_string(row.get("KoreanName")) or ""
+        name = english_name or person_english_name or ""
+        korean_name = korean_name or ""
 
         # Determine department
-        team = ValueTransformer.clean_string(row.get("Team", ""))
         department_id = self.lookup.department_map.get(team, "DEPT_CONTROL")
 
         if team and team not in self.lookup.department_map:
             warnings.append(f"Unknown team '{team}', defaulting to DEPT_CONTROL")
 
         # Determine sub-team
-        dept_col = ValueTransformer.clean_string(row.get("Department", ""))
-        business_area = ValueTransformer.clean_string(row.get("Buniness Area") or row.get("Business Area"))
+        business_area = clean_string(row.get("Buniness Area") or row.get("Business Area"))
         sub_team_id = self.lookup.get_sub_team_id(dept_col, business_area)
 
         # Parse active status
-        is_active = ValueTransformer.parse_bool(row.get("Enable?"))
+        is_active = parse_bool(row.get("Enable?"))
 
         # Generate UUID
         user_uuid = generate_uuid()
@@ -354,8 +427,30 @@ class DataTransformer:
         """
         warnings = []
 
-        source_id = ValueTransformer.clean_string(row.get("ID"))
-        name = ValueTransformer.clean_string(row.get("Project", ""))
+        (
+            source_id,
+            name,
+            io_code,
+            program_name,
+            complexity,
+            status,
+            customer,
+            product,
+            description,
+        ) = clean_fields(
+            row,
+            (
+                "ID",
+                "Project",
+                "IO",
+                "Program",
+                "Complexity",
+                "Status",
+                "Customer",
+                "Product",
+                "Description",
+            ),
+        )
 
         if not name:
             return TransformResult(
@@ -363,14 +458,6 @@ class DataTransformer:
                 error="Project missing name"
             )
 
-        io_code = ValueTransformer.clean_string(row.get("IO", ""))
-        program_name = ValueTransformer.clean_string(row.get("Program", ""))
-        complexity = ValueTransformer.clean_string(row.get("Complexity", ""))
-        status = ValueTransformer.clean_string(row.get("Status", ""))
-        customer = ValueTransformer.clean_string(row.get("Customer", ""))
-        product = ValueTransformer.clean_string(row.get("Product", ""))
-        description = ValueTransformer.clean_string(row.get("Description", ""))
-
         # Map program (need to lookup or use default)
         program_id = self.lookup.program_map.get(program_name, "PRG_UNKNOWN")
         if program_name and program_name not in self.lookup.program_map:
@@ -404,7 +491,7 @@ class DataTransformer:
                 "project_type_id": project_type_id,
                 "code": code,
                 "name": name[:300],  # Truncate if necessary
-                "status": ValueTransformer.map_project_status(status),
+                "status": map_project_status(status),
                 "customer": customer,
                 "product": product,
                 "description": description,
@@ -423,9 +510,9 @@ class DataTransformer:
             TransformResult with transformed worklog data
         """
         # Get foreign key references
-        csv_user_id = ValueTransformer.clean_string(row.get("Createdby.Id"))
-        csv_project_id = ValueTransformer.clean_string(row.get("Project.Id"))
-        csv_worktype_id = ValueTransformer.clean_string(row.get("Worktype.Id"))
+        csv_user_id = clean_string(row.get("Createdby.Id"))
+        csv_project_id = clean_string(row.get("Project.Id"))
+        csv_worktype_id = clean_string(row.get("Worktype.Id"))
 
         # Map to UUIDs
         user_id = self.lookup.user_id_map.get(csv_user_id)
@@ -444,7 +531,7 @@ class DataTransformer:
             )
 
         # Parse date
-        date_val = ValueTransformer.parse_date(row.get("Date"))
+        date_val = parse_date(row.get("Date"))
         if not date_val:
             return TransformResult(
                 success=False,
@@ -452,7 +539,7 @@ class DataTransformer:
             )
 
         # Parse hours
-        hours = ValueTransformer.parse_float(row.get("Hours", 0))
+        hours = parse_float(row.get("Hours", 0))
 
         # Get work type name from mapping
         work_type_name = self.lookup.worktype_map.get(csv_worktype_id, "Other")
@@ -460,9 +547,9 @@ class DataTransformer:
         # Get work type category ID (need lookup from DB)
         work_type_category_id = self.lookup.work_type_category_map.get(work_type_name)
 
-        description = ValueTransformer.clean_string(row.get("Title", ""))
-        is_sudden = ValueTransformer.parse_bool(row.get("SuddenWork?"))
-        is_trip = ValueTransformer.parse_bool(row.get("BusinessTrip"))
+        description = clean_string(row.get("Title", ""))
+        is_sudden = parse_bool(row.get("SuddenWork?"))
+        is_trip = parse_bool(row.get("BusinessTrip"))
 
         return TransformResult(
             success=True,
@@ -479,6 +566,91 @@ class DataTransformer:
             }
         )
 
+    def transform_worklogs_df(
+        self, df: "DataFrame"
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Transform a whole worklog table at once (column-wise).
+
+        Same rules and error messages as transform_worklog, applied as
+        pandas column operations instead of one Python call chain per row.
+        Used for the large worklog sync; users/projects stay row-wise.
+
+        Args:
+            df: Worklog table from Power BI/CSV (one column per source field)
+
+        Returns:
+            (worklog dicts shaped like transform_worklog's data, in row order;
+            error messages for rejected rows, in row order)
+        """
+        import pandas as pd
+
+        def column(name: str) -> "Series":
+            if name in df.columns:
+                return df[name]
+            return pd.Series(None, index=df.index, dtype="object")
+
+        def clean(name: str) -> "Series":
+            values = column(name).astype("string").str.strip()
+            return values.mask(values == "")
+
+        def as_bool(name: str) -> "Series":
+            values = column(name).astype("string").str.strip().str.upper()
+            return values.isin(BOOL_TRUE_VALUES).fillna(False).astype(bool)
+
+        def shown(values: "Series") -> "Series":
+            # str() of the source value, None for missing, as in the row path
+            return values.astype(object).where(values.notna(), None).map(str)
+
+        csv_user_id = clean("Createdby.Id")
+        csv_project_id = clean("Project.Id")
+        user_id = csv_user_id.map(self.lookup.user_id_map)
+        project_id = csv_project_id.map(self.lookup.project_id_map)
+
+        # Date part before any time component, like parse_date
+        date_text = clean("Date").str.split(" ").str[0].str.split("T").str[0]
+        dates = pd.to_datetime(date_text, format="%Y-%m-%d", errors="coerce").dt.date
+
+        work_type_name = (
+            clean("Worktype.Id").map(self.lookup.worktype_map).fillna("Other")
+        )
+        hours = pd.to_numeric(column("Hours"), errors="coerce").fillna(0.0)
+
+        transformed = pd.DataFrame(
+            {
+                "date": dates,
+                "user_id": user_id,
+                "project_id": project_id,
+                "work_type_category_id": work_type_name.map(
+                    self.lookup.work_type_category_map
+                ).astype("Int64"),
+                "_work_type_name": work_type_name,
+                "hours": hours.astype(float),
+                "description": clean("Title"),
+                "is_sudden_work": as_bool("SuddenWork?"),
+                "is_business_trip": as_bool("BusinessTrip"),
+            }
+        ).astype(object)
+        transformed = transformed.where(transformed.notna(), None)
+
+        # Checked in transform_worklog's order; a row reports its first failure
+        missing_user = user_id.isna()
+        missing_project = project_id.isna() & ~missing_user
+        bad_date = dates.isna() & ~missing_user & ~missing_project
+        valid = ~(missing_user | missing_project | bad_date)
+
+        errors = pd.Series(None, index=df.index, dtype="object")
+        errors[missing_user] = "Unknown user ID: " + shown(csv_user_id[missing_user])
+        errors[missing_project] = "Unknown project ID: " + shown(
+            csv_project_id[missing_project]
+        )
+        errors[bad_date] = "Invalid date: " + shown(column("Date")[bad_date])
+
+        return (
+            transformed[valid].to_dict("records"),
+            errors[~valid].tolist(),
+        )
+
     def transform_worktype(self, row: Dict[str, Any]) -> TransformResult:
         """
         Transform a worktype row and store in lookup.
@@ -489,8 +661,8 @@ class DataTransformer:
         Returns:
             TransformResult (worktype is just stored in lookup, not inserted)
         """
-        wt_id = ValueTransformer.clean_string(row.get("Id"))
-        title = ValueTransformer.clean_string(row.get("Title", ""))
+        wt_id = clean_string(row.get("Id"))
+        title = clean_string(row.get("Title", ""))
 
         if wt_id and title:
             self.lookup.worktype_map[wt_id] = title
@@ -4,9 +4,29 @@ Uses Google's Gemini 2.0 Flash model for fast inference.
 """
 
 import httpx
+import json
+import re
 from typing import Optional
 from app.core.config import settings
 
+# Try to import orjson for faster JSON encode/decode of LLM payloads
+# Falls back to the stdlib json module if not available
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+
+    def _json_dumps(obj) -> bytes:
+        # Same compact UTF-8 encoding httpx uses for json=
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+# Leading ```json / ``` fence and trailing ``` fence, if the model adds them
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
 
 class GeminiClient:
     """Async client for Google Gemini API."""
@@ -16,6 +36,24 @@ class GeminiClient:
         self.model = settings.GEMINI_MODEL
         self.api_key = settings.GEMINI_API_KEY
         self.timeout = settings.GEMINI_TIMEOUT
+        # One pooled HTTP client reused across calls, so TCP/TLS connections
+        # stay alive between requests; created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, (re)created if missing or closed."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def generate(
         self,
@@ -46,6 +84,8 @@ class GeminiClient:
                 "temperature": 0.1,  # Low temperature for consistent JSON output
                 "topP": 0.95,
                 "maxOutputTokens": 2048,
+                # Bare JSON without markdown fences (like Groq's json_object)
+                "responseMimeType": "application/json",
             },
         }
 
@@ -54,10 +94,11 @@ class GeminiClient:
             "X-goog-api-key": self.api_key,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(
+            url, content=_json_dumps(payload), headers=headers
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)
 
     async def generate_json(
         self,
@@ -74,8 +115,6 @@ class GeminiClient:
         Returns:
             Parsed JSON from the response
         """
-        import json
-
         result = await self.generate(prompt, system_prompt)
 
         # Extract text from Gemini response
@@ -84,19 +123,12 @@ class GeminiClient:
         except (KeyError, IndexError) as e:
             raise ValueError(f"Unexpected Gemini response format: {result}") from e
 
-        # Parse JSON from response
-        # Gemini may wrap JSON in markdown code blocks
-        text = text.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        if text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        text = text.strip()
+        # Parse JSON from response; responseMimeType already asks for bare
+        # JSON, the fence strip is a fallback
+        text = _FENCE_RE.sub("", text)
 
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse JSON from Gemini response: {text}") from e
 
@@ -112,17 +144,18 @@ class GeminiClient:
             url = f"{self.base_url}/models/{self.model}"
             headers = {"X-goog-api-key": self.api_key}
 
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                model_info = response.json()
-
-                return {
-                    "status": "ok",
-                    "available": True,
-                    "model": self.model,
-                    "display_name": model_info.get("displayName", self.model),
-                }
+            response = await self._get_client().get(
+                url, headers=headers, timeout=10
+            )
+            response.raise_for_status()
+            model_info = response.json()
+
+            return {
+                "status": "ok",
+                "available": True,
+                "model": self.model,
+                "display_name": model_info.get("displayName", self.model),
+            }
         except Exception as e:
             return {
                 "status": "error",
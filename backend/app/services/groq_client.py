@@ -5,9 +5,28 @@ Uses Groq's fast inference with Llama 70B model.
 
 import httpx
 import json
+import re
 from typing import Optional
 from app.core.config import settings
 
+# Try to import orjson for faster JSON encode/decode of LLM payloads
+# Falls back to the stdlib json module if not available
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+
+    def _json_dumps(obj) -> bytes:
+        # Same compact UTF-8 encoding httpx uses for json=
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+# Leading ```json / ``` fence and trailing ``` fence, if the model adds them
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
 
 class GroqClient:
     """Async client for Groq API (OpenAI-compatible)."""
@@ -17,6 +36,24 @@ class GroqClient:
         self.model = settings.GROQ_MODEL
         self.api_key = settings.GROQ_API_KEY
         self.timeout = settings.GROQ_TIMEOUT
+        # One pooled HTTP client reused across calls, so TCP/TLS connections
+        # stay alive between requests; created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, (re)created if missing or closed."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def generate(
         self,
@@ -53,10 +90,11 @@ class GroqClient:
             "Authorization": f"Bearer {self.api_key}",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(
+            url, content=_json_dumps(payload), headers=headers
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)
 
     async def generate_json(
         self,
@@ -86,17 +124,10 @@ class GroqClient:
             raise ValueError(f"Unexpected Groq response format: {result}") from e
 
         # Parse JSON from response
-        text = text.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        if text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        text = text.strip()
+        text = _FENCE_RE.sub("", text)
 
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse JSON from Groq response: {text}") from e
 
@@ -111,17 +142,18 @@ class GroqClient:
             url = f"{self.base_url}/models"
             headers = {"Authorization": f"Bearer {self.api_key}"}
 
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                models = response.json()
-
-                return {
-                    "status": "ok",
-                    "available": True,
-                    "model": self.model,
-                    "models_count": len(models.get("data", [])),
-                }
+            response = await self._get_client().get(
+                url, headers=headers, timeout=10
+            )
+            response.raise_for_status()
+            models = response.json()
+
+            return {
+                "status": "ok",
+                "available": True,
+                "model": self.model,
+                "models_count": len(models.get("data", [])),
+            }
         except Exception as e:
             return {
                 "status": "error",
@@ -387,12 +387,23 @@ WORKTYPE_ALIASES = {
 }
 
 
+# (keyword, code) pairs by descending priority, sorted once at import
+# (stable sort: equal priorities keep their list order)
+_PROJECT_KEYWORDS_BY_PRIORITY = tuple(
+    (kw, code)
+    for kw, code, _ in sorted(PROJECT_KEYWORD_MAPPINGS, key=lambda x: -x[2])
+)
+_WORKTYPE_KEYWORDS_BY_PRIORITY = tuple(
+    (kw, code)
+    for kw, code, _ in sorted(WORKTYPE_KEYWORD_MAPPINGS, key=lambda x: -x[2])
+)
+
+
 def get_project_code_by_keyword(keyword: str) -> str | None:
     """Get project code by matching keyword."""
     keyword_upper = keyword.upper()
-    sorted_mappings = sorted(PROJECT_KEYWORD_MAPPINGS, key=lambda x: -x[2])
 
-    for kw, code, _ in sorted_mappings:
+    for kw, code in _PROJECT_KEYWORDS_BY_PRIORITY:
         if kw in keyword_upper:
             return code
     return None
@@ -401,9 +412,8 @@ def get_project_code_by_keyword(keyword: str) -> str | None:
 def get_worktype_code_by_keyword(keyword: str) -> str | None:
     """Get work type code by matching keyword."""
     keyword_upper = keyword.upper()
-    sorted_mappings = sorted(WORKTYPE_KEYWORD_MAPPINGS, key=lambda x: -x[2])
 
-    for kw, code, _ in sorted_mappings:
+    for kw, code in _WORKTYPE_KEYWORDS_BY_PRIORITY:
         if kw in keyword_upper:
             return code
     return None
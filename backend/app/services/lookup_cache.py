@@ -0,0 +1,168 @@
+"""
+Process-wide cache for small lookup lists (active projects, work types)
+
+Service instances live for one request, so per-instance caches reload on
+every call. Entries here are shared across requests, expire after
+LOOKUP_CACHE_TTL_SECONDS and are dropped explicitly by the CRUD services
+when the underlying table changes.
+
+Each lookup carries a content version (a short hash of its id/code/name
+rows). AI system prompts are cached keyed on those versions, so a reload
+that returns the same rows keeps its cached prompt and an actual change
+(rename, new project) builds a new one. Raw AI parse results are cached per
+(user, normalized text); callers re-map them against the current lookups,
+so they survive lookup invalidation.
+
+Organization structure (the sub-teams of a department, the departments and
+sub-teams of a division) is cached per org id with the same TTL and dropped
+as a whole by the department/sub-team write endpoints.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from app.services.matching_service import ProjectMatchIndex, WorkTypeMatchIndex
+
+MatchIndex = Union[ProjectMatchIndex, WorkTypeMatchIndex]
+
+LOOKUP_CACHE_TTL_SECONDS = 300
+PROMPT_CACHE_MAX_ENTRIES = 1024
+AI_RESULT_CACHE_TTL_SECONDS = 3600
+AI_RESULT_CACHE_MAX_ENTRIES = 1024
+ORG_STRUCTURE_CACHE_MAX_ENTRIES = 256
+
+PROJECTS = "projects"
+WORK_TYPES = "work_types"
+
+
+@dataclass(frozen=True, slots=True)
+class Lookup:
+    """A cached lookup list together with the indexes derived from it."""
+
+    items: List[Dict[str, Any]]
+    by_id: Dict[Any, Dict[str, Any]]
+    by_code: Dict[str, Dict[str, Any]]
+    version: str
+    match_index: Optional[MatchIndex] = None
+
+
+_lookup_cache: Dict[str, Tuple[float, Lookup]] = {}
+_prompt_cache: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()
+_ai_result_cache: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_org_structure_cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+
+def _get_fresh(
+    cache: Dict[Hashable, Tuple[float, Any]], key: Hashable, ttl: float
+) -> Any:
+    """Value cached under key, or None if missing or older than ttl seconds."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at > ttl:
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def _store_bounded(
+    cache: "OrderedDict[Hashable, Tuple[float, Any]]",
+    key: Hashable,
+    value: Any,
+    max_entries: int,
+) -> None:
+    """Cache value under key, evicting the oldest entry when full."""
+    cache[key] = (time.monotonic(), value)
+    cache.move_to_end(key)
+    if len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+def _content_version(items: List[Dict[str, Any]]) -> str:
+    """Short hash of the id/code/name rows, stable until the content changes."""
+    digest = hashlib.md5()
+    for item in items:
+        digest.update(f"{item['id']}:{item.get('code')}:{item.get('name')}\n".encode())
+    return digest.hexdigest()[:8]
+
+
+def get_lookup(key: str) -> Optional[Lookup]:
+    """Cached lookup for key, or None if missing or expired."""
+    return _get_fresh(_lookup_cache, key, LOOKUP_CACHE_TTL_SECONDS)
+
+
+def store_lookup(
+    key: str,
+    items: List[Dict[str, Any]],
+    match_index: Optional[Callable[[List[Dict[str, Any]]], MatchIndex]] = None,
+) -> Lookup:
+    """
+    Cache items (dicts with id/code/name) and their derived indexes.
+
+    match_index is the fuzzy-match index class to build over items, if any.
+    """
+    lookup = Lookup(
+        items=items,
+        by_id={item["id"]: item for item in items},
+        by_code={item["code"]: item for item in items if item.get("code")},
+        version=_content_version(items),
+        match_index=match_index(items) if match_index else None,
+    )
+    _lookup_cache[key] = (time.monotonic(), lookup)
+    return lookup
+
+
+def get_prompt(key: Hashable) -> Optional[str]:
+    """Cached system prompt for key, or None if missing or expired."""
+    return _get_fresh(_prompt_cache, key, LOOKUP_CACHE_TTL_SECONDS)
+
+
+def store_prompt(key: Hashable, prompt: str) -> str:
+    """Cache a built system prompt, evicting the oldest entry when full."""
+    _store_bounded(_prompt_cache, key, prompt, PROMPT_CACHE_MAX_ENTRIES)
+    return prompt
+
+
+def get_ai_result(key: Hashable) -> Optional[Dict[str, Any]]:
+    """Cached raw AI parse result for key, or None if missing or expired."""
+    return _get_fresh(_ai_result_cache, key, AI_RESULT_CACHE_TTL_SECONDS)
+
+
+def store_ai_result(key: Hashable, result: Dict[str, Any]) -> None:
+    """Cache a raw AI parse result, evicting the oldest entry when full."""
+    _store_bounded(_ai_result_cache, key, result, AI_RESULT_CACHE_MAX_ENTRIES)
+
+
+def get_org_structure(key: Hashable) -> Any:
+    """Cached organization structure for key, or None if missing or expired."""
+    return _get_fresh(_org_structure_cache, key, LOOKUP_CACHE_TTL_SECONDS)
+
+
+def store_org_structure(key: Hashable, structure: Any) -> Any:
+    """Cache an organization structure, evicting the oldest entry when full."""
+    _store_bounded(
+        _org_structure_cache, key, structure, ORG_STRUCTURE_CACHE_MAX_ENTRIES
+    )
+    return structure
+
+
+def invalidate_org_structure() -> None:
+    """Drop all cached organization structures after a department/sub-team write."""
+    _org_structure_cache.clear()
+
+
+def invalidate_lookup(key: str) -> None:
+    """Drop one cached lookup after a write; prompts are keyed on its version."""
+    _lookup_cache.pop(key, None)
+
+
+def clear_lookup_cache() -> None:
+    """Drop all cached lookups, prompts, AI results and org structures."""
+    _lookup_cache.clear()
+    _prompt_cache.clear()
+    _ai_result_cache.clear()
+    _org_structure_cache.clear()
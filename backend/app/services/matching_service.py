@@ -8,7 +8,7 @@ Provides multi-stage matching for projects and work types:
 4. Fuzzy similarity matching (confidence=score*0.7)
 """
 
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Union
 
 # Try to import jellyfish for advanced string similarity
 # Falls back to basic implementation if not available
@@ -19,6 +19,141 @@ except ImportError:
     HAS_JELLYFISH = False
 
 
+class ProjectMatchIndex:
+    """
+    Project list with the case-folded fields match_project compares against.
+
+    Build once per candidate list and reuse it for every search term, so
+    lowercasing/uppercasing happens P times instead of P times per lookup.
+    Order is preserved: earlier projects win ties, as with a plain list.
+    """
+
+    __slots__ = ("entries", "_by_id", "_by_prefix8", "_short_ids")
+
+    def __init__(self, projects: List[Dict[str, Any]]):
+        # (project, id_lower, code_lower, name_lower, name_upper)
+        self.entries: List[Tuple[Dict[str, Any], str, str, str, str]] = []
+        # Lowercased ID / 8-char ID prefix -> position of first project with it.
+        # IDs shorter than 8 chars can only match as a prefix of the search term.
+        self._by_id: Dict[str, int] = {}
+        self._by_prefix8: Dict[str, int] = {}
+        self._short_ids: Dict[str, int] = {}
+
+        for proj in projects:
+            name = proj.get("name", "")
+            self._append(
+                (
+                    proj,
+                    proj.get("id", "").lower(),
+                    (proj.get("code") or "").lower(),
+                    name.lower(),
+                    name.upper(),
+                )
+            )
+
+    def _append(self, entry: Tuple[Dict[str, Any], str, str, str, str]) -> None:
+        pos = len(self.entries)
+        self.entries.append(entry)
+        id_lower = entry[1]
+        self._by_id.setdefault(id_lower, pos)
+        if len(id_lower) >= 8:
+            self._by_prefix8.setdefault(id_lower[:8], pos)
+        else:
+            self._short_ids.setdefault(id_lower, pos)
+
+    def prioritized(self, first: List[Dict[str, Any]]) -> "ProjectMatchIndex":
+        """
+        New index ordered as `first`, then the remaining projects of this one.
+
+        Case-folded fields of projects already in this index are reused, so a
+        cached index can be re-ranked per user without folding every name again.
+        """
+        folded = {entry[0].get("id"): entry for entry in self.entries}
+        head = ProjectMatchIndex(
+            [proj for proj in first if proj.get("id") not in folded]
+        ).entries
+        head_ids = {proj.get("id") for proj in first}
+
+        index = ProjectMatchIndex([])
+        for proj in first:
+            index._append(folded.get(proj.get("id")) or head.pop(0))
+        for entry in self.entries:
+            if entry[0].get("id") not in head_ids:
+                index._append(entry)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def match_id(
+        self, search_term: str, search_lower: str
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        ID stage of match_project: exact ID (1.0) or 8-char prefix (0.98).
+
+        Same result as scanning the list in order, using at most 9 dict
+        lookups instead of comparing against every project ID.
+        """
+        exact = self._by_id.get(search_lower)
+        if len(search_term) < 8:
+            return (self.entries[exact][0], 1.0) if exact is not None else None
+        if len(search_lower) < 8:
+            # Only reachable when surrounding whitespace was stripped
+            return self._scan_id(search_lower)
+
+        # Earliest project whose ID shares the search term's 8-char prefix
+        positions = [self._by_prefix8.get(search_lower[:8])]
+        positions.extend(self._short_ids.get(search_lower[:k]) for k in range(8))
+        prefix = min((pos for pos in positions if pos is not None), default=None)
+
+        if exact is not None and (prefix is None or exact <= prefix):
+            return (self.entries[exact][0], 1.0)
+        if prefix is not None:
+            return (self.entries[prefix][0], 0.98)
+        return None
+
+    def _scan_id(self, search_lower: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        for proj, id_lower, _, _, _ in self.entries:
+            if id_lower == search_lower:
+                return (proj, 1.0)
+            if id_lower.startswith(search_lower[:8]):
+                return (proj, 0.98)
+            if search_lower.startswith(id_lower[:8]):
+                return (proj, 0.98)
+        return None
+
+
+class WorkTypeMatchIndex:
+    """
+    Work type list with the case-folded fields match_work_type compares against.
+
+    The work type counterpart of ProjectMatchIndex: build once per list and
+    reuse it for every search term. Order is preserved.
+    """
+
+    __slots__ = ("entries",)
+
+    def __init__(self, work_types: List[Dict[str, Any]]):
+        # (work_type, id_str, id_lower, code_lower, code_upper, name_upper)
+        self.entries: List[Tuple[Dict[str, Any], str, str, str, str, str]] = []
+        for wt in work_types:
+            wt_id = str(wt.get("id", ""))
+            code = wt.get("code") or ""
+            self.entries.append(
+                (
+                    wt,
+                    wt_id,
+                    wt_id.lower(),
+                    code.lower(),
+                    code.upper(),
+                    wt.get("name", "").upper(),
+                )
+            )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
 class FuzzyMatcher:
     """
     Multi-stage fuzzy matcher for projects and work types.
@@ -45,6 +180,14 @@ class FuzzyMatcher:
         s1_lower = s1.lower()
         s2_lower = s2.lower()
 
+        return FuzzyMatcher._jaro_winkler_lower(s1_lower, s2_lower)
+
+    @staticmethod
+    def _jaro_winkler_lower(s1_lower: str, s2_lower: str) -> float:
+        """jaro_winkler for inputs that are already lowercased."""
+        if not s1_lower or not s2_lower:
+            return 0.0
+
         if s1_lower == s2_lower:
             return 1.0
 
@@ -103,7 +246,7 @@ class FuzzyMatcher:
     def match_project(
         self,
         search_term: str,
-        projects: List[Dict[str, Any]],
+        projects: Union[List[Dict[str, Any]], ProjectMatchIndex],
         threshold: float = 0.6,
     ) -> Optional[Tuple[Dict[str, Any], float]]:
         """
@@ -117,7 +260,8 @@ class FuzzyMatcher:
 
         Args:
             search_term: Project ID, code, or name to search for
-            projects: List of project dicts with id, code, name
+            projects: List of project dicts with id, code, name, or a
+                ProjectMatchIndex built from one (reuse it across lookups)
             threshold: Minimum confidence threshold for fuzzy matching
 
         Returns:
@@ -126,26 +270,21 @@ class FuzzyMatcher:
         if not search_term or not projects:
             return None
 
+        if not isinstance(projects, ProjectMatchIndex):
+            projects = ProjectMatchIndex(projects)
+        entries = projects.entries
+
         search_lower = search_term.lower().strip()
         search_upper = search_term.upper().strip()
 
-        # Stage 1: Exact ID match
-        for proj in projects:
-            proj_id = proj.get("id", "")
-            if proj_id.lower() == search_lower:
-                return (proj, 1.0)
-            # Check 8-char prefix match (truncated UUID)
-            if len(search_term) >= 8:
-                if proj_id.lower().startswith(search_lower[:8]):
-                    return (proj, 0.98)
-                if search_lower.startswith(proj_id.lower()[:8]):
-                    return (proj, 0.98)
+        # Stage 1: Exact ID match, or 8-char prefix match (truncated UUID)
+        id_match = projects.match_id(search_term, search_lower)
+        if id_match:
+            return id_match
 
         # Stage 2: Code match
-        for proj in projects:
-            code = proj.get("code", "")
-            if code:
-                code_lower = code.lower()
+        for proj, _, code_lower, _, _ in entries:
+            if code_lower:
                 if code_lower == search_lower:
                     return (proj, 0.95)
                 # Prefix match for codes
@@ -153,28 +292,26 @@ class FuzzyMatcher:
                     return (proj, 0.9)
 
         # Stage 3: Name containment (case-insensitive)
-        for proj in projects:
-            name = proj.get("name", "")
-            name_upper = name.upper()
+        for proj, _, _, name_lower, name_upper in entries:
             # Check if search term is contained in name or vice versa
             if search_upper in name_upper:
                 return (proj, 0.8)
-            if name_upper in search_upper and len(name) >= 3:
+            if name_upper in search_upper and len(name_lower) >= 3:
                 return (proj, 0.75)
 
         # Stage 4: Fuzzy similarity matching
         best_match = None
         best_score = 0.0
+        term_lower = search_term.lower()
 
-        for proj in projects:
-            name = proj.get("name", "")
-            code = proj.get("code", "")
-
+        for proj, _, code_lower, name_lower, _ in entries:
             # Try matching against name
-            name_score = self.jaro_winkler(search_term, name)
+            name_score = self._jaro_winkler_lower(term_lower, name_lower)
 
             # Try matching against code
-            code_score = self.jaro_winkler(search_term, code) if code else 0.0
+            code_score = (
+                self._jaro_winkler_lower(term_lower, code_lower) if code_lower else 0.0
+            )
 
             # Take the best score
             score = max(name_score, code_score)
@@ -193,7 +330,7 @@ class FuzzyMatcher:
     def match_work_type(
         self,
         search_term: str,
-        work_types: List[Dict[str, Any]],
+        work_types: Union[List[Dict[str, Any]], WorkTypeMatchIndex],
         threshold: float = 0.5,
     ) -> Optional[Tuple[Dict[str, Any], float]]:
         """
@@ -208,7 +345,8 @@ class FuzzyMatcher:
 
         Args:
             search_term: Work type ID, code, or name to search for
-            work_types: List of work type dicts with id, code, name, name_ko
+            work_types: List of work type dicts with id, code, name, name_ko,
+                or a WorkTypeMatchIndex built from one (reuse it across lookups)
             threshold: Minimum confidence threshold for fuzzy matching
 
         Returns:
@@ -217,21 +355,21 @@ class FuzzyMatcher:
         if not search_term or not work_types:
             return None
 
+        if not isinstance(work_types, WorkTypeMatchIndex):
+            work_types = WorkTypeMatchIndex(work_types)
+        entries = work_types.entries
+
         search_lower = search_term.lower().strip()
         search_upper = search_term.upper().strip()
 
         # Stage 1: Exact ID match
-        for wt in work_types:
-            wt_id = str(wt.get("id", ""))
-            if wt_id.lower() == search_lower or wt_id == search_term:
+        for wt, wt_id, id_lower, _, _, _ in entries:
+            if id_lower == search_lower or wt_id == search_term:
                 return (wt, 1.0)
 
         # Stage 2: Code match
-        for wt in work_types:
-            code = wt.get("code", "")
-            if code:
-                code_lower = code.lower()
-                code_upper = code.upper()
+        for wt, _, _, code_lower, code_upper, _ in entries:
+            if code_lower:
                 if code_lower == search_lower or code_upper == search_upper:
                     return (wt, 0.95)
                 # Partial code match (e.g., "ENG-DES" matches "ENG-DES-REV")
@@ -239,16 +377,14 @@ class FuzzyMatcher:
                     return (wt, 0.9)
 
         # Stage 3: English name containment
-        for wt in work_types:
-            name = wt.get("name", "")
-            name_upper = name.upper()
+        for wt, _, _, _, _, name_upper in entries:
             if search_upper in name_upper:
                 return (wt, 0.8)
-            if name_upper in search_upper and len(name) >= 3:
+            if name_upper in search_upper and len(wt.get("name", "")) >= 3:
                 return (wt, 0.75)
 
         # Stage 4: Korean name containment
-        for wt in work_types:
+        for wt, *_ in entries:
             name_ko = wt.get("name_ko", "")
             if name_ko:
                 if search_term in name_ko or name_ko in search_term:
@@ -258,7 +394,7 @@ class FuzzyMatcher:
         best_match = None
         best_score = 0.0
 
-        for wt in work_types:
+        for wt, *_ in entries:
             name = wt.get("name", "")
             code = wt.get("code", "")
             name_ko = wt.get("name_ko", "")
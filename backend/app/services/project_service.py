@@ -3,7 +3,7 @@ Service layer for project-related business logic
 """
 
 from typing import List, Optional, Any
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 from sqlalchemy.exc import IntegrityError
 import uuid
 from datetime import datetime, timedelta
@@ -19,15 +19,42 @@ from app.models.project import (
 from app.models.resource import WorkLog, ResourcePlan
 from app.models.user import User
 from app.models.organization import BusinessUnit as BusinessUnitModel
+from app.services.lookup_cache import PROJECTS, invalidate_lookup
 from app.schemas.project import (
     MilestoneCreate,
     MilestoneUpdate,
     ProductLineCreate,
     ProductLineUpdate,
+    Project as ProjectSchema,
+    ProjectBase,
     ProjectCreate,
     ProjectUpdate,
 )
 
+# Second-level relationships read by the nested Program/ProductLine schemas
+_NESTED_LOADS = {
+    "program": ProgramModel.business_unit,
+    "product_line": ProductLineModel.business_unit,
+}
+
+
+def project_load_options() -> list:
+    """
+    Loader options for every relationship the Project response schema reads.
+
+    Driven by ProjectSchema.REQUIRED_LOADS so the schema and the queries that
+    feed it cannot drift apart. Works both as top-level query options and as
+    sub-options, e.g. joinedload(WorkLog.project).options(*project_load_options()).
+    """
+    options = []
+    for name in ProjectSchema.REQUIRED_LOADS:
+        loader = joinedload(getattr(Project, name))
+        nested = _NESTED_LOADS.get(name)
+        if nested is not None:
+            loader = loader.joinedload(nested)
+        options.append(loader)
+    return options
+
 
 class ProjectService:
     def __init__(self, db: Session):
@@ -47,6 +74,44 @@ class ProjectService:
             .first()
         )
 
+    def _recent_activity_subquery(self):
+        """Hours logged per project over the last 30 days."""
+        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+        return (
+            self.db.query(
+                WorkLog.project_id, func.sum(WorkLog.hours).label("activity_score")
+            )
+            .filter(WorkLog.date >= thirty_days_ago.date())
+            .group_by(WorkLog.project_id)
+            .subquery()
+        )
+
+    @staticmethod
+    def _apply_list_params(
+        query,
+        *,
+        skip: int,
+        limit: int,
+        program_id: Optional[str],
+        project_type_id: Optional[str],
+        status: Optional[str],
+        sort_by: Optional[str],
+    ):
+        """Filters, sort and pagination shared by the project list queries."""
+        if program_id:
+            query = query.filter(Project.program_id == program_id)
+        if project_type_id:
+            query = query.filter(Project.project_type_id == project_type_id)
+        if status:
+            query = query.filter(Project.status == status)
+
+        if sort_by == "activity":
+            query = query.order_by(desc("recent_activity_score"))
+        else:
+            query = query.order_by(Project.code)
+
+        return query.offset(skip).limit(limit)
+
     def get_multi(
         self,
         *,
@@ -58,18 +123,7 @@ class ProjectService:
         sort_by: Optional[str] = None,
     ) -> List[Project]:
         """Retrieve multiple projects with filters and pagination."""
-        # Subquery for calculating recent activity (last 30 days)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-
-        # Determine the activity score
-        activity_subquery = (
-            self.db.query(
-                WorkLog.project_id, func.sum(WorkLog.hours).label("activity_score")
-            )
-            .filter(WorkLog.date >= thirty_days_ago.date())
-            .group_by(WorkLog.project_id)
-            .subquery()
-        )
+        activity_subquery = self._recent_activity_subquery()
 
         query = (
             self.db.query(
@@ -79,27 +133,20 @@ class ProjectService:
                 ),
             )
             .outerjoin(activity_subquery, Project.id == activity_subquery.c.project_id)
-            .options(
-                joinedload(Project.program).joinedload(ProgramModel.business_unit),
-                joinedload(Project.project_type),
-                joinedload(Project.product_line).joinedload(ProductLineModel.business_unit),
-                joinedload(Project.pm),
-            )
+            # Any relationship outside the schema contract raises instead of
+            # silently issuing one SELECT per row during serialization
+            .options(*project_load_options(), raiseload("*"))
         )
 
-        if program_id:
-            query = query.filter(Project.program_id == program_id)
-        if project_type_id:
-            query = query.filter(Project.project_type_id == project_type_id)
-        if status:
-            query = query.filter(Project.status == status)
-
-        if sort_by == "activity":
-            query = query.order_by(desc("recent_activity_score"))
-        else:
-            query = query.order_by(Project.code)
-
-        results = query.offset(skip).limit(limit).all()
+        results = self._apply_list_params(
+            query,
+            skip=skip,
+            limit=limit,
+            program_id=program_id,
+            project_type_id=project_type_id,
+            status=status,
+            sort_by=sort_by,
+        ).all()
 
         # Transform results to populate the Pydantic model field
         projects = []
@@ -109,6 +156,54 @@ class ProjectService:
 
         return projects
 
+    def get_multi_flat(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        program_id: Optional[str] = None,
+        project_type_id: Optional[str] = None,
+        status: Optional[str] = None,
+        sort_by: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Retrieve projects as flat list rows in a single JOIN query.
+
+        Only scalar columns are selected (no ORM entities) and rows are
+        returned as plain dicts keyed like ProjectListItem, so the response
+        model validates each row once.
+        """
+        activity_subquery = self._recent_activity_subquery()
+
+        query = (
+            self.db.query(
+                Project.id,
+                *(getattr(Project, field) for field in ProjectBase.model_fields),
+                ProgramModel.name.label("program_name"),
+                ProjectTypeModel.name.label("project_type_name"),
+                User.name.label("pm_name"),
+                User.email.label("pm_email"),
+                func.coalesce(activity_subquery.c.activity_score, 0).label(
+                    "recent_activity_score"
+                ),
+            )
+            .outerjoin(ProgramModel, Project.program_id == ProgramModel.id)
+            .outerjoin(ProjectTypeModel, Project.project_type_id == ProjectTypeModel.id)
+            .outerjoin(User, Project.pm_id == User.id)
+            .outerjoin(activity_subquery, Project.id == activity_subquery.c.project_id)
+        )
+
+        rows = self._apply_list_params(
+            query,
+            skip=skip,
+            limit=limit,
+            program_id=program_id,
+            project_type_id=project_type_id,
+            status=status,
+            sort_by=sort_by,
+        ).all()
+        return [dict(row._mapping) for row in rows]
+
     def create_project(self, project_in: ProjectCreate) -> Project:
         """Create a new project."""
         project_data = project_in.model_dump()
@@ -136,6 +231,7 @@ class ProjectService:
         self.db.add(db_project)
         self.db.commit()
         self.db.refresh(db_project)
+        invalidate_lookup(PROJECTS)
         return db_project
 
     def update_project(
@@ -158,6 +254,7 @@ class ProjectService:
             self.db.rollback()
             raise ValueError("Duplicate project code or other integrity violation.")
 
+        invalidate_lookup(PROJECTS)
         return db_project
 
     def delete_project(self, project_id: str) -> Optional[Project]:
@@ -168,6 +265,7 @@ class ProjectService:
 
         self.db.delete(db_project)
         self.db.commit()
+        invalidate_lookup(PROJECTS)
         return db_project
 
     # ============ Milestone Methods ============
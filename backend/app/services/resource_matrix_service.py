@@ -3,19 +3,20 @@ Service for Resource Allocation Matrix
 """
 
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Iterator, Optional, List
 from collections import defaultdict
-from sqlalchemy.orm import Session
+from pydantic_core import to_json
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_
 
 from app.models.resource import ResourcePlan
 from app.models.project import Program, Project
 from app.schemas.resource_matrix import (
     ResourceAllocationDetail,
-    MonthlyAllocation,
     ProjectAllocationRow,
     ProgramGroup,
     ResourceAllocationMatrix,
+    PROGRAM_GROUP_ADAPTER,
 )
 
 
@@ -66,9 +67,82 @@ def get_resource_allocation_matrix(
     Returns:
         ResourceAllocationMatrix with aggregated data
     """
-    # Generate month list
     months = generate_month_range(start_month, end_month)
+    matrix_data = _aggregate_plans(db, start_month, end_month, months, program_id)
+    programs = _load_programs(db, program_id)
 
+    grand_total_by_month = [0.0] * len(months)
+    program_groups = list(
+        _iter_program_groups(programs, matrix_data, grand_total_by_month)
+    )
+
+    return ResourceAllocationMatrix(
+        start_month=start_month,
+        end_month=end_month,
+        months=months,
+        programs=program_groups,
+        grand_total_by_month=[round(total, 2) for total in grand_total_by_month],
+    )
+
+
+def stream_resource_allocation_matrix(
+    db: Session,
+    start_month: str,
+    end_month: str,
+    department_id: Optional[str] = None,
+    program_id: Optional[str] = None,
+) -> Iterator[bytes]:
+    """
+    Same JSON document as get_resource_allocation_matrix, one program at a time
+
+    All queries run before this returns (the request's session is closed
+    before a streamed body is sent, and bad month strings still raise
+    ValueError here); the returned iterator only builds and serializes
+    ProgramGroups, so neither the full group list nor the full JSON body is
+    ever held in memory.
+    """
+    months = generate_month_range(start_month, end_month)
+    matrix_data = _aggregate_plans(db, start_month, end_month, months, program_id)
+    programs = _load_programs(db, program_id)
+
+    return _stream_matrix_json(start_month, end_month, months, programs, matrix_data)
+
+
+def _stream_matrix_json(
+    start_month: str,
+    end_month: str,
+    months: List[str],
+    programs: List[Program],
+    matrix_data: dict,
+) -> Iterator[bytes]:
+    """Yield the matrix JSON in the field order of ResourceAllocationMatrix."""
+    grand_total_by_month = [0.0] * len(months)
+
+    yield (
+        b'{"start_month":' + to_json(start_month)
+        + b',"end_month":' + to_json(end_month)
+        + b',"months":' + to_json(months)
+        + b',"programs":['
+    )
+    separator = b""
+    for group in _iter_program_groups(programs, matrix_data, grand_total_by_month):
+        yield separator + PROGRAM_GROUP_ADAPTER.dump_json(group)
+        separator = b","
+    yield (
+        b'],"grand_total_by_month":'
+        + to_json([round(total, 2) for total in grand_total_by_month])
+        + b"}"
+    )
+
+
+def _aggregate_plans(
+    db: Session,
+    start_month: str,
+    end_month: str,
+    months: List[str],
+    program_id: Optional[str],
+) -> dict:
+    """Group resource plan details as {program_id: {project_id: [per-month lists]}}."""
     # Parse year and month ranges
     start_dt = datetime.strptime(start_month, "%Y-%m")
     end_dt = datetime.strptime(end_month, "%Y-%m")
@@ -88,14 +162,18 @@ def get_resource_allocation_matrix(
     resource_plans = query.all()
 
     # Filter by exact month range and build aggregation structure
-    # Structure: {program_id: {project_id: {month: [details]}}}
-    matrix_data = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    # Structure: {program_id: {project_id: [details for months[0], months[1], ...]}}
+    month_index = {month: i for i, month in enumerate(months)}
+    n_months = len(months)
+    matrix_data = defaultdict(
+        lambda: defaultdict(lambda: [[] for _ in range(n_months)])
+    )
 
     for plan in resource_plans:
-        month_key = f"{plan.year}-{plan.month:02d}"
+        idx = month_index.get(f"{plan.year}-{plan.month:02d}")
 
         # Skip if outside month range
-        if month_key not in months:
+        if idx is None:
             continue
 
         program_id_key = plan.project.program_id
@@ -113,76 +191,74 @@ def get_resource_allocation_matrix(
             fte=fte,
         )
 
-        matrix_data[program_id_key][project_id_key][month_key].append(detail)
+        matrix_data[program_id_key][project_id_key][idx].append(detail)
 
-    # Build response structure
-    programs: List[ProgramGroup] = []
-    grand_total_by_month: Dict[str, float] = {month: 0.0 for month in months}
+    return matrix_data
 
-    # Query all programs (or filtered)
-    programs_query = db.query(Program).filter(Program.is_active == True)
+
+def _load_programs(db: Session, program_id: Optional[str]) -> List[Program]:
+    """Active programs (or the filtered one) with their projects loaded."""
+    programs_query = (
+        db.query(Program)
+        .options(selectinload(Program.projects))
+        .filter(Program.is_active == True)
+    )
     if program_id:
         programs_query = programs_query.filter(Program.id == program_id)
+    return programs_query.all()
+
+
+def _iter_program_groups(
+    programs: List[Program],
+    matrix_data: dict,
+    grand_total_by_month: List[float],
+) -> Iterator[ProgramGroup]:
+    """
+    Yield one ProgramGroup per program with allocations
+
+    Adds each project's monthly totals into grand_total_by_month (unrounded)
+    as a side effect, so the caller has the grand totals once exhausted.
+    """
+    n_months = len(grand_total_by_month)
 
-    for program in programs_query.all():
+    for program in programs:
         projects: List[ProjectAllocationRow] = []
-        program_total_by_month: Dict[str, float] = {month: 0.0 for month in months}
+        program_total_by_month = [0.0] * n_months
+        program_data = matrix_data.get(program.id, {})
 
         for project in program.projects:
             if not project:
                 continue
 
-            allocations: Dict[str, MonthlyAllocation] = {}
-
-            for month in months:
-                details = matrix_data[program.id][project.id].get(month, [])
-                total_fte = sum(d.fte for d in details)
+            details = program_data.get(project.id)
+            if details is None:
+                continue
 
-                allocations[month] = MonthlyAllocation(
-                    month=month,
-                    total_fte=round(total_fte, 2),
-                    details=details,
-                )
+            total_fte = [sum(d.fte for d in cell) for cell in details]
 
-                # Accumulate program totals
-                program_total_by_month[month] += total_fte
-                grand_total_by_month[month] += total_fte
+            # Accumulate program and grand totals
+            for i, fte in enumerate(total_fte):
+                program_total_by_month[i] += fte
+                grand_total_by_month[i] += fte
 
             # Only include projects with at least one allocation
-            if any(a.total_fte > 0 for a in allocations.values()):
+            if any(fte > 0 for fte in total_fte):
                 projects.append(
                     ProjectAllocationRow(
                         project_id=project.id,
                         project_code=project.code,
                         project_name=project.name,
                         category=project.category,
-                        allocations=allocations,
+                        total_fte=[round(fte, 2) for fte in total_fte],
+                        details=details,
                     )
                 )
 
         # Only include programs with projects
         if projects:
-            programs.append(
-                ProgramGroup(
-                    program_id=program.id,
-                    program_name=program.name,
-                    projects=projects,
-                    total_by_month={
-                        month: round(total, 2)
-                        for month, total in program_total_by_month.items()
-                    },
-                )
+            yield ProgramGroup(
+                program_id=program.id,
+                program_name=program.name,
+                projects=projects,
+                total_by_month=[round(total, 2) for total in program_total_by_month],
             )
-
-    # Round grand totals
-    grand_total_by_month = {
-        month: round(total, 2) for month, total in grand_total_by_month.items()
-    }
-
-    return ResourceAllocationMatrix(
-        start_month=start_month,
-        end_month=end_month,
-        months=months,
-        programs=programs,
-        grand_total_by_month=grand_total_by_month,
-    )
@@ -5,7 +5,7 @@ Handles Korean text normalization, alias expansion, and keyword extraction.
 """
 
 import re
-from typing import List, Set
+from typing import Dict, List, Pattern, Set, Tuple
 
 from app.services.keyword_mappings import (
     PROJECT_ALIASES,
@@ -15,6 +15,22 @@ from app.services.keyword_mappings import (
 )
 
 
+def _compile_aliases(aliases: Dict[str, str]) -> Tuple[Pattern, Dict[str, str]]:
+    """
+    One case-insensitive pattern matching any alias (longest first), plus
+    the replacement for each lowercased alias, so expansion is one scan.
+    """
+    pattern = re.compile(
+        "|".join(re.escape(alias) for alias in sorted(aliases, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    return pattern, {alias.lower(): expanded for alias, expanded in aliases.items()}
+
+
+_PROJECT_ALIAS_PATTERN, _PROJECT_ALIAS_LOOKUP = _compile_aliases(PROJECT_ALIASES)
+_WORKTYPE_ALIAS_PATTERN, _WORKTYPE_ALIAS_LOOKUP = _compile_aliases(WORKTYPE_ALIASES)
+
+
 class KoreanTextPreprocessor:
     """
     Preprocessor for Korean worklog text input.
@@ -32,6 +48,10 @@ class KoreanTextPreprocessor:
         "와", "과", "의", "도", "만", "까지", "부터", "에게", "한테",
         "께", "처럼", "같이", "보다", "마다", "라고", "하고"
     ]
+    # Longest first, so "에서" is tried before "에"
+    _POSTPOSITIONS_LONGEST_FIRST = tuple(
+        sorted(KOREAN_POSTPOSITIONS, key=len, reverse=True)
+    )
 
     def __init__(self):
         self._project_aliases = PROJECT_ALIASES
@@ -65,15 +85,15 @@ class KoreanTextPreprocessor:
         result = text
 
         # Step 1: Expand project aliases (Korean phonetic → English)
-        for korean, english in self._project_aliases.items():
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(korean), re.IGNORECASE)
-            result = pattern.sub(english, result)
+        # Case-insensitive, all aliases in one precompiled pass
+        result = _PROJECT_ALIAS_PATTERN.sub(
+            lambda m: _PROJECT_ALIAS_LOOKUP[m.group(0).lower()], result
+        )
 
         # Step 2: Expand worktype aliases
-        for korean, standard in self._worktype_aliases.items():
-            pattern = re.compile(re.escape(korean), re.IGNORECASE)
-            result = pattern.sub(standard, result)
+        result = _WORKTYPE_ALIAS_PATTERN.sub(
+            lambda m: _WORKTYPE_ALIAS_LOOKUP[m.group(0).lower()], result
+        )
 
         # Step 3: Remove trailing postpositions from words
         # e.g., "OQC인프라를" → "OQC인프라"
@@ -98,7 +118,7 @@ class KoreanTextPreprocessor:
         for word in words:
             cleaned = word
             # Try removing each postposition from the end
-            for postposition in sorted(self.KOREAN_POSTPOSITIONS, key=len, reverse=True):
+            for postposition in self._POSTPOSITIONS_LONGEST_FIRST:
                 if cleaned.endswith(postposition) and len(cleaned) > len(postposition):
                     # Don't remove if it would leave only Korean characters
                     potential = cleaned[:-len(postposition)]
@@ -0,0 +1,110 @@
+"""
+Per-user usage aggregates for AI worklog personalization
+
+The AI parser ranks each user's recent projects and frequent work types by
+their last USAGE_WINDOW_DAYS of worklogs. Aggregating those on every parse
+is a GROUP BY over the user's worklogs; refresh_usage_aggregates stores the
+result in small per-user tables instead, run nightly by
+scripts/refresh_usage_aggregates.py.
+
+The readers fall back to aggregating a user's worklogs directly while that
+user has no aggregate rows yet (new since the last refresh, or before the
+first one), so personalization never goes blank waiting for the job.
+"""
+
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import CompoundSelect, delete, func, insert, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.resource import UserProjectUsage, UserWorkTypeUsage, WorkLog
+
+USAGE_WINDOW_DAYS = 90
+
+
+def _since(today: Optional[date]) -> date:
+    return (today or date.today()) - timedelta(days=USAGE_WINDOW_DAYS)
+
+
+def user_project_usage(user_id: str, today: Optional[date] = None) -> CompoundSelect:
+    """(project_id, usage_count) rows for one user's recent projects."""
+    has_aggregate = (
+        select(UserProjectUsage.user_id)
+        .where(UserProjectUsage.user_id == user_id)
+        .exists()
+    )
+    return union_all(
+        select(
+            UserProjectUsage.project_id,
+            UserProjectUsage.usage_count_90d.label("usage_count"),
+        ).where(UserProjectUsage.user_id == user_id),
+        select(WorkLog.project_id, func.count(WorkLog.id))
+        .where(
+            ~has_aggregate,
+            WorkLog.user_id == user_id,
+            WorkLog.date >= _since(today),
+            WorkLog.project_id.is_not(None),
+        )
+        .group_by(WorkLog.project_id),
+    )
+
+
+def user_work_type_usage(
+    user_id: str, today: Optional[date] = None
+) -> CompoundSelect:
+    """(work_type_category_id, total_hours) rows for one user's work types."""
+    has_aggregate = (
+        select(UserWorkTypeUsage.user_id)
+        .where(UserWorkTypeUsage.user_id == user_id)
+        .exists()
+    )
+    return union_all(
+        select(
+            UserWorkTypeUsage.work_type_category_id,
+            UserWorkTypeUsage.total_hours_90d.label("total_hours"),
+        ).where(UserWorkTypeUsage.user_id == user_id),
+        select(WorkLog.work_type_category_id, func.sum(WorkLog.hours))
+        .where(
+            ~has_aggregate,
+            WorkLog.user_id == user_id,
+            WorkLog.date >= _since(today),
+        )
+        .group_by(WorkLog.work_type_category_id),
+    )
+
+
+def refresh_usage_aggregates(db: Session, today: Optional[date] = None) -> None:
+    """Rebuild both usage tables from the last USAGE_WINDOW_DAYS of worklogs."""
+    since = _since(today)
+
+    db.execute(delete(UserWorkTypeUsage))
+    db.execute(
+        insert(UserWorkTypeUsage).from_select(
+            ["user_id", "work_type_category_id", "total_hours_90d"],
+            select(
+                WorkLog.user_id,
+                WorkLog.work_type_category_id,
+                func.sum(WorkLog.hours),
+            )
+            .where(WorkLog.date >= since)
+            .group_by(WorkLog.user_id, WorkLog.work_type_category_id),
+        )
+    )
+
+    db.execute(delete(UserProjectUsage))
+    db.execute(
+        insert(UserProjectUsage).from_select(
+            ["user_id", "project_id", "usage_count_90d"],
+            select(
+                WorkLog.user_id,
+                WorkLog.project_id,
+                func.count(WorkLog.id),
+            )
+            .where(WorkLog.date >= since, WorkLog.project_id.is_not(None))
+            .group_by(WorkLog.user_id, WorkLog.project_id),
+        )
+    )
+
+    # Both tables are swapped in one transaction
+    db.commit()
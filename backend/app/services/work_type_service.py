@@ -3,15 +3,25 @@ Service layer for Work Type Categories
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_
 
-from app.models.work_type import WorkTypeCategory, WorkTypeLegacyMapping
+from app.models.work_type import (
+    WorkTypeCategory,
+    WorkTypeApplicableRole,
+    WorkTypeLegacyMapping,
+)
 from app.schemas.work_type import (
     WorkTypeCategoryCreate,
     WorkTypeCategoryUpdate,
     WorkTypeCategoryTree,
 )
+from app.services.lookup_cache import WORK_TYPES, invalidate_lookup
+
+
+# Response schemas serialize applicable_roles; load the role rows in one
+# extra query per list instead of one per category
+_WITH_ROLES = selectinload(WorkTypeCategory.role_links)
 
 
 class WorkTypeCategoryService:
@@ -20,7 +30,7 @@ class WorkTypeCategoryService:
 
     def get_all(self, is_active: Optional[bool] = True) -> List[WorkTypeCategory]:
         """Get all categories"""
-        query = self.db.query(WorkTypeCategory)
+        query = self.db.query(WorkTypeCategory).options(_WITH_ROLES)
         if is_active is not None:
             query = query.filter(WorkTypeCategory.is_active == is_active)
         return query.order_by(WorkTypeCategory.level, WorkTypeCategory.sort_order).all()
@@ -29,6 +39,7 @@ class WorkTypeCategoryService:
         """Get category by ID"""
         return (
             self.db.query(WorkTypeCategory)
+            .options(_WITH_ROLES)
             .filter(WorkTypeCategory.id == category_id)
             .first()
         )
@@ -42,12 +53,14 @@ class WorkTypeCategoryService:
         )
 
     def get_by_level(
-        self, level: int, is_active: bool = True
+        self, level: int, is_active: bool = True, with_roles: bool = True
     ) -> List[WorkTypeCategory]:
         """Get categories by level (1, 2, or 3)"""
+        query = self.db.query(WorkTypeCategory)
+        if with_roles:
+            query = query.options(_WITH_ROLES)
         return (
-            self.db.query(WorkTypeCategory)
-            .filter(
+            query.filter(
                 WorkTypeCategory.level == level,
                 WorkTypeCategory.is_active == is_active,
             )
@@ -56,12 +69,14 @@ class WorkTypeCategoryService:
         )
 
     def get_children(
-        self, parent_id: int, is_active: bool = True
+        self, parent_id: int, is_active: bool = True, with_roles: bool = True
     ) -> List[WorkTypeCategory]:
         """Get child categories of a parent"""
+        query = self.db.query(WorkTypeCategory)
+        if with_roles:
+            query = query.options(_WITH_ROLES)
         return (
-            self.db.query(WorkTypeCategory)
-            .filter(
+            query.filter(
                 WorkTypeCategory.parent_id == parent_id,
                 WorkTypeCategory.is_active == is_active,
             )
@@ -73,10 +88,10 @@ class WorkTypeCategoryService:
         self, role: str, level: Optional[int] = None
     ) -> List[WorkTypeCategory]:
         """Get categories applicable to a specific role"""
-        query = self.db.query(WorkTypeCategory).filter(
+        query = self.db.query(WorkTypeCategory).options(_WITH_ROLES).filter(
             WorkTypeCategory.is_active == True,
-            (WorkTypeCategory.applicable_roles.is_(None))
-            | (WorkTypeCategory.applicable_roles.contains(role)),
+            ~WorkTypeCategory.role_links.any()
+            | WorkTypeCategory.role_links.any(WorkTypeApplicableRole.role == role),
         )
         if level:
             query = query.filter(WorkTypeCategory.level == level)
@@ -84,8 +99,8 @@ class WorkTypeCategoryService:
 
     def get_tree(self) -> List[WorkTypeCategoryTree]:
         """Get full category tree (L1 with nested L2 and L3)"""
-        # Get all L1 categories
-        l1_categories = self.get_by_level(1)
+        # Get all L1 categories (tree nodes carry no role list)
+        l1_categories = self.get_by_level(1, with_roles=False)
         tree = []
 
         for l1 in l1_categories:
@@ -99,7 +114,7 @@ class WorkTypeCategoryService:
             )
 
             # Get L2 children
-            l2_categories = self.get_children(l1.id)
+            l2_categories = self.get_children(l1.id, with_roles=False)
             for l2 in l2_categories:
                 l2_node = WorkTypeCategoryTree(
                     id=l2.id,
@@ -111,7 +126,7 @@ class WorkTypeCategoryService:
                 )
 
                 # Get L3 children
-                l3_categories = self.get_children(l2.id)
+                l3_categories = self.get_children(l2.id, with_roles=False)
                 for l3 in l3_categories:
                     l3_node = WorkTypeCategoryTree(
                         id=l3.id,
@@ -135,6 +150,7 @@ class WorkTypeCategoryService:
         self.db.add(db_category)
         self.db.commit()
         self.db.refresh(db_category)
+        invalidate_lookup(WORK_TYPES)
         return db_category
 
     def update(
@@ -151,6 +167,7 @@ class WorkTypeCategoryService:
 
         self.db.commit()
         self.db.refresh(db_category)
+        invalidate_lookup(WORK_TYPES)
         return db_category
 
     def get_legacy_mapping(
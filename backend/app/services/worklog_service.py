@@ -4,17 +4,43 @@ Service layer for worklog-related business logic
 
 from typing import List, Optional
 from datetime import date, timedelta
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 from sqlalchemy import func, cast, Date
 
 from app.models.resource import WorkLog
 from app.models.project import Project
+from app.models.organization import SubTeam
+from app.models.user import User
 from app.schemas.worklog import (
+    WorkLog as WorkLogSchema,
+    WorkLogWithUser as WorkLogWithUserSchema,
     WorkLogCreate,
     WorkLogUpdate,
     DailySummary,
     ProjectSummary,
 )
+from app.services.project_service import project_load_options
+
+
+def _worklog_load_options(required_loads) -> list:
+    """Loader options for the relationships named in a schema's REQUIRED_LOADS."""
+    options = []
+    for name in required_loads:
+        if name == "project":
+            options.append(
+                joinedload(WorkLog.project).options(*project_load_options())
+            )
+        elif name == "user":
+            options.append(
+                joinedload(WorkLog.user)
+                .joinedload(User.sub_team)
+                .joinedload(SubTeam.department)
+            )
+        else:
+            options.append(joinedload(getattr(WorkLog, name)))
+    # Anything else on WorkLog raises instead of lazy loading per row
+    options.append(raiseload("*"))
+    return options
 
 
 class WorkLogService:
@@ -46,8 +72,7 @@ class WorkLogService:
     ) -> List[WorkLog]:
         """Retrieve multiple worklogs with filters and pagination."""
         query = self.db.query(WorkLog).options(
-            joinedload(WorkLog.project),
-            joinedload(WorkLog.work_type_category),
+            *_worklog_load_options(WorkLogSchema.REQUIRED_LOADS)
         )
 
         if user_id:
@@ -76,15 +101,9 @@ class WorkLogService:
         limit: int = 500,
     ) -> List[WorkLog]:
         """Retrieve worklogs with user info for table display."""
-        from app.models.user import User
-
         query = (
             self.db.query(WorkLog)
-            .options(
-                joinedload(WorkLog.project),
-                joinedload(WorkLog.user),
-                joinedload(WorkLog.work_type_category),
-            )
+            .options(*_worklog_load_options(WorkLogWithUserSchema.REQUIRED_LOADS))
             .join(User, WorkLog.user_id == User.id)
         )
 
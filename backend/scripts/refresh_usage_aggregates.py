@@ -0,0 +1,34 @@
+"""
+Rebuild the per-user usage aggregates read by the AI worklog parser.
+
+Schedule nightly (e.g. cron: 0 2 * * * python scripts/refresh_usage_aggregates.py).
+"""
+
+import sys
+import os
+
+# Add backend directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import get_session_local
+from app.services.usage_aggregate_service import refresh_usage_aggregates
+
+
+def main():
+    SessionLocal = get_session_local()
+    db = SessionLocal()
+
+    try:
+        print("Refreshing user usage aggregates...")
+        refresh_usage_aggregates(db)
+        print("✅ User usage aggregates refreshed.")
+    except Exception as e:
+        print(f"Error: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
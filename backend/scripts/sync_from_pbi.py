@@ -36,6 +36,7 @@ IMPORTANT:
     - 기존 레코드는 절대 수정하지 않음
 """
 
+import io
 import sys
 import argparse
 import platform
@@ -59,7 +60,11 @@ from app.models.project import Project, ProjectType, Program, ProductLine
 from app.models.resource import WorkLog
 from app.models.work_type import WorkTypeCategory, WorkTypeLegacyMapping
 
-from app.services.data_transformer import DataTransformer, TransformResult
+from app.services.data_transformer import (
+    DataTransformer,
+    TransformResult,
+    write_copy_rows,
+)
 
 # Check if running on Windows (required for Power BI connector)
 IS_WINDOWS = platform.system() == "Windows"
@@ -67,6 +72,19 @@ IS_WINDOWS = platform.system() == "Windows"
 # Configuration
 DEFAULT_PASSWORD = "password123"
 BATCH_SIZE = 1000
+# Columns written by COPY for new worklogs (PostgreSQL)
+WORKLOG_COPY_COLUMNS = (
+    "date",
+    "user_id",
+    "project_id",
+    "work_type_category_id",
+    "hours",
+    "description",
+    "is_sudden_work",
+    "is_business_trip",
+    "created_at",
+    "updated_at",
+)
 REF_TABLE_PATH = Path(__file__).parent.parent.parent / "ref_table"
 
 
@@ -670,7 +688,8 @@ class PowerBISynchronizer:
         if self.csv_mode:
             rows = self._load_worklogs_from_csv(date_range)
         else:
-            rows = self._load_worklogs_from_pbi(date_range)
+            # Already transformed column-wise; invalid rows are counted here
+            rows = self._load_worklogs_from_pbi(date_range, stats)
 
         if rows is None:
             print("Error: Could not retrieve worklogs")
@@ -717,28 +736,19 @@ class PowerBISynchronizer:
                 continue
 
             # INSERT new worklog
-            try:
-                worklog = WorkLog(**worklog_data)
-                batch.append(worklog)
-                self.existing_worklog_keys.add(worklog_key)
-                stats.created += 1
+            batch.append(worklog_data)
+            self.existing_worklog_keys.add(worklog_key)
+            stats.created += 1
 
-                # Commit in batches
-                if len(batch) >= BATCH_SIZE:
-                    self.db.add_all(batch)
-                    self.db.commit()
-                    batch = []
-                    print(f"  Created {stats.created} new worklogs (processed {stats.processed})...")
-
-            except Exception as e:
-                stats.errors += 1
-                if self.verbose:
-                    print(f"  Error: {e}")
+            # Commit in batches
+            if len(batch) >= BATCH_SIZE:
+                self._insert_worklogs(batch, stats)
+                batch = []
+                print(f"  Created {stats.created} new worklogs (processed {stats.processed})...")
 
         # Final batch
         if batch and not self.dry_run:
-            self.db.add_all(batch)
-            self.db.commit()
+            self._insert_worklogs(batch, stats)
 
         # Print project matching stats for CSV mode
         if self.csv_mode:
@@ -751,8 +761,71 @@ class PowerBISynchronizer:
         print(f"WorkLogs: {stats}")
         return stats
 
-    def _load_worklogs_from_pbi(self, date_range: Optional[Tuple[date, date]]) -> Optional[List[Dict]]:
-        """Load worklogs from Power BI Desktop."""
+    def _insert_worklogs(
+        self, batch: List[Dict[str, Any]], stats: SyncStats
+    ) -> None:
+        """
+        Insert and commit a batch of worklog dicts.
+
+        PostgreSQL gets one COPY FROM STDIN per batch instead of an INSERT per
+        row; other databases use ORM inserts. If the batch fails as a whole it
+        is rolled back and retried row by row, so only the bad rows are lost
+        (counted in stats.errors instead of stats.created).
+        """
+        try:
+            if self.db.get_bind().dialect.name == "postgresql":
+                self._copy_worklogs(batch)
+            else:
+                self.db.add_all([WorkLog(**data) for data in batch])
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            if self.verbose:
+                print(f"  Batch insert failed, retrying row by row: {e}")
+            self._insert_worklogs_row_by_row(batch, stats)
+
+    def _insert_worklogs_row_by_row(
+        self, batch: List[Dict[str, Any]], stats: SyncStats
+    ) -> None:
+        """Insert each worklog in its own savepoint, counting failures."""
+        for data in batch:
+            try:
+                with self.db.begin_nested():
+                    self.db.add(WorkLog(**data))
+            except Exception as e:
+                stats.created -= 1
+                stats.errors += 1
+                if self.verbose:
+                    print(f"  Error: {e}")
+        self.db.commit()
+
+    def _copy_worklogs(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch with one COPY FROM STDIN (PostgreSQL, uncommitted)."""
+        now = datetime.utcnow()
+        buffer = io.StringIO()
+        write_copy_rows(
+            ({**data, "created_at": now, "updated_at": now} for data in batch),
+            WORKLOG_COPY_COLUMNS,
+            buffer,
+        )
+        buffer.seek(0)
+        # Raw DBAPI connection of the session's transaction (psycopg2)
+        dbapi_connection = self.db.connection().connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY worklogs ({', '.join(WORKLOG_COPY_COLUMNS)}) FROM STDIN",
+                buffer,
+            )
+
+    def _load_worklogs_from_pbi(
+        self, date_range: Optional[Tuple[date, date]], stats: SyncStats
+    ) -> Optional[List[Dict]]:
+        """
+        Load worklogs from Power BI Desktop and transform the whole table at once.
+
+        Rows that fail transformation are counted as processed/skipped(invalid)
+        in stats and left out of the returned worklog dicts.
+        """
         if date_range:
             start_date, end_date = date_range
             dax_query = f"""
@@ -766,7 +839,19 @@ class PowerBISynchronizer:
         else:
             dax_query = "EVALUATE tb_worklog"
 
-        return self.execute_dax(dax_query)
+        if not self.connector:
+            return None
+        df = self.connector.execute_dax(dax_query)
+        if df is None:
+            return None
+
+        worklogs, errors = self.transformer.transform_worklogs_df(df)
+        stats.processed += len(errors)
+        stats.skipped_invalid += len(errors)
+        if self.verbose:
+            for error in errors:
+                print(f"  Skip(invalid): {error}")
+        return worklogs
 
     def _load_worklogs_from_csv(self, date_range: Optional[Tuple[date, date]]) -> Optional[List[Dict]]:
         """Load worklogs from CSV file with optional date filtering."""
@@ -921,13 +1006,8 @@ class PowerBISynchronizer:
         row: Dict[str, Any],
         default_category: Optional[WorkTypeCategory]
     ) -> Optional[Dict[str, Any]]:
-        """Process a single worklog row from Power BI."""
-        result = self.transformer.transform_worklog(row)
-
-        if not result.success:
-            return None
-
-        data = result.data.copy()
+        """Process a single worklog already transformed from Power BI."""
+        data = row.copy()
 
         # Handle work type category
         if data.get("work_type_category_id") is None:
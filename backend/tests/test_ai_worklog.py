@@ -2,7 +2,12 @@
 Tests for AI Worklog Service and Endpoints
 """
 
+import asyncio
+import json
+import re
+import httpx
 import pytest
+from datetime import date
 from unittest.mock import AsyncMock, patch, MagicMock
 from sqlalchemy.orm import Session
 
@@ -11,7 +16,18 @@ from app.schemas.ai_worklog import (
     AIWorklogEntry,
     AIWorklogParseResponse,
 )
+from app.core.config import settings
 from app.services.ai_worklog_service import AIWorklogService
+from app.services.gemini_client import GeminiClient
+from app.services.groq_client import GroqClient
+from app.services.lookup_cache import (
+    PROJECTS,
+    WORK_TYPES,
+    clear_lookup_cache,
+    invalidate_lookup,
+    store_lookup,
+)
+from app.services.matching_service import ProjectMatchIndex, WorkTypeMatchIndex
 from app.prompts.worklog_parser import WorklogParserPrompt
 
 
@@ -36,6 +52,19 @@ class TestWorklogParserPrompt:
         assert "Development" in prompt
         assert "Documentation" in prompt
 
+    def test_system_prompt_starts_with_static_instructions(self):
+        """Test that per-user lists and hints only change the prompt's tail"""
+        first = WorklogParserPrompt.build_system_prompt(
+            [{"id": "proj-1", "code": "OQC", "name": "OQC Infra"}], [], ["project:OQC"]
+        )
+        second = WorklogParserPrompt.build_system_prompt(
+            [], [{"id": 1, "code": "DEV", "name": "Development"}]
+        )
+
+        static = WorklogParserPrompt.STATIC_INSTRUCTIONS
+        assert first.startswith(static) and second.startswith(static)
+        assert '{"entries":[{"project_id"' in static
+
     def test_build_system_prompt_empty_lists(self):
         """Test system prompt generation with empty lists"""
         prompt = WorklogParserPrompt.build_system_prompt([], [])
@@ -46,17 +75,28 @@ class TestWorklogParserPrompt:
     def test_build_user_prompt(self):
         """Test user prompt generation"""
         text = "오전에 OQC 작업했음"
-        date = "2024-01-15"
 
-        prompt = WorklogParserPrompt.build_user_prompt(text, date)
+        prompt = WorklogParserPrompt.build_user_prompt(text)
 
         assert text in prompt
-        assert date in prompt
+
+
+    def test_prompt_class_not_instantiable(self):
+        """Test that the prompt class is used only through classmethods"""
+        with pytest.raises(TypeError):
+            WorklogParserPrompt()
 
 
 class TestAIWorklogService:
     """Tests for AIWorklogService class"""
 
+    @pytest.fixture(autouse=True)
+    def reset_lookup_cache(self):
+        """Project / work type lists are cached per process; isolate each test"""
+        clear_lookup_cache()
+        yield
+        clear_lookup_cache()
+
     @pytest.fixture
     def mock_db_session(self):
         """Create a mock database session"""
@@ -74,6 +114,8 @@ class TestAIWorklogService:
         mock_work_type_query.all.return_value = []
 
         session.query.return_value = mock_project_query
+        # Mock column-only selects (project / work type catalog)
+        session.execute.return_value.all.return_value = []
         return session
 
     @pytest.fixture
@@ -117,6 +159,166 @@ class TestAIWorklogService:
         assert result.entries[0].hours == 4.0
         assert result.total_hours == 4.0
 
+    @pytest.mark.asyncio
+    async def test_repeated_text_reuses_ai_result(
+        self, mock_db_session, mock_groq_client
+    ):
+        """Same user and text are answered from cache without another AI call"""
+        mock_groq_client.generate_json.return_value = {
+            "entries": [{"description": "HRS 미팅", "hours": 2.0, "confidence": 0.7}],
+        }
+        request = AIWorklogParseRequest(
+            text="HRS 미팅 2시간", user_id="user-1", target_date="2024-01-15"
+        )
+
+        first = await AIWorklogService(
+            mock_db_session, mock_groq_client
+        ).parse_worklog(request)
+        second = await AIWorklogService(
+            mock_db_session, mock_groq_client
+        ).parse_worklog(request)
+
+        assert mock_groq_client.generate_json.await_count == 1
+        assert second == first
+
+        other_user = request.model_copy(update={"user_id": "user-2"})
+        await AIWorklogService(mock_db_session, mock_groq_client).parse_worklog(
+            other_user
+        )
+        assert mock_groq_client.generate_json.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_keyworded_single_task_skips_ai(
+        self, mock_db_session, mock_groq_client
+    ):
+        """A single task with project, work type and hours is parsed by rules"""
+        store_lookup(
+            PROJECTS,
+            [{"id": "P1", "code": "888888-160", "name": "OQC Infra"}],
+            match_index=ProjectMatchIndex,
+        )
+        store_lookup(
+            WORK_TYPES,
+            [{"id": 7, "code": "PRJ-MTG", "name": "Meeting"}],
+            match_index=WorkTypeMatchIndex,
+        )
+        mock_groq_client.generate_json.return_value = {"entries": []}
+        service = AIWorklogService(mock_db_session, mock_groq_client)
+
+        result = await service.parse_worklog(
+            AIWorklogParseRequest(
+                text="OQC 회의 2시간", user_id="user-1", target_date="2024-01-15"
+            )
+        )
+
+        mock_groq_client.generate_json.assert_not_awaited()
+        assert result.total_hours == 2.0
+        entry = result.entries[0]
+        assert (entry.project_id, entry.work_type_category_id) == ("P1", 7)
+
+        # Two tasks are left to the AI
+        await service.parse_worklog(
+            AIWorklogParseRequest(
+                text="OQC 회의 2시간, 문서 작성 1시간",
+                user_id="user-1",
+                target_date="2024-01-15",
+            )
+        )
+        mock_groq_client.generate_json.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_recent_projects_loaded_once_per_parse(
+        self, mock_db_session, mock_groq_client
+    ):
+        """Entry mapping reuses the recent projects loaded for the prompt"""
+        mock_groq_client.generate_json.return_value = {
+            "entries": [{"description": "DB 설계", "hours": 1.0}],
+        }
+        service = AIWorklogService(mock_db_session, mock_groq_client)
+
+        with patch.object(
+            service,
+            "_load_user_recent_projects",
+            wraps=service._load_user_recent_projects,
+        ) as load_recent:
+            await service.parse_worklog(
+                AIWorklogParseRequest(
+                    text="DB 설계 1시간", user_id="user-1", target_date="2024-01-15"
+                )
+            )
+
+        assert load_recent.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_terms_fuzzy_matched_once(
+        self, mock_db_session, mock_groq_client
+    ):
+        """Entries naming the same project/work type share one fuzzy match"""
+        mock_groq_client.generate_json.return_value = {
+            "entries": [
+                {
+                    "project_name": "OQC Infra",
+                    "work_type_name": "Development",
+                    "description": f"작업 {i}",
+                    "hours": 1.0,
+                }
+                for i in range(3)
+            ],
+        }
+        service = AIWorklogService(mock_db_session, mock_groq_client)
+
+        with patch.object(
+            service.matcher, "match_project", return_value=None
+        ) as match_project, patch.object(
+            service.matcher, "match_work_type", return_value=None
+        ) as match_work_type:
+            result = await service.parse_worklog(
+                AIWorklogParseRequest(
+                    text="작업 0, 작업 1, 작업 2",
+                    user_id="user-1",
+                    target_date="2024-01-15",
+                )
+            )
+
+        assert len(result.entries) == 3
+        assert match_project.call_count == 1
+        assert match_work_type.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_parse_runs_ai_calls_concurrently(
+        self, mock_db_session, mock_groq_client
+    ):
+        """Batch inputs share the AI concurrency cap and keep request order"""
+        in_flight = 0
+        peak = 0
+
+        async def generate_json(prompt, system_prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            # Hours encode which input the call was for
+            hours = float(re.search(r"작업 (\d)", prompt).group(1)) + 1
+            return {"entries": [{"description": "작업", "hours": hours}]}
+
+        mock_groq_client.generate_json.side_effect = generate_json
+        requests = [
+            AIWorklogParseRequest(
+                text=f"작업 {i}", user_id="user-1", target_date="2024-01-15"
+            )
+            for i in range(5)
+        ]
+
+        with patch.object(settings, "AI_MAX_CONCURRENT_REQUESTS", 2):
+            results = await AIWorklogService(
+                mock_db_session, mock_groq_client
+            ).parse_worklog_batch(requests)
+
+        assert len(results) == 5
+        assert peak == 2
+        assert [r.total_hours for r in results] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
     @pytest.mark.asyncio
     async def test_parse_worklog_ai_failure(self, mock_db_session, mock_groq_client):
         """Test handling of AI parsing failure"""
@@ -187,6 +389,162 @@ class TestAIWorklogService:
 
         assert result.confidence == 1.0  # Should be capped at 1.0
 
+    def test_unvalidated_entry_still_satisfies_schema(
+        self, mock_db_session, mock_groq_client
+    ):
+        """Entries built without validation pass the schema's own checks"""
+        service = AIWorklogService(mock_db_session, mock_groq_client)
+
+        entry = {
+            "hours": "lots",
+            "confidence": None,
+            "description": 42,
+        }
+
+        result = service._validate_and_map_entry(entry, {}, {})
+
+        assert AIWorklogEntry.model_validate(result.model_dump()) == result
+        assert result.description == "42"
+        assert result.hours == 1.0
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_cached_until_lookup_content_changes(
+        self, mock_db_session, mock_groq_client
+    ):
+        """Same user/hints reuse the built prompt until the lists change"""
+        rows = mock_db_session.execute.return_value.all
+        rows.return_value = [("P1", "GEN3", "Gen3 Project")]
+        prompt = await AIWorklogService(
+            mock_db_session, mock_groq_client
+        )._build_system_prompt(None, ["project:GEN3"])
+        calls = mock_db_session.execute.call_count
+
+        again = await AIWorklogService(
+            mock_db_session, mock_groq_client
+        )._build_system_prompt(None, ["project:GEN3"])
+        assert again is prompt
+        assert mock_db_session.execute.call_count == calls
+
+        # Reload with identical rows: same version, cached prompt kept
+        invalidate_lookup(PROJECTS)
+        reloaded = await AIWorklogService(
+            mock_db_session, mock_groq_client
+        )._build_system_prompt(None, ["project:GEN3"])
+        assert mock_db_session.execute.call_count == calls + 1
+        assert reloaded is prompt
+
+        # Renamed project: new version, prompt rebuilt
+        rows.return_value = [("P1", "GEN3", "Gen3 Renamed")]
+        invalidate_lookup(PROJECTS)
+        renamed = await AIWorklogService(
+            mock_db_session, mock_groq_client
+        )._build_system_prompt(None, ["project:GEN3"])
+        assert "Gen3 Renamed" in renamed
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_cache_ignores_hint_order(
+        self, mock_db_session, mock_groq_client
+    ):
+        """Hints detected in a different order reuse the same prompt"""
+        service = AIWorklogService(mock_db_session, mock_groq_client)
+        prompt = await service._build_system_prompt(
+            None, ["worktype:회의", "project:GEN3"]
+        )
+
+        assert (
+            await service._build_system_prompt(None, ["project:GEN3", "worktype:회의"])
+            is prompt
+        )
+
+    def test_lookup_version_tracks_content(self):
+        """Lookup version is stable for equal rows and changes with them"""
+        items = [{"id": "P1", "code": "GEN3", "name": "Gen3 Project"}]
+        version = store_lookup(PROJECTS, items).version
+        assert store_lookup(PROJECTS, [dict(items[0])]).version == version
+        assert (
+            store_lookup(PROJECTS, [{**items[0], "name": "Other"}]).version
+            != version
+        )
+
+    def test_lookup_lists_shared_across_instances(self, mock_db_session, mock_groq_client):
+        """Test that a new service instance reuses cached projects / work types"""
+        mock_db_session.execute.return_value.all.return_value = [
+            ("P1", "GEN3", "Gen3 Project")
+        ]
+        AIWorklogService(mock_db_session, mock_groq_client)._load_projects()
+        AIWorklogService(mock_db_session, mock_groq_client)._load_work_types()
+        assert mock_db_session.execute.call_count == 2
+
+        service = AIWorklogService(mock_db_session, mock_groq_client)
+        assert service._load_projects()[0]["code"] == "GEN3"
+        assert service._get_worktype_by_code("GEN3")["id"] == "P1"
+        assert mock_db_session.execute.call_count == 2
+
+        # Derived maps / match index are cached too, not rebuilt per instance
+        other = AIWorklogService(mock_db_session, mock_groq_client)
+        other._load_projects()
+        assert other._project_code_map is service._project_code_map
+        assert other._project_index is service._project_index
+
+
+class TestLLMClientPooling:
+    """LLM clients share one pooled httpx client across calls"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("client_cls", [GeminiClient, GroqClient])
+    async def test_http_client_reused_until_closed(self, client_cls):
+        client = client_cls()
+        http = client._get_client()
+        assert client._get_client() is http
+
+        await client.aclose()
+        assert http.is_closed
+        assert client._client is None
+
+        reopened = client._get_client()
+        assert reopened is not http
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "text",
+        ['{"a": 1}', '```json\n{"a": 1}\n```', ' ```\n{"a": 1}``` \n'],
+    )
+    @pytest.mark.parametrize(
+        "client_cls,wrap",
+        [
+            (
+                GeminiClient,
+                lambda t: {"candidates": [{"content": {"parts": [{"text": t}]}}]},
+            ),
+            (GroqClient, lambda t: {"choices": [{"message": {"content": t}}]}),
+        ],
+    )
+    async def test_generate_json_strips_markdown_fence(self, client_cls, wrap, text):
+        client = client_cls()
+        client.generate = AsyncMock(return_value=wrap(text))
+        assert await client.generate_json("prompt", "JSON") == {"a": 1}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("client_cls", [GeminiClient, GroqClient])
+    async def test_generate_round_trips_json_body(self, client_cls):
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["content_type"] = request.headers["Content-Type"]
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"echo": "한글"})
+
+        client = client_cls()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            assert await client.generate("작업 로그", "system") == {"echo": "한글"}
+        finally:
+            await client.aclose()
+
+        assert seen["content_type"] == "application/json"
+        assert "작업 로그" in json.dumps(seen["body"], ensure_ascii=False)
+
 
 class TestAIWorklogSchemas:
     """Tests for AI Worklog schemas"""
@@ -239,3 +597,216 @@ class TestAIWorklogSchemas:
         assert len(response.entries) == 1
         assert response.total_hours == 4.0
         assert len(response.warnings) == 1
+
+    def test_ai_worklog_entry_is_frozen(self):
+        """Test that parsed entries are immutable value objects"""
+        entry = AIWorklogEntry(description="test", hours=1.0)
+
+        with pytest.raises(ValueError):
+            entry.hours = 2.0
+
+    def test_parse_request_target_date_is_date(self):
+        """Test that target_date is parsed to a date at the edge"""
+        request = AIWorklogParseRequest(
+            text="test", user_id="user-1", target_date="2024-01-15"
+        )
+        assert request.target_date == date(2024, 1, 15)
+
+        with pytest.raises(ValueError):
+            AIWorklogParseRequest(text="test", user_id="user-1", target_date="15/01/2024")
+
+
+class TestUserRecentProjects:
+    """Tests for the per-user recent project loader against a database"""
+
+    @pytest.mark.asyncio
+    async def test_recent_projects_ordered_by_usage(
+        self, db_session, sample_sub_team, sample_department, sample_position
+    ):
+        """Test that recent projects come back in one query, most used first"""
+        from app.models.organization import BusinessUnit
+        from app.models.project import Program, ProjectType, Project
+        from app.models.resource import WorkLog
+        from app.models.user import User
+        from app.models.work_type import WorkTypeCategory
+
+        db_session.add_all(
+            [
+                BusinessUnit(id="BU_TEST", name="Test BU", code="BU"),
+                Program(id="PRG_TEST", name="Test Program", business_unit_id="BU_TEST"),
+                ProjectType(id="NPI", name="NPI"),
+                WorkTypeCategory(id=1, code="DEV", name="Development", level=1),
+                User(
+                    id="USER_AI",
+                    email="ai@example.com",
+                    hashed_password="hashed_password",
+                    name="AI User",
+                    department_id=sample_department.id,
+                    sub_team_id=sample_sub_team.id,
+                    position_id=sample_position.id,
+                ),
+            ]
+            + [
+                Project(
+                    id=f"PRJ_{code}",
+                    program_id="PRG_TEST",
+                    project_type_id="NPI",
+                    code=code,
+                    name=f"Project {code}",
+                )
+                for code in ("A", "B")
+            ]
+        )
+        today = date.today()
+        db_session.add_all(
+            [
+                WorkLog(
+                    date=today,
+                    user_id="USER_AI",
+                    project_id=project_id,
+                    work_type_category_id=1,
+                    hours=1.0,
+                )
+                for project_id in ("PRJ_B", "PRJ_A", "PRJ_B")
+            ]
+        )
+        db_session.commit()
+
+        service = AIWorklogService(db_session, MagicMock())
+        recent = service._load_user_recent_projects("USER_AI")
+
+        assert recent == [
+            {"id": "PRJ_B", "code": "B", "name": "Project B"},
+            {"id": "PRJ_A", "code": "A", "name": "Project A"},
+        ]
+
+        # Both personalization queries together, each on its own session
+        projects, work_types = await service._load_user_lists("USER_AI")
+        assert projects == recent
+        assert work_types == service._load_user_work_types("USER_AI")
+
+    def test_user_work_types_in_one_query(
+        self, db_session, sample_sub_team, sample_department, sample_position
+    ):
+        """Test that frequent types come first, then position types, in one query"""
+        from sqlalchemy import event
+        from app.models.resource import WorkLog
+        from app.models.user import User
+        from app.models.work_type import WorkTypeApplicableRole, WorkTypeCategory
+
+        db_session.add_all(
+            [
+                WorkTypeCategory(id=1, code="DEV", name="Development", level=1),
+                WorkTypeCategory(id=2, code="MTG", name="Meeting", level=1),
+                WorkTypeCategory(id=3, code="DOC", name="Documentation", level=1),
+                WorkTypeCategory(
+                    id=4, code="OLD", name="Retired", level=1, is_active=False
+                ),
+                WorkTypeCategory(id=5, code="LAB", name="Lab", level=1),
+                WorkTypeApplicableRole(category_id=3, role=sample_position.id),
+                WorkTypeApplicableRole(category_id=4, role=sample_position.id),
+                User(
+                    id="USER_WT",
+                    email="wt@example.com",
+                    hashed_password="hashed_password",
+                    name="WT User",
+                    department_id=sample_department.id,
+                    sub_team_id=sample_sub_team.id,
+                    position_id=sample_position.id,
+                ),
+            ]
+        )
+        today = date.today()
+        db_session.add_all(
+            [
+                WorkLog(
+                    date=today,
+                    user_id="USER_WT",
+                    work_type_category_id=wt_id,
+                    hours=hours,
+                )
+                for wt_id, hours in ((1, 2.0), (2, 3.0), (1, 0.5))
+            ]
+        )
+        db_session.commit()
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def count(*args):
+            statements.append(args)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            service = AIWorklogService(db_session, MagicMock())
+            work_types = service._load_user_work_types("USER_WT")
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert [w["code"] for w in work_types] == ["MTG", "DEV", "DOC"]
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_recent_inactive_project_still_matches(
+        self, db_session, sample_sub_team, sample_department, sample_position
+    ):
+        """Test that a recent Completed project matches; the cached map is untouched"""
+        from app.models.organization import BusinessUnit
+        from app.models.project import Program, ProjectType, Project
+        from app.models.resource import WorkLog
+        from app.models.user import User
+        from app.models.work_type import WorkTypeCategory
+        from app.services.lookup_cache import get_lookup
+
+        clear_lookup_cache()
+        db_session.add_all(
+            [
+                BusinessUnit(id="BU_TEST", name="Test BU", code="BU"),
+                Program(id="PRG_TEST", name="Test Program", business_unit_id="BU_TEST"),
+                ProjectType(id="NPI", name="NPI"),
+                WorkTypeCategory(id=1, code="DEV", name="Development", level=1),
+                User(
+                    id="USER_AI",
+                    email="ai@example.com",
+                    hashed_password="hashed_password",
+                    name="AI User",
+                    department_id=sample_department.id,
+                    sub_team_id=sample_sub_team.id,
+                    position_id=sample_position.id,
+                ),
+                Project(
+                    id="PRJ_DONE",
+                    program_id="PRG_TEST",
+                    project_type_id="NPI",
+                    code="DONE",
+                    name="Finished Project",
+                    status="Completed",
+                ),
+                WorkLog(
+                    date=date.today(),
+                    user_id="USER_AI",
+                    project_id="PRJ_DONE",
+                    work_type_category_id=1,
+                    hours=1.0,
+                ),
+            ]
+        )
+        db_session.commit()
+
+        client = MagicMock()
+        client.generate_json = AsyncMock(
+            return_value={
+                "entries": [
+                    {"project_id": "PRJ_DONE", "description": "마무리", "hours": 1.0}
+                ]
+            }
+        )
+        request = AIWorklogParseRequest(
+            text="마무리 작업", user_id="USER_AI", target_date=date.today()
+        )
+
+        result = await AIWorklogService(db_session, client).parse_worklog(request)
+
+        assert result.entries[0].project_id == "PRJ_DONE"
+        assert "PRJ_DONE" not in get_lookup(PROJECTS).by_id
+        clear_lookup_cache()
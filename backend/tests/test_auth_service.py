@@ -0,0 +1,59 @@
+"""
+Tests for credential checks in the authentication service.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.security import get_password_hash
+from app.models.user import User
+from app.services import auth_service
+from app.services.auth_service import authenticate_user
+
+
+@pytest.fixture
+def auth_user(db_session: Session, sample_sub_team, sample_department, sample_position):
+    user = User(
+        id="USER_AUTH",
+        email="auth@example.com",
+        hashed_password=get_password_hash("secret-pw"),
+        name="Auth User",
+        department_id=sample_department.id,
+        sub_team_id=sample_sub_team.id,
+        position_id=sample_position.id,
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def test_authenticate_user_valid_credentials(db_session, auth_user):
+    """Test that valid credentials return the full User row"""
+    db_session.expunge_all()
+
+    user = authenticate_user(db_session, "auth@example.com", "secret-pw")
+
+    assert isinstance(user, User)
+    assert (user.id, user.name) == ("USER_AUTH", "Auth User")
+
+
+def test_authenticate_user_rejects_bad_credentials(db_session, auth_user):
+    """Test that unknown email, wrong password and inactive users are rejected"""
+    assert authenticate_user(db_session, "nobody@example.com", "secret-pw") is None
+    assert authenticate_user(db_session, "auth@example.com", "wrong") is None
+
+    auth_user.is_active = False
+    db_session.commit()
+    assert authenticate_user(db_session, "auth@example.com", "secret-pw") is None
+
+
+def test_unknown_email_still_verifies_a_password(db_session, auth_user):
+    """Test that an unknown email pays the same hash check as a known one"""
+    with patch.object(
+        auth_service, "verify_password", wraps=auth_service.verify_password
+    ) as verify:
+        assert authenticate_user(db_session, "nobody@example.com", "pw") is None
+
+    verify.assert_called_once_with("pw", auth_service._DUMMY_HASH)
@@ -0,0 +1,426 @@
+"""
+Tests for the personal and team dashboard aggregations.
+"""
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.organization import BusinessUnit, Department, SubTeam
+from app.models.project import Program, ProjectType, Project, ProjectMilestone
+from app.models.resource import ResourcePlan, WorkLog
+from app.models.user import User
+from app.models.work_type import WorkTypeCategory
+from app.api.endpoints.departments import SubTeamCreate, create_sub_team
+from app.services.dashboard_service import DashboardService, _date_range_for
+from app.services.lookup_cache import clear_lookup_cache
+
+TODAY = date.today()
+
+
+@pytest.fixture(autouse=True)
+def fresh_org_cache():
+    """Org structure is cached process-wide; start and end each test cold."""
+    clear_lookup_cache()
+    yield
+    clear_lookup_cache()
+
+
+@pytest.fixture
+def dashboard_data(
+    db_session: Session, sample_division, sample_department, sample_sub_team, sample_position
+):
+    """
+    Two departments in one division, three sub-teams and three users.
+
+    USER_ME logs on P1 (key gate + plain milestone), the functional P_FN and
+    without a project; teammates spread hours over P1..P7.
+    """
+    db_session.add_all(
+        [
+            BusinessUnit(id="BU_TEST", name="Test BU", code="BU"),
+            Program(id="PRG_TEST", name="Test Program", business_unit_id="BU_TEST"),
+            ProjectType(id="NPI", name="NPI"),
+            WorkTypeCategory(id=1, code="DEV", name="Development", level=1),
+            SubTeam(
+                id="TEAM_B", name="Team B", code="TEAM_B", department_id=sample_department.id
+            ),
+            Department(
+                id="DEPT_B", name="Department B", code="DEPT_B", division_id=sample_division.id
+            ),
+            SubTeam(id="TEAM_C", name="Team C", code="TEAM_C", department_id="DEPT_B"),
+        ]
+        + [
+            User(
+                id=user_id,
+                email=f"{user_id.lower()}@example.com",
+                hashed_password="hashed_password",
+                name=user_id.title(),
+                korean_name=f"{user_id} KO",
+                department_id=department_id,
+                sub_team_id=sub_team_id,
+                position_id=sample_position.id,
+            )
+            for user_id, department_id, sub_team_id in (
+                ("USER_ME", sample_department.id, sample_sub_team.id),
+                ("USER_B", sample_department.id, "TEAM_B"),
+                ("USER_C", "DEPT_B", "TEAM_C"),
+            )
+        ]
+        + [
+            Project(
+                id=project_id,
+                program_id="PRG_TEST",
+                project_type_id="NPI",
+                code=f"C-{project_id}",
+                name=f"Project {project_id}",
+                category=category,
+            )
+            for project_id, category in (
+                ("P1", "PRODUCT"),
+                ("P_FN", "FUNCTIONAL"),
+                ("P3", "PRODUCT"),
+                ("P4", "PRODUCT"),
+                ("P5", "PRODUCT"),
+                ("P6", "PRODUCT"),
+                ("P7", "PRODUCT"),
+            )
+        ]
+        + [
+            ProjectMilestone(
+                project_id="P1",
+                name=name,
+                type="STD_GATE",
+                target_date=datetime(2026, 6, 1),
+                is_key_gate=is_key_gate,
+            )
+            for name, is_key_gate in (("G5", True), ("Kickoff", False))
+        ]
+    )
+    db_session.flush()
+    db_session.add_all(
+        [
+            WorkLog(
+                date=TODAY,
+                user_id=user_id,
+                project_id=project_id,
+                work_type_category_id=1,
+                hours=hours,
+            )
+            for user_id, project_id, hours in (
+                ("USER_ME", "P1", 3.0),
+                ("USER_ME", "P1", 1.0),
+                ("USER_ME", "P_FN", 2.0),
+                ("USER_ME", None, 1.5),
+                ("USER_B", "P3", 6.0),
+                ("USER_B", "P4", 5.0),
+                ("USER_B", "P5", 0.5),
+                ("USER_C", "P6", 7.0),
+                ("USER_C", "P7", 8.0),
+            )
+        ]
+        + [
+            ResourcePlan(
+                project_id=project_id,
+                year=TODAY.year,
+                month=TODAY.month,
+                position_id=sample_position.id,
+                user_id=user_id,
+                planned_hours=hours,
+                created_by="USER_ME",
+            )
+            for user_id, project_id, hours in (
+                ("USER_ME", "P1", 40.0),
+                ("USER_ME", "P3", 20.0),
+                ("USER_B", "P3", 80.0),
+            )
+        ]
+    )
+    db_session.commit()
+    return db_session
+
+
+@pytest.fixture
+def statements(dashboard_data):
+    """SQL statements executed while the test runs."""
+    executed = []
+    engine = dashboard_data.get_bind()
+
+    def record(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.mark.parametrize(
+    "view_mode, today, expected",
+    [
+        ("weekly", date(2026, 10, 17), (date(2026, 10, 12), date(2026, 10, 18))),
+        ("monthly", date(2028, 2, 10), (date(2028, 2, 1), date(2028, 2, 29))),
+        ("monthly", date(2026, 12, 31), (date(2026, 12, 1), date(2026, 12, 31))),
+        ("quarterly", date(2026, 5, 20), (date(2026, 4, 1), date(2026, 6, 30))),
+        ("quarterly", date(2026, 11, 2), (date(2026, 10, 1), date(2026, 12, 31))),
+        ("yearly", date(2026, 7, 4), (date(2026, 1, 1), date(2026, 12, 31))),
+    ],
+)
+def test_date_range_for(view_mode, today, expected):
+    """Test the inclusive period bounds for each view mode"""
+    assert _date_range_for(view_mode, today) == expected
+
+
+def test_my_dashboard(dashboard_data):
+    """Test weekly hours, allocation and key milestones for one user"""
+    result = DashboardService(dashboard_data).get_my_dashboard("USER_ME")
+
+    weekly = result["weekly_worklog"]
+    assert weekly["total_hours"] == 7.5
+    assert sorted(
+        weekly["by_project"], key=lambda p: p["hours"]
+    ) == [
+        {"project_id": None, "project_code": None, "project_name": None, "hours": 1.5},
+        {
+            "project_id": "P_FN",
+            "project_code": "C-P_FN",
+            "project_name": "Project P_FN",
+            "hours": 2.0,
+        },
+        {"project_id": "P1", "project_code": "C-P1", "project_name": "Project P1", "hours": 4.0},
+    ]
+    assert result["resource_allocation"] == {
+        "current_month": f"{TODAY.year}-{TODAY.month:02d}",
+        "total_fte": 60.0,
+        "active_projects": 2,
+    }
+
+    projects = {p["id"]: p for p in result["my_projects"]}
+    assert set(projects) == {"P1", "P3", "P_FN"}
+    assert [m["name"] for m in projects["P1"]["milestones"]] == ["G5"]
+    assert projects["P3"]["milestones"] == []
+
+
+def test_my_dashboard_unknown_user(dashboard_data):
+    """Test that an unknown user gets an empty dashboard"""
+    assert DashboardService(dashboard_data).get_my_dashboard("NOBODY") == {}
+
+
+def test_team_dashboard_department(dashboard_data):
+    """Test department scope: members, project split and sub-team breakdown"""
+    result = DashboardService(dashboard_data).get_team_dashboard(
+        "USER_ME", scope="department", view_mode="monthly"
+    )
+
+    assert result["team_info"] == {
+        "name": "Test Department",
+        "code": "TEST_DEPT",
+        "scope": "department",
+        "member_count": 2,
+        "org_path": ["Test Division", "Test Department", "Test Team"],
+    }
+    team = result["team_worklogs"]
+    assert team["total_hours"] == 19.0
+    assert [p["project_id"] for p in team["by_project"]] == [
+        "P3",
+        "P4",
+        "P1",
+        "P_FN",
+        None,
+        "others",
+    ]
+    assert team["by_project"][-1] == {
+        "project_id": "others",
+        "project_code": "기타",
+        "project_name": "1개 프로젝트",
+        "hours": 0.5,
+    }
+    assert team["project_vs_functional"] == {"Project": 17.0, "Functional": 2.0}
+
+    assert [(m["user_id"], m["hours"], m["percentage"]) for m in result[
+        "member_contributions"
+    ]] == [("USER_B", 11.5, 60.5), ("USER_ME", 7.5, 39.5)]
+    assert [
+        (o["org_id"], o["member_count"], o["hours"]) for o in result["sub_org_contributions"]
+    ] == [("TEAM_B", 1, 11.5), ("TEAM_TEST", 1, 7.5)]
+    assert result["resource_allocation"]["total_planned_fte"] == 140.0
+    assert result["resource_allocation"]["active_projects"] == 2
+    assert result["org_context"] == {"org_total_hours": 34.0, "team_percentage": 55.9}
+
+
+def test_team_dashboard_business_unit(dashboard_data):
+    """Test business unit scope: department breakdown across the division"""
+    result = DashboardService(dashboard_data).get_team_dashboard(
+        "USER_ME", scope="business_unit", view_mode="yearly"
+    )
+
+    assert result["team_info"]["name"] == "Test Division"
+    assert result["team_info"]["member_count"] == 3
+    assert result["team_worklogs"]["total_hours"] == 34.0
+    assert [
+        (o["org_id"], o["member_count"], o["hours"]) for o in result["sub_org_contributions"]
+    ] == [("DEPT_TEST", 2, 19.0), ("DEPT_B", 1, 15.0)]
+
+
+def test_team_dashboard_sub_team_and_all(dashboard_data):
+    """Test sub-team and company-wide scopes"""
+    service = DashboardService(dashboard_data)
+
+    sub_team = service.get_team_dashboard("USER_ME", scope="sub_team")
+    assert sub_team["team_info"]["code"] == "TEST_TEAM"
+    assert sub_team["team_worklogs"]["total_hours"] == 7.5
+    assert sub_team["sub_org_contributions"] == []
+
+    everyone = service.get_team_dashboard("USER_ME", scope="all", view_mode="quarterly")
+    assert everyone["team_info"]["member_count"] == 3
+    assert everyone["org_context"]["team_percentage"] == 100.0
+
+
+def test_team_dashboard_org_total_skips_inactive_users(dashboard_data):
+    """Test that hours of inactive users are left out of the org total"""
+    dashboard_data.get(User, "USER_C").is_active = False
+    dashboard_data.commit()
+
+    result = DashboardService(dashboard_data).get_team_dashboard(
+        "USER_ME", scope="department", view_mode="yearly"
+    )
+    assert result["org_context"] == {"org_total_hours": 19.0, "team_percentage": 100.0}
+
+
+def test_dashboards_join_project_details(dashboard_data, statements):
+    """Test that project details and milestones load without extra round-trips"""
+    service = DashboardService(dashboard_data)
+
+    service.get_my_dashboard("USER_ME")
+    # user, worklog + plan rollups (one UNION ALL), projects, milestones
+    assert len(statements) == 4
+    assert "UNION ALL" in statements[1]
+    # Key gate milestones are filtered in SQL, loaded without a JOIN
+    milestone_query = statements[-1]
+    assert "FROM project_milestones" in milestone_query
+    assert "is_key_gate" in milestone_query
+    assert "JOIN project_milestones" not in statements[-2]
+
+    statements.clear()
+    service.get_team_dashboard("USER_ME", scope="sub_team")
+    assert not any(
+        s.lstrip().startswith("SELECT projects.") for s in statements
+    )
+
+
+def test_team_dashboard_user_without_sub_team(dashboard_data):
+    """Test that the org lookup tolerates a missing sub-team"""
+    service = DashboardService(dashboard_data)
+    dashboard_data.get(User, "USER_B").sub_team_id = None
+    dashboard_data.commit()
+    dashboard_data.expunge_all()
+
+    result = service.get_team_dashboard("USER_B", scope="sub_team")
+    assert result["team_info"]["code"] == "ENG"
+    assert result["team_info"]["org_path"] == []
+
+
+@pytest.mark.parametrize("scope", ["department", "business_unit"])
+def test_team_dashboard_reads_org_structure_once(dashboard_data, statements, scope):
+    """Test that sub-teams/departments are read in a single query per call"""
+    DashboardService(dashboard_data).get_team_dashboard("USER_ME", scope=scope)
+
+    org_reads = [
+        s for s in statements if "FROM sub_teams" in s or "FROM departments" in s
+    ]
+    assert len(org_reads) == 1
+
+
+def test_team_dashboard_query_count_independent_of_team_size(
+    dashboard_data, statements, sample_department, sample_position
+):
+    """Test that adding members does not add queries (no lazy loads per member)"""
+
+    def business_unit_dashboard():
+        # A fresh service per call, as per request
+        return DashboardService(dashboard_data).get_team_dashboard(
+            "USER_ME", scope="business_unit"
+        )
+
+    business_unit_dashboard()
+    baseline = len(statements)
+
+    dashboard_data.add_all(
+        [
+            User(
+                id=f"EXTRA_{i}",
+                email=f"extra{i}@example.com",
+                hashed_password="hashed_password",
+                name=f"Extra {i}",
+                department_id=sample_department.id,
+                sub_team_id="TEAM_B",
+                position_id=sample_position.id,
+            )
+            for i in range(10)
+        ]
+    )
+    dashboard_data.commit()
+    dashboard_data.expunge_all()
+    clear_lookup_cache()
+
+    statements.clear()
+    result = business_unit_dashboard()
+    assert result["team_info"]["member_count"] == 13
+    assert len(statements) == baseline
+
+
+@pytest.mark.asyncio
+async def test_team_dashboard_caches_org_structure(dashboard_data, statements):
+    """Test that org structure is reused across calls until a sub-team write"""
+
+    def department_dashboard():
+        # A fresh service per call, as per request
+        return DashboardService(dashboard_data).get_team_dashboard(
+            "USER_ME", scope="department"
+        )
+
+    def org_reads():
+        return [s for s in statements if "FROM sub_teams" in s or "FROM departments" in s]
+
+    department_dashboard()
+    assert len(org_reads()) == 1
+
+    statements.clear()
+    department_dashboard()
+    assert org_reads() == []
+
+    await create_sub_team(
+        "DEPT_TEST",
+        SubTeamCreate(name="Team New", code="NEW", department_id="DEPT_TEST"),
+        db=dashboard_data,
+    )
+    statements.clear()
+    result = department_dashboard()
+    assert len(org_reads()) == 1
+    assert "ST_NEW" in [o["org_id"] for o in result["sub_org_contributions"]]
+
+
+def test_team_dashboard_filters_aggregates_by_member_subquery(dashboard_data, statements):
+    """Test that aggregates select team members in SQL instead of an id list"""
+    DashboardService(dashboard_data).get_team_dashboard("USER_ME", scope="all")
+
+    member_filtered = [s for s in statements if "IN (SELECT users.id" in s]
+    # project ranking, member hours, resource plans
+    assert len(member_filtered) == 3
+    assert not any("IN (?, ?" in s for s in statements)
+
+
+def test_dashboards_memoized_per_service_instance(dashboard_data, statements):
+    """Test that repeating a dashboard call on one service runs no queries"""
+    service = DashboardService(dashboard_data)
+    my = service.get_my_dashboard("USER_ME")
+    team = service.get_team_dashboard("USER_ME", scope="department")
+
+    statements.clear()
+    assert service.get_my_dashboard("USER_ME") is my
+    assert service.get_team_dashboard("USER_ME", scope="department") is team
+    assert statements == []
+
+    service.get_team_dashboard("USER_ME", scope="sub_team")
+    assert statements
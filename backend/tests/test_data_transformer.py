@@ -0,0 +1,155 @@
+"""
+Tests for the Power BI/CSV data transformer.
+"""
+
+import io
+import uuid
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from app.services.data_transformer import (
+    DataTransformer,
+    ValueTransformer,
+    clean_fields,
+    write_copy_rows,
+)
+
+
+@pytest.fixture
+def transformer():
+    """Transformer with two users, two projects and one mapped work type."""
+    transformer = DataTransformer()
+    transformer.lookup.user_id_map = {"1": "USER_A", "2": "USER_B"}
+    transformer.lookup.project_id_map = {"10": "PRJ_A", "11": "PRJ_B"}
+    transformer.lookup.worktype_map = {"5": "Design"}
+    transformer.set_work_type_category_map({"Design": 7})
+    return transformer
+
+
+WORKLOG_ROWS = [
+    {
+        "Createdby.Id": "1",
+        "Project.Id": "10",
+        "Worktype.Id": "5",
+        "Date": "2025-01-02 09:00:00",
+        "Hours": "1.5",
+        "Title": " Review ",
+        "SuddenWork?": "yes",
+        "BusinessTrip": True,
+    },
+    {
+        "Createdby.Id": " 2 ",
+        "Project.Id": "11",
+        "Worktype.Id": None,
+        "Date": "2025-01-03T08:00",
+        "Hours": "n/a",
+        "Title": "",
+        "SuddenWork?": None,
+        "BusinessTrip": "0",
+    },
+    {"Createdby.Id": "9", "Project.Id": "10", "Date": "2025-01-02", "Hours": 1},
+    {"Createdby.Id": "1", "Project.Id": "99", "Date": "2025-01-02", "Hours": 1},
+    {"Createdby.Id": "1", "Project.Id": "10", "Date": "02/01/2025", "Hours": 1},
+    {"Createdby.Id": None, "Project.Id": None, "Date": None, "Hours": None},
+]
+
+
+def test_transform_worklogs_df_matches_row_transform(transformer):
+    """Test that the column-wise worklog transform equals the per-row one"""
+    worklogs, errors = transformer.transform_worklogs_df(pd.DataFrame(WORKLOG_ROWS))
+
+    results = [transformer.transform_worklog(row) for row in WORKLOG_ROWS]
+    assert worklogs == [r.data for r in results if r.success]
+    assert errors == [r.error for r in results if not r.success]
+    assert errors == [
+        "Unknown user ID: 9",
+        "Unknown project ID: 99",
+        "Invalid date: 02/01/2025",
+        "Unknown user ID: None",
+    ]
+    assert worklogs[0]["work_type_category_id"] == 7
+    assert worklogs[1]["hours"] == 0.0
+    assert worklogs[1]["work_type_category_id"] is None
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2025-01-02", date(2025, 1, 2)),
+        (" 2025-01-02 09:30:00", date(2025, 1, 2)),
+        ("2025-01-02T09:30:00", date(2025, 1, 2)),
+        ("2025-1-2", date(2025, 1, 2)),
+        (datetime(2025, 1, 2, 9, 30), date(2025, 1, 2)),
+        (date(2025, 1, 2), date(2025, 1, 2)),
+        ("2025-02-30", None),
+        ("02/01/2025", None),
+        ("2025-W01-1", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_date(value, expected):
+    """Test ISO date parsing, time parts dropped, invalid input -> None"""
+    result = ValueTransformer.parse_date(value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_write_copy_rows():
+    """Test COPY text output: tabs, \\N for NULL, t/f, ISO dates, escapes"""
+    out = io.StringIO()
+    count = write_copy_rows(
+        [
+            {
+                "date": date(2025, 1, 2),
+                "hours": 1.5,
+                "description": "a\tb\\c\nd",
+                "flag": True,
+            },
+            {"date": date(2025, 1, 3), "hours": 2, "description": None, "flag": False},
+        ],
+        ("date", "hours", "description", "flag"),
+        out,
+    )
+
+    assert count == 2
+    assert out.getvalue() == (
+        "2025-01-02\t1.5\ta\\tb\\\\c\\nd\tt\n" "2025-01-03\t2\t\\N\tf\n"
+    )
+
+
+def test_transformed_ids_are_time_ordered_uuid7(transformer):
+    """Test user/project ids use the models' UUIDv7 generator, one per row"""
+    ids = [
+        transformer.transform_project({"ID": str(i), "Project": f"P{i}"}).data["id"]
+        for i in range(300)
+    ]
+
+    assert len(set(ids)) == len(ids)
+    for value in ids:
+        parsed = uuid.UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+
+
+@pytest.mark.parametrize(
+    "department,business_area,expected",
+    [
+        ("Software", "Abatement", "ST_CTRL_SW_ABT"),
+        ("Software", None, None),
+        ("ETO Elec", "IntegratedSystem", "ST_ETO_ELEC"),
+        ("RA", None, "ST_RA"),
+        ("Unknown", "Abatement", None),
+        (None, "Abatement", None),
+    ],
+)
+def test_get_sub_team_id(transformer, department, business_area, expected):
+    assert transformer.lookup.get_sub_team_id(department, business_area) == expected
+
+
+def test_clean_fields():
+    row = {"a": "  x ", "b": "", "c": 5}
+    assert clean_fields(row, ("a", "b", "c", "missing")) == ("x", None, "5", None)
@@ -8,7 +8,11 @@ Tests cover:
 """
 
 import pytest
-from app.services.matching_service import FuzzyMatcher
+from app.services.matching_service import (
+    FuzzyMatcher,
+    ProjectMatchIndex,
+    WorkTypeMatchIndex,
+)
 from app.services.text_preprocessor import KoreanTextPreprocessor
 from app.services.keyword_mappings import (
     get_project_code_by_keyword,
@@ -106,6 +110,51 @@ class TestFuzzyMatcher:
         result = matcher.match_project("NONEXISTENT_PROJECT_XYZ", sample_projects)
         assert result is None
 
+    def test_project_id_prefix_prefers_earlier_project(self, matcher):
+        """Test that an earlier 8-char prefix match wins over a later exact ID"""
+        projects = [
+            {"id": "abcd1234-0001", "code": "A", "name": "First"},
+            {"id": "abcd1234-0002", "code": "B", "name": "Second"},
+            {"id": "406", "code": "C", "name": "Short"},
+        ]
+        project, confidence = matcher.match_project("abcd1234-0002", projects)
+        assert project["name"] == "First"
+        assert confidence == 0.98
+
+        project, confidence = matcher.match_project("406-XYZ-99", projects)
+        assert project["name"] == "Short"
+        assert confidence == 0.98
+
+    def test_prioritized_index_matches_reordered_list(self, matcher, sample_projects):
+        """Test that a re-ranked index matches like the reordered plain list"""
+        recent = [sample_projects[3], {"id": "999999", "code": "999999", "name": "Gen3 Legacy"}]
+        reordered = recent + [p for p in sample_projects if p is not sample_projects[3]]
+        index = ProjectMatchIndex(sample_projects).prioritized(recent)
+
+        for term in ["Gen3", "406437", "406886-1", "Legacy"]:
+            expected = matcher.match_project(term, reordered)
+            actual = matcher.match_project(term, index)
+            assert (actual and (actual[0]["id"], actual[1])) == (
+                expected and (expected[0]["id"], expected[1])
+            )
+
+    def test_project_match_with_prebuilt_index(self, matcher, sample_projects):
+        """Test that a reused ProjectMatchIndex matches like the plain list"""
+        index = ProjectMatchIndex(sample_projects)
+        for term in ["888888-160", "406886", "OQC", "Protron Single", "NONEXISTENT_XYZ"]:
+            assert matcher.match_project(term, index, threshold=0.5) == matcher.match_project(
+                term, sample_projects, threshold=0.5
+            )
+
+    def test_work_type_match_with_prebuilt_index(self, matcher, sample_work_types):
+        """Test that a reused WorkTypeMatchIndex matches like the plain list"""
+        work_types = sample_work_types + [{"id": 42, "code": None, "name": "QA"}]
+        index = WorkTypeMatchIndex(work_types)
+        for term in ["eng-des", "42", "ENG", "meeting", "Sim", "Desgn Reviw", "ZZZ"]:
+            assert matcher.match_work_type(term, index) == matcher.match_work_type(
+                term, work_types
+            )
+
     def test_work_type_exact_id_match(self, matcher, sample_work_types):
         """Test exact ID matching for work types"""
         result = matcher.match_work_type("ENG-DES", sample_work_types)
@@ -206,6 +255,11 @@ class TestKoreanTextPreprocessor:
         result = preprocessor.normalize("프로트론 관련 업무")
         assert "PROTRON" in result
 
+    def test_alias_expansion_mixed_case_both_groups(self, preprocessor):
+        """Test that project and work type aliases expand case-insensitively"""
+        result = preprocessor.normalize("젠쓰리 sw 트러블슛, 하바수 Hw 미팅")
+        assert result == "GEN3 소프트웨어 트러블슈팅, HAVASU 하드웨어 회의"
+
     def test_postposition_removal(self, preprocessor):
         """Test Korean postposition removal"""
         result = preprocessor.normalize("OQC인프라를 설계")
@@ -0,0 +1,99 @@
+"""
+Tests for ProjectService list queries.
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.organization import BusinessUnit
+from app.models.project import Program, ProjectType, Project
+from app.models.user import User
+from app.schemas.project import ProjectListItem
+from app.services.project_service import ProjectService
+
+
+@pytest.fixture
+def project_data(db_session: Session, sample_sub_team, sample_department, sample_position):
+    """Two projects in one program, only the first with a PM."""
+    db_session.add_all(
+        [
+            BusinessUnit(id="BU_TEST", name="Test BU", code="BU"),
+            Program(id="PRG_TEST", name="Test Program", business_unit_id="BU_TEST"),
+            ProjectType(id="NPI", name="NPI"),
+            User(
+                id="USER_PM",
+                email="pm@example.com",
+                hashed_password="hashed_password",
+                name="PM User",
+                department_id=sample_department.id,
+                sub_team_id=sample_sub_team.id,
+                position_id=sample_position.id,
+                role="PM",
+            ),
+            Project(
+                id="PRJ_A",
+                program_id="PRG_TEST",
+                project_type_id="NPI",
+                code="IO-A",
+                name="Project A",
+                pm_id="USER_PM",
+            ),
+            Project(
+                id="PRJ_B",
+                program_id="PRG_TEST",
+                project_type_id="NPI",
+                code="IO-B",
+                name="Project B",
+            ),
+        ]
+    )
+    db_session.commit()
+
+
+class TestProjectListFlat:
+    """Test the flat project list query."""
+
+    def test_related_names_are_flat_fields(self, db_session: Session, project_data):
+        """Program, type and PM names come back as scalars from one query."""
+        projects = ProjectService(db_session).get_multi_flat()
+
+        assert [p["code"] for p in projects] == ["IO-A", "IO-B"]
+        first, second = (ProjectListItem(**p) for p in projects)
+        assert first.program_name == "Test Program"
+        assert first.project_type_name == "NPI"
+        assert first.pm_name == "PM User"
+        assert first.pm_email == "pm@example.com"
+        assert first.recent_activity_score == 0
+        assert second.pm_name is None
+
+    def test_filters_apply(self, db_session: Session, project_data):
+        """Filters match the nested list endpoint."""
+        projects = ProjectService(db_session).get_multi_flat(program_id="PRG_NONE")
+
+        assert projects == []
+
+
+class TestLookupCacheInvalidation:
+    """Project writes drop the shared project lookup cache"""
+
+    def test_update_invalidates_projects_lookup(
+        self, db_session: Session, project_data
+    ):
+        from app.schemas.project import ProjectUpdate
+        from app.services.lookup_cache import (
+            PROJECTS,
+            clear_lookup_cache,
+            get_lookup,
+            store_lookup,
+        )
+
+        clear_lookup_cache()
+        store_lookup(PROJECTS, [{"id": "PRJ_A", "code": "IO-A", "name": "Project A"}])
+        assert get_lookup(PROJECTS) is not None
+
+        ProjectService(db_session).update_project(
+            "PRJ_A", ProjectUpdate(name="Renamed")
+        )
+
+        assert get_lookup(PROJECTS) is None
+        clear_lookup_cache()
@@ -0,0 +1,158 @@
+"""
+Tests for Resource Allocation Matrix service and schema.
+"""
+
+import json
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.api.endpoints.resource_matrix import get_allocation_matrix
+from app.models.organization import BusinessUnit, JobPosition, ProjectRole
+from app.models.project import Program, ProjectType, Project
+from app.models.resource import ResourcePlan
+from app.schemas.resource_matrix import ResourceAllocationMatrix, MATRIX_ADAPTER
+from app.services.resource_matrix_service import (
+    generate_month_range,
+    get_resource_allocation_matrix,
+    stream_resource_allocation_matrix,
+)
+
+
+@pytest.fixture
+def matrix_data(db_session: Session):
+    """One program with two projects; only the first has plans."""
+    db_session.add_all(
+        [
+            BusinessUnit(id="BU_TEST", name="Test BU", code="BU"),
+            Program(id="PRG_TEST", name="Test Program", business_unit_id="BU_TEST"),
+            ProjectType(id="NPI", name="NPI"),
+            JobPosition(id="JP_SW", name="SW Engineer"),
+            ProjectRole(id="PR_SW", name="Software Engineer"),
+            Project(
+                id="PRJ_A",
+                program_id="PRG_TEST",
+                project_type_id="NPI",
+                code="IO-A",
+                name="Project A",
+            ),
+            Project(
+                id="PRJ_B",
+                program_id="PRG_TEST",
+                project_type_id="NPI",
+                code="IO-B",
+                name="Project B",
+            ),
+        ]
+    )
+    db_session.add_all(
+        [
+            ResourcePlan(
+                project_id="PRJ_A",
+                year=2026,
+                month=1,
+                position_id="JP_SW",
+                project_role_id="PR_SW",
+                planned_hours=80,
+                created_by="USER_ADMIN",
+            ),
+            ResourcePlan(
+                project_id="PRJ_A",
+                year=2026,
+                month=2,
+                position_id="JP_SW",
+                planned_hours=160,
+                created_by="USER_ADMIN",
+            ),
+        ]
+    )
+    db_session.commit()
+
+
+class TestGenerateMonthRange:
+    """Test month key generation."""
+
+    def test_crosses_year_boundary(self):
+        assert generate_month_range("2025-11", "2026-02") == [
+            "2025-11",
+            "2025-12",
+            "2026-01",
+            "2026-02",
+        ]
+
+
+class TestResourceAllocationMatrix:
+    """Test matrix aggregation and serialization."""
+
+    def test_matrix_aggregates_by_program_and_month(
+        self, db_session: Session, matrix_data
+    ):
+        """Plans roll up into project, program and grand totals per month."""
+        matrix = get_resource_allocation_matrix(db_session, "2026-01", "2026-03")
+
+        assert matrix.months == ["2026-01", "2026-02", "2026-03"]
+        assert len(matrix.programs) == 1
+
+        program = matrix.programs[0]
+        assert program.program_id == "PRG_TEST"
+        # Projects without any allocation are omitted
+        assert [p.project_id for p in program.projects] == ["PRJ_A"]
+        assert program.total_by_month == [0.5, 1.0, 0.0]
+        assert matrix.grand_total_by_month == program.total_by_month
+
+    def test_matrix_serializes_to_json_shape(self, db_session: Session, matrix_data):
+        """Per-month values serialize as lists aligned with months."""
+        matrix = get_resource_allocation_matrix(db_session, "2026-01", "2026-01")
+        data = matrix.model_dump(mode="json")
+
+        row = data["programs"][0]["projects"][0]
+        assert row["project_code"] == "IO-A"
+        assert row["total_fte"] == [0.5]
+        assert row["details"] == [
+            [
+                {
+                    "user_id": None,
+                    "name": "TBD",
+                    "role": "Software Engineer",
+                    "position": "SW Engineer",
+                    "fte": 0.5,
+                }
+            ]
+        ]
+        # Round-trips through validation (as FastAPI does for response_model)
+        assert ResourceAllocationMatrix.model_validate(data).months == ["2026-01"]
+
+
+
+class TestStreamResourceMatrix:
+    """Test the streamed JSON document."""
+
+    def test_stream_matches_full_serialization(
+        self, db_session: Session, matrix_data
+    ):
+        """Concatenated chunks equal the non-streamed matrix JSON."""
+        matrix = get_resource_allocation_matrix(db_session, "2026-01", "2026-03")
+        chunks = stream_resource_allocation_matrix(db_session, "2026-01", "2026-03")
+
+        assert b"".join(chunks) == MATRIX_ADAPTER.dump_json(matrix)
+
+    def test_invalid_month_raises_before_streaming(self, db_session: Session):
+        """Bad input fails eagerly so the endpoint can still return 400."""
+        with pytest.raises(ValueError):
+            stream_resource_allocation_matrix(db_session, "2026-13", "2026-01")
+
+
+class TestResourceMatrixEndpoint:
+    """Test the allocation endpoint response."""
+
+    @pytest.mark.asyncio
+    async def test_allocation_endpoint_json(self, db_session: Session, matrix_data):
+        """Endpoint streams the matrix as JSON with positional month lists."""
+        response = get_allocation_matrix(
+            start_month="2026-01", end_month="2026-02", db=db_session
+        )
+
+        assert response.media_type == "application/json"
+        body = json.loads(b"".join([chunk async for chunk in response.body_iterator]))
+        assert body["months"] == ["2026-01", "2026-02"]
+        assert body["grand_total_by_month"] == [0.5, 1.0]
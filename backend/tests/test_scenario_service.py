@@ -0,0 +1,75 @@
+"""
+Tests for ScenarioService comparisons.
+"""
+
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.models.organization import BusinessUnit
+from app.models.project import Program, ProjectType, Project
+from app.models.scenario import ProjectScenario, ScenarioMilestone
+from app.schemas.scenario import MilestoneComparison
+from app.services.scenario_service import ScenarioService
+
+
+class TestCompareScenarios:
+    """Milestone comparison output"""
+
+    def _scenario(self, db: Session, scenario_id: int, name: str, milestones):
+        db.add(ProjectScenario(id=scenario_id, project_id="PRJ_SC", name=name))
+        for ms_name, target in milestones:
+            db.add(
+                ScenarioMilestone(
+                    scenario_id=scenario_id,
+                    name=ms_name,
+                    type="CUSTOM",
+                    target_date=target,
+                )
+            )
+
+    def test_compare_returns_dataclass_rows(self, db_session: Session):
+        db_session.add_all(
+            [
+                BusinessUnit(id="BU_SC", name="BU", code="BU"),
+                Program(id="PRG_SC", name="Program", business_unit_id="BU_SC"),
+                ProjectType(id="NPI", name="NPI"),
+                Project(
+                    id="PRJ_SC",
+                    program_id="PRG_SC",
+                    project_type_id="NPI",
+                    code="SC-1",
+                    name="Scenario Project",
+                ),
+            ]
+        )
+        self._scenario(
+            db_session,
+            1,
+            "Base",
+            [("Gate 1", datetime(2025, 1, 1)), ("Gate 2", datetime(2025, 3, 1))],
+        )
+        self._scenario(db_session, 2, "Late", [("Gate 1", datetime(2025, 1, 11))])
+        db_session.commit()
+
+        result = ScenarioService(db_session).compare_scenarios(1, 2)
+
+        assert result.total_delta_days == 10
+        assert all(
+            isinstance(c, MilestoneComparison) for c in result.milestone_comparisons
+        )
+        dumped = result.model_dump(mode="json")["milestone_comparisons"]
+        assert dumped == [
+            {
+                "milestone_name": "Gate 1",
+                "scenario_1_date": "2025-01-01T00:00:00",
+                "scenario_2_date": "2025-01-11T00:00:00",
+                "delta_days": 10,
+            },
+            {
+                "milestone_name": "Gate 2",
+                "scenario_1_date": "2025-03-01T00:00:00",
+                "scenario_2_date": None,
+                "delta_days": None,
+            },
+        ]
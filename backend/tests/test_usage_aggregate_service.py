@@ -0,0 +1,157 @@
+"""
+Tests for the per-user usage aggregates behind AI worklog personalization.
+"""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.models.organization import BusinessUnit
+from app.models.project import Program, ProjectType, Project
+from app.models.resource import UserProjectUsage, UserWorkTypeUsage, WorkLog
+from app.models.user import User
+from app.models.work_type import WorkTypeCategory
+from app.services.ai_worklog_service import AIWorklogService
+from app.services.usage_aggregate_service import (
+    USAGE_WINDOW_DAYS,
+    refresh_usage_aggregates,
+)
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def usage_data(db_session: Session, sample_sub_team, sample_department, sample_position):
+    """One user with recent worklogs on two projects and one stale worklog."""
+    db_session.add_all(
+        [
+            BusinessUnit(id="BU_TEST", name="Test BU", code="BU"),
+            Program(id="PRG_TEST", name="Test Program", business_unit_id="BU_TEST"),
+            ProjectType(id="NPI", name="NPI"),
+            WorkTypeCategory(id=1, code="DEV", name="Development", level=1),
+            WorkTypeCategory(id=2, code="MTG", name="Meeting", level=1),
+            User(
+                id="USER_UA",
+                email="usage@example.com",
+                hashed_password="hashed_password",
+                name="Usage User",
+                department_id=sample_department.id,
+                sub_team_id=sample_sub_team.id,
+                position_id=sample_position.id,
+            ),
+        ]
+        + [
+            Project(
+                id=f"PRJ_{code}",
+                program_id="PRG_TEST",
+                project_type_id="NPI",
+                code=code,
+                name=f"Project {code}",
+            )
+            for code in ("A", "B")
+        ]
+    )
+    db_session.add_all(
+        [
+            WorkLog(
+                date=day,
+                user_id="USER_UA",
+                project_id=project_id,
+                work_type_category_id=wt_id,
+                hours=hours,
+            )
+            for day, project_id, wt_id, hours in (
+                (TODAY, "PRJ_A", 1, 2.0),
+                (TODAY, "PRJ_B", 2, 1.0),
+                (TODAY, None, 2, 3.0),
+                (TODAY - timedelta(days=USAGE_WINDOW_DAYS + 1), "PRJ_B", 1, 8.0),
+            )
+        ]
+    )
+    db_session.commit()
+    return db_session
+
+
+def test_refresh_aggregates_recent_worklogs(usage_data):
+    """Test that only worklogs inside the window are aggregated"""
+    refresh_usage_aggregates(usage_data)
+
+    work_types = usage_data.execute(
+        select(UserWorkTypeUsage.work_type_category_id, UserWorkTypeUsage.total_hours_90d)
+        .order_by(UserWorkTypeUsage.work_type_category_id)
+    ).all()
+    projects = usage_data.execute(
+        select(UserProjectUsage.project_id, UserProjectUsage.usage_count_90d)
+        .order_by(UserProjectUsage.project_id)
+    ).all()
+
+    assert work_types == [(1, 2.0), (2, 4.0)]
+    assert projects == [("PRJ_A", 1), ("PRJ_B", 1)]
+
+
+def test_refresh_aggregates_stamp_server_time(usage_data):
+    """Test that refreshed rows take updated_at from the server default"""
+    statements = []
+    engine = usage_data.get_bind()
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        refresh_usage_aggregates(usage_data)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    inserts = [sql for sql in statements if sql.startswith("INSERT")]
+    assert len(inserts) == 2
+    assert all("updated_at" not in sql for sql in inserts)
+    stamps = usage_data.execute(select(UserWorkTypeUsage.updated_at)).scalars().all()
+    assert stamps and None not in stamps
+
+
+def test_loaders_read_aggregates_once_refreshed(usage_data):
+    """Test that personalization ranks by the aggregates, not live worklogs"""
+    refresh_usage_aggregates(usage_data)
+    # Logged after the refresh: not visible until the next one
+    usage_data.add_all(
+        [
+            WorkLog(
+                date=TODAY,
+                user_id="USER_UA",
+                project_id="PRJ_B",
+                work_type_category_id=1,
+                hours=hours,
+            )
+            for hours in (4.0, 4.0)
+        ]
+    )
+    usage_data.commit()
+
+    service = AIWorklogService(usage_data, MagicMock())
+
+    assert [p["id"] for p in service._load_user_recent_projects("USER_UA")] == [
+        "PRJ_A",
+        "PRJ_B",
+    ]
+    assert [w["code"] for w in service._load_user_work_types("USER_UA")] == [
+        "MTG",
+        "DEV",
+    ]
+
+
+def test_loaders_fall_back_to_worklogs_before_refresh(usage_data):
+    """Test that a user without aggregate rows is ranked from worklogs"""
+    service = AIWorklogService(usage_data, MagicMock())
+
+    assert [w["code"] for w in service._load_user_work_types("USER_UA")] == [
+        "MTG",
+        "DEV",
+    ]
+    assert {p["id"] for p in service._load_user_recent_projects("USER_UA")} == {
+        "PRJ_A",
+        "PRJ_B",
+    }
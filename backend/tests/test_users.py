@@ -2,10 +2,18 @@
 Tests for User model and its relationship with organization hierarchy.
 """
 
+import time
+import uuid
+
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.exc import InvalidRequestError, StatementError
+from sqlalchemy.orm import Session, selectinload
+
+from pydantic import ValidationError
 
-from app.models.user import User
+from app.models.user import Role, User, generate_uuid
+from app.schemas.user import User as UserSchema, UserCreate
 from app.models.organization import SubTeam
 
 
@@ -135,3 +143,139 @@ class TestUserModel:
         assert user.is_active is True
         assert user.role == "USER"
         assert user.created_at is not None
+
+    def test_collections_require_eager_loading(
+        self, db_session: Session, sample_sub_team, sample_department, sample_position
+    ):
+        """Large user collections raise on implicit lazy load."""
+        user = User(
+            id="USER_LAZY",
+            email="lazy@example.com",
+            hashed_password="hashed_password",
+            name="Lazy User",
+            department_id=sample_department.id,
+            sub_team_id=sample_sub_team.id,
+            position_id=sample_position.id,
+        )
+        db_session.add(user)
+        db_session.commit()
+        db_session.expire_all()
+
+        saved = db_session.query(User).filter_by(id="USER_LAZY").one()
+        with pytest.raises(InvalidRequestError):
+            _ = saved.worklogs
+
+        db_session.expire_all()
+        eager = (
+            db_session.query(User)
+            .options(selectinload(User.worklogs), selectinload(User.history))
+            .filter_by(id="USER_LAZY")
+            .one()
+        )
+        assert eager.worklogs == []
+        assert eager.history == []
+
+    def test_role_stored_as_small_integer(
+        self, db_session: Session, sample_sub_team, sample_department, sample_position
+    ):
+        """Role is stored as an integer code but read and filtered as a name."""
+        user = User(
+            id="USER_PM",
+            email="pm@example.com",
+            hashed_password="hashed_password",
+            name="PM User",
+            department_id=sample_department.id,
+            sub_team_id=sample_sub_team.id,
+            position_id=sample_position.id,
+            role="PM",
+        )
+        db_session.add(user)
+        db_session.commit()
+
+        raw = db_session.execute(
+            text("SELECT role FROM users WHERE id = 'USER_PM'")
+        ).scalar()
+        assert raw == Role.PM.value
+
+        saved = db_session.query(User).filter(User.role == "PM").one()
+        assert saved.role == "PM"
+
+    def test_timestamps_filled_by_database(
+        self, db_session: Session, sample_sub_team, sample_department, sample_position
+    ):
+        """created_at/updated_at come from the server default on insert."""
+        user = User(
+            id="USER_TS",
+            email="ts@example.com",
+            hashed_password="hashed_password",
+            name="Timestamp User",
+            department_id=sample_department.id,
+            sub_team_id=sample_sub_team.id,
+            position_id=sample_position.id,
+        )
+        db_session.add(user)
+        db_session.commit()
+        db_session.refresh(user)
+
+        assert user.created_at is not None
+        assert user.updated_at is not None
+
+    def test_unknown_role_rejected(
+        self, db_session: Session, sample_sub_team, sample_department, sample_position
+    ):
+        """Unknown role names fail at flush instead of being stored."""
+        user = User(
+            id="USER_BAD",
+            email="bad@example.com",
+            hashed_password="hashed_password",
+            name="Bad Role",
+            department_id=sample_department.id,
+            sub_team_id=sample_sub_team.id,
+            position_id=sample_position.id,
+            role="SUPERUSER",
+        )
+        db_session.add(user)
+        with pytest.raises(StatementError):
+            db_session.commit()
+
+
+class TestGenerateUuid:
+    """Test time-ordered primary key generation."""
+
+    def test_uuid7_format(self):
+        """Generated ids are valid version-7 UUIDs in 36-char form."""
+        value = generate_uuid()
+        parsed = uuid.UUID(value)
+
+        assert len(value) == 36
+        assert str(parsed) == value
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+
+    def test_uuid7_time_ordered(self):
+        """Ids generated in later milliseconds sort after earlier ones."""
+        first = generate_uuid()
+        time.sleep(0.002)
+        second = generate_uuid()
+
+        assert first < second
+
+
+class TestUserEmailSchemas:
+    """Email checks on user schemas"""
+
+    def _fields(self, email):
+        return dict(email=email, name="User", department_id="DEPT", position_id="POS")
+
+    def test_response_schema_checks_shape_only(self):
+        """Stored addresses are accepted as long as they look like emails"""
+        user = UserSchema(id="USER_1", **self._fields("kim@edwards.local"))
+        assert user.email == "kim@edwards.local"
+
+        with pytest.raises(ValidationError):
+            UserSchema(id="USER_1", **self._fields("not-an-email"))
+
+    def test_create_schema_keeps_strict_validation(self):
+        """New users still go through email-validator"""
+        with pytest.raises(ValidationError):
+            UserCreate(password="pw", **self._fields("a@b..com"))
@@ -0,0 +1,109 @@
+"""
+Tests for Work Type Categories and their applicable-role links.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.work_type import WorkTypeCategory, WorkTypeApplicableRole
+from app.schemas.work_type import WorkTypeCategoryCreate, WorkTypeCategoryUpdate
+from app.services.work_type_service import WorkTypeCategoryService
+
+
+class TestApplicableRoles:
+    """Test the applicable_roles join table and its CSV-compatible accessor."""
+
+    def test_csv_is_split_into_role_links(self, db_session: Session):
+        """Comma-separated roles are stored as one row per role."""
+        category = WorkTypeCategory(
+            code="ENG-SW",
+            name="Software",
+            level=2,
+            applicable_roles="SW_ENGINEER, SYSTEM_ENGINEER,SW_ENGINEER",
+        )
+        db_session.add(category)
+        db_session.commit()
+
+        roles = (
+            db_session.query(WorkTypeApplicableRole.role)
+            .filter(WorkTypeApplicableRole.category_id == category.id)
+            .order_by(WorkTypeApplicableRole.role)
+            .all()
+        )
+        assert [r.role for r in roles] == ["SW_ENGINEER", "SYSTEM_ENGINEER"]
+        assert category.applicable_roles == "SW_ENGINEER,SYSTEM_ENGINEER"
+
+    def test_universal_category_has_no_roles(self, db_session: Session):
+        """Categories without roles report None (universal)."""
+        category = WorkTypeCategory(code="ADM", name="Admin", level=1)
+        db_session.add(category)
+        db_session.commit()
+
+        assert category.applicable_roles is None
+
+    def test_get_by_role_matches_exact_role(self, db_session: Session):
+        """get_by_role returns universal categories and exact role matches only."""
+        service = WorkTypeCategoryService(db_session)
+        service.create(WorkTypeCategoryCreate(code="ADM", name="Admin", level=1))
+        service.create(
+            WorkTypeCategoryCreate(
+                code="ENG-SW", name="Software", level=2, applicable_roles="SW_ENGINEER"
+            )
+        )
+        service.create(
+            WorkTypeCategoryCreate(
+                code="ENG-EE", name="Electrical", level=2, applicable_roles="EE_ENGINEER"
+            )
+        )
+
+        codes = {c.code for c in service.get_by_role("SW_ENGINEER")}
+        assert codes == {"ADM", "ENG-SW"}
+
+        # Substrings of a role no longer match
+        codes = {c.code for c in service.get_by_role("ENGINEER")}
+        assert codes == {"ADM"}
+
+    def test_update_replaces_roles(self, db_session: Session):
+        """Updating applicable_roles replaces the existing links."""
+        service = WorkTypeCategoryService(db_session)
+        category = service.create(
+            WorkTypeCategoryCreate(
+                code="ENG-SW", name="Software", level=2, applicable_roles="SW_ENGINEER"
+            )
+        )
+
+        service.update(
+            category.id, WorkTypeCategoryUpdate(applicable_roles="PM,LEAD")
+        )
+
+        assert category.applicable_roles == "LEAD,PM"
+        assert db_session.query(WorkTypeApplicableRole).count() == 2
+
+    def test_role_links_loaded_only_on_request(self, db_session: Session):
+        """A bare category query issues one statement; roles load when asked."""
+        db_session.add(
+            WorkTypeCategory(
+                code="ENG-SW", name="Software", level=2, applicable_roles="SW_ENGINEER"
+            )
+        )
+        db_session.commit()
+        db_session.expire_all()
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def count(*args):
+            statements.append(args)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            db_session.query(WorkTypeCategory).all()
+            assert len(statements) == 1
+
+            db_session.expire_all()
+            statements.clear()
+            categories = WorkTypeCategoryService(db_session).get_all()
+            assert categories[0].applicable_roles == "SW_ENGINEER"
+            assert len(statements) == 2
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
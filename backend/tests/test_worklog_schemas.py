@@ -0,0 +1,159 @@
+"""
+Tests for WorkLog response schemas built directly from ORM rows.
+"""
+
+import json
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.work_type import WorkTypeCategoryTree, WorkTypeCategoryWithChildren
+from app.schemas.worklog import (
+    DAILY_SUMMARY_ADAPTER,
+    DailySummary,
+    ProjectSummary,
+    WORKLOG_LIST_ADAPTER,
+    WORKLOG_WITH_USER_LIST_ADAPTER,
+    WorkLog,
+    WorkLogCreate,
+    WorkLogUpdate,
+    WorkLogWithUser,
+)
+
+
+def _row(**overrides):
+    now = datetime(2026, 1, 5, 9, 0)
+    values = dict(
+        id=1,
+        date=date(2026, 1, 5),
+        user_id="USER_001",
+        project_id=None,
+        product_line_id=None,
+        work_type_category_id=None,
+        hours=4.0,
+        description=None,
+        is_sudden_work=False,
+        is_business_trip=False,
+        created_at=now,
+        updated_at=now,
+        project=None,
+        product_line=None,
+        work_type_category=None,
+        user=None,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestWorkLogListAdapter:
+    """Test bulk validation of worklog rows."""
+
+    def test_project_fields_read_from_relationship(self):
+        """project_code/project_name come from the related project."""
+        project = SimpleNamespace(
+            id="PRJ_001",
+            code="P-001",
+            name="Project One",
+            program=None,
+            project_type=None,
+            product_line=None,
+            pm=None,
+        )
+        rows = [_row(project=project), _row(id=2)]
+
+        result = WORKLOG_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+
+        assert result[0].project_code == "P-001"
+        assert result[0].project_name == "Project One"
+        assert result[1].project_code is None
+
+    def test_department_name_read_through_sub_team(self):
+        """department_name follows user -> sub_team -> department."""
+        department = SimpleNamespace(name="Engineering")
+        user = SimpleNamespace(
+            name="Gerald",
+            korean_name="제럴드",
+            sub_team=SimpleNamespace(department=department),
+        )
+        no_team = SimpleNamespace(name="TBD", korean_name=None, sub_team=None)
+
+        result = WORKLOG_WITH_USER_LIST_ADAPTER.validate_python(
+            [_row(user=user), _row(id=2, user=no_team)], from_attributes=True
+        )
+
+        assert result[0].user_name == "Gerald"
+        assert result[0].department_name == "Engineering"
+        assert result[1].department_name is None
+
+    def test_datetime_date_column_is_truncated(self):
+        """Rows from DATETIME worklogs.date columns validate as plain dates."""
+        rows = [_row(date=datetime(2026, 1, 5, 13, 30))]
+
+        result = WORKLOG_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+
+        assert result[0].date == date(2026, 1, 5)
+
+
+class TestHoursConstraint:
+    """Create and update share the same hours bounds."""
+
+    @pytest.mark.parametrize("hours", [0, -1, 24.5])
+    def test_out_of_range_hours_rejected(self, hours):
+        with pytest.raises(ValidationError):
+            WorkLogCreate(date=date(2026, 1, 5), hours=hours, user_id="USER_001")
+        with pytest.raises(ValidationError):
+            WorkLogUpdate(hours=hours)
+
+    def test_update_hours_stays_optional(self):
+        assert WorkLogUpdate().hours is None
+        assert WorkLogUpdate(hours=24).hours == 24
+
+
+class TestSchemasCompleteAtImport:
+    """String annotations are resolved when the module is imported."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [WorkLog, WorkLogWithUser, WorkTypeCategoryWithChildren, WorkTypeCategoryTree],
+    )
+    def test_model_is_complete(self, model):
+        assert model.__pydantic_complete__
+
+
+class TestDailySummarySerialization:
+    """Daily summary dataclasses serialize through the adapter."""
+
+    def test_summary_json_shape(self):
+        summary = DailySummary(
+            date=date(2026, 1, 5),
+            user_id="USER_001",
+            total_hours=6.0,
+            remaining_hours=18.0,
+            projects=[
+                ProjectSummary("PRJ_A", "IO-A", "Project A", 4.0),
+                ProjectSummary(None, "N/A", "Unknown", 2.0),
+            ],
+        )
+
+        assert json.loads(DAILY_SUMMARY_ADAPTER.dump_json(summary)) == {
+            "date": "2026-01-05",
+            "user_id": "USER_001",
+            "total_hours": 6.0,
+            "remaining_hours": 18.0,
+            "projects": [
+                {
+                    "project_id": "PRJ_A",
+                    "project_code": "IO-A",
+                    "project_name": "Project A",
+                    "hours": 4.0,
+                },
+                {
+                    "project_id": None,
+                    "project_code": "N/A",
+                    "project_name": "Unknown",
+                    "hours": 2.0,
+                },
+            ],
+        }
@@ -0,0 +1,125 @@
+"""
+Tests for WorkLogService list queries and their eager-loading contract.
+"""
+
+import json
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.api.endpoints.worklogs import list_worklogs
+from app.models.organization import BusinessUnit
+from app.models.project import Program, ProjectType, Project
+from app.models.resource import WorkLog
+from app.models.user import User
+from app.models.work_type import WorkTypeCategory
+from app.schemas.worklog import WORKLOG_LIST_ADAPTER, WORKLOG_WITH_USER_LIST_ADAPTER
+from app.services.worklog_service import WorkLogService
+
+
+@pytest.fixture
+def worklog_data(db_session: Session, sample_sub_team, sample_department, sample_position):
+    """One user logging time on one project."""
+    db_session.add_all(
+        [
+            BusinessUnit(id="BU_TEST", name="Test BU", code="BU"),
+            Program(id="PRG_TEST", name="Test Program", business_unit_id="BU_TEST"),
+            ProjectType(id="NPI", name="NPI"),
+            WorkTypeCategory(id=1, code="DEV", name="Development", level=1),
+            User(
+                id="USER_WL",
+                email="worklog@example.com",
+                hashed_password="hashed_password",
+                name="Worklog User",
+                department_id=sample_department.id,
+                sub_team_id=sample_sub_team.id,
+                position_id=sample_position.id,
+            ),
+            Project(
+                id="PRJ_A",
+                program_id="PRG_TEST",
+                project_type_id="NPI",
+                code="IO-A",
+                name="Project A",
+            ),
+        ]
+    )
+    db_session.add_all(
+        [
+            WorkLog(
+                date=date(2026, 1, day),
+                user_id="USER_WL",
+                project_id="PRJ_A",
+                work_type_category_id=1,
+                hours=4.0,
+            )
+            for day in (5, 6)
+        ]
+    )
+    db_session.commit()
+    db_session.expire_all()
+
+
+class TestWorkLogListLoading:
+    """List queries load exactly what the response schemas read."""
+
+    def test_get_multi_serializes_with_required_loads(
+        self, db_session: Session, worklog_data
+    ):
+        """Schema fields validate from eagerly loaded relationships."""
+        worklogs = WorkLogService(db_session).get_multi(user_id="USER_WL")
+
+        result = WORKLOG_LIST_ADAPTER.validate_python(worklogs, from_attributes=True)
+
+        assert [wl.project_code for wl in result] == ["IO-A", "IO-A"]
+        assert result[0].project.program.business_unit.code == "BU"
+        assert result[0].work_type_category.code == "DEV"
+
+    def test_get_multi_raises_on_unlisted_relationship(
+        self, db_session: Session, worklog_data
+    ):
+        """Relationships outside REQUIRED_LOADS raise instead of lazy loading."""
+        worklogs = WorkLogService(db_session).get_multi(user_id="USER_WL")
+
+        with pytest.raises(InvalidRequestError):
+            _ = worklogs[0].user
+
+    def test_get_multi_with_user_loads_department(
+        self, db_session: Session, worklog_data, sample_department
+    ):
+        """Table rows carry user and department names."""
+        worklogs = WorkLogService(db_session).get_multi_with_user(user_id="USER_WL")
+
+        result = WORKLOG_WITH_USER_LIST_ADAPTER.validate_python(
+            worklogs, from_attributes=True
+        )
+
+        assert result[0].user_name == "Worklog User"
+        assert result[0].department_name == sample_department.name
+
+
+
+class TestWorkLogListEndpoint:
+    """List endpoint serializes the validated rows to JSON."""
+
+    @pytest.mark.asyncio
+    async def test_list_worklogs_json(self, db_session: Session, worklog_data):
+        """Response body matches the WorkLog schema field names."""
+        response = await list_worklogs(
+            user_id="USER_WL",
+            project_id=None,
+            start_date=None,
+            end_date=None,
+            work_type_category_id=None,
+            skip=0,
+            limit=100,
+            db=db_session,
+        )
+
+        assert response.media_type == "application/json"
+        body = json.loads(response.body)
+        assert [row["date"] for row in body] == ["2026-01-06", "2026-01-05"]
+        assert body[0]["project_code"] == "IO-A"
+        assert body[0]["work_type_category"]["code"] == "DEV"
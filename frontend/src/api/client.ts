@@ -782,25 +782,20 @@ export interface ResourceAllocationDetail {
   fte: number;
 }
 
-export interface MonthlyAllocation {
-  month: string;
-  total_fte: number;
-  details: ResourceAllocationDetail[];
-}
-
 export interface ProjectAllocationRow {
   project_id: string;
   project_code: string;
   project_name: string;
   category: string;
-  allocations: Record<string, MonthlyAllocation>;
+  total_fte: number[]; // aligned with ResourceAllocationMatrix.months
+  details: ResourceAllocationDetail[][]; // aligned with ResourceAllocationMatrix.months
 }
 
 export interface ProgramGroup {
   program_id: string;
   program_name: string;
   projects: ProjectAllocationRow[];
-  total_by_month: Record<string, number>;
+  total_by_month: number[];
 }
 
 export interface ResourceAllocationMatrix {
@@ -808,7 +803,7 @@ export interface ResourceAllocationMatrix {
   end_month: string;
   months: string[];
   programs: ProgramGroup[];
-  grand_total_by_month: Record<string, number>;
+  grand_total_by_month: number[];
 }
 
 export const getResourceAllocationMatrix = async (
@@ -103,16 +103,16 @@ export const ResourceAllocationGrid: React.FC<ResourceAllocationGridProps> = ({
                                             <span className="text-slate-800">{program.program_name}</span>
                                         </div>
                                     </td>
-                                    {data.months.map((month) => (
+                                    {data.months.map((month, i) => (
                                         <td
                                             key={month}
                                             className="border border-slate-300 p-2 text-right font-semibold"
                                         >
-                                            {program.total_by_month[month]?.toFixed(1) || '0.0'}
+                                            {program.total_by_month[i]?.toFixed(1) || '0.0'}
                                         </td>
                                     ))}
                                     <td className="border border-slate-300 p-2 text-right bg-blue-50 font-semibold">
-                                        {Object.values(program.total_by_month)
+                                        {program.total_by_month
                                             .reduce((a, b) => a + b, 0)
                                             .toFixed(1)}
                                     </td>
@@ -137,9 +137,10 @@ export const ResourceAllocationGrid: React.FC<ResourceAllocationGridProps> = ({
                                                 </div>
                                             </div>
                                         </td>
-                                        {data.months.map((month) => {
-                                            const allocation = project.allocations[month];
-                                            const hasPeople = allocation && allocation.total_fte > 0;
+                                        {data.months.map((month, i) => {
+                                            const totalFte = project.total_fte[i] ?? 0;
+                                            const details = project.details[i] ?? [];
+                                            const hasPeople = totalFte > 0;
 
                                             return (
                                                 <td
@@ -154,7 +155,7 @@ export const ResourceAllocationGrid: React.FC<ResourceAllocationGridProps> = ({
                                                             setSelectedCell({
                                                                 project: project.project_name,
                                                                 month,
-                                                                details: allocation.details,
+                                                                details,
                                                             });
                                                         }
                                                     }}
@@ -162,11 +163,11 @@ export const ResourceAllocationGrid: React.FC<ResourceAllocationGridProps> = ({
                                                     {hasPeople ? (
                                                         <div className="space-y-0.5">
                                                             <div className="font-semibold text-blue-700">
-                                                                {allocation.total_fte.toFixed(1)}
+                                                                {totalFte.toFixed(1)}
                                                             </div>
                                                             <div className="text-xs text-slate-500">
-                                                                ({allocation.details.length}{' '}
-                                                                {allocation.details.length === 1
+                                                                ({details.length}{' '}
+                                                                {details.length === 1
                                                                     ? 'person'
                                                                     : 'people'}
                                                                 )
@@ -179,8 +180,8 @@ export const ResourceAllocationGrid: React.FC<ResourceAllocationGridProps> = ({
                                             );
                                         })}
                                         <td className="border border-slate-300 p-2 text-right bg-slate-50 font-medium">
-                                            {Object.values(project.allocations)
-                                                .reduce((sum, a) => sum + a.total_fte, 0)
+                                            {project.total_fte
+                                                .reduce((a, b) => a + b, 0)
                                                 .toFixed(1)}
                                         </td>
                                     </tr>
@@ -193,16 +194,16 @@ export const ResourceAllocationGrid: React.FC<ResourceAllocationGridProps> = ({
                             <td className="sticky left-0 bg-blue-200 border border-slate-300 p-3 z-20 text-blue-900">
                                 GRAND TOTAL
                             </td>
-                            {data.months.map((month) => (
+                            {data.months.map((month, i) => (
                                 <td
                                     key={month}
                                     className="border border-slate-300 p-2 text-right text-blue-900"
                                 >
-                                    {data.grand_total_by_month[month]?.toFixed(1) || '0.0'}
+                                    {data.grand_total_by_month[i]?.toFixed(1) || '0.0'}
                                 </td>
                             ))}
                             <td className="border border-slate-300 p-2 text-right bg-blue-200 text-blue-900">
-                                {Object.values(data.grand_total_by_month)
+                                {data.grand_total_by_month
                                     .reduce((a, b) => a + b, 0)
                                     .toFixed(1)}
                             </td>